@@ -4,17 +4,48 @@ import json
 import math
 from io import StringIO
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import numpy as np
 from PIL import Image
 from scipy.interpolate import RegularGridInterpolator
 
-from agent.celeris.okada import okada_available, okada_finite_fault_surface, okada_rectangular_surface
+from agent.celeris.grid_files import binary_grid_format, binary_grid_paths, write_grid_float32, write_grid_text
+from agent.celeris.okada import okada_finite_fault_surface, okada_rectangular_surface
 from agent.dem.export import artifact
+from agent.dem.gridding import points_to_grid
+from agent.disk_cache import (
+    cache_key,
+    cache_max_bytes,
+    cache_stats,
+    commit_entry,
+    discard_staging,
+    lookup_entry,
+    new_staging_dir,
+    read_entry,
+    sha256_array,
+    sha256_file,
+)
 from agent.io_utils import write_json
 
 
+INITIAL_CONDITION_CACHE = "earthquake_ic"
+INITIAL_CONDITION_CACHE_SCHEMA = 2
+DEFAULT_INITIAL_CONDITION_CACHE_MAX_BYTES = 2 * 1024**3
+SINGLE_RECTANGLE_CACHE_PARAMETERS = (
+    "center_x_m",
+    "center_y_m",
+    "depth_km",
+    "strike_deg",
+    "dip_deg",
+    "rake_deg",
+    "length_km",
+    "width_km",
+    "slip_m",
+    "poisson_ratio",
+)
+
+
 def generate_earthquake_initial_condition(
     job_dir: Path,
     model: dict[str, Any],
@@ -38,7 +69,7 @@ def generate_earthquake_initial_condition(
             )
         else:
             model_name = source_summary.get("source_model") or "usgs_finite_fault"
-            if model_name == "okada_wrapper_finite_fault":
+            if model_name == "okada_dc3d_finite_fault":
                 model_note = (
                     "Fallback finite-fault source: USGS FFM.geojson subfaults were evaluated with Okada DC3D on a finite-fault-resolution "
                     "source grid and interpolated to the final CELERIS model grid."
@@ -48,9 +79,11 @@ def generate_earthquake_initial_condition(
     else:
         checks = [*parameter_checks]
         try:
-            eta, okada_summary = okada_single_rectangle_initial_surface(model, params)
-            source_summary = {"source_model": "okada_wrapper_single_rectangle", "okada": okada_summary}
-            selected_path.append("compute_okada_dc3d_single_rectangle")
+            eta, okada_summary, cache_info = okada_single_rectangle_initial_surface(model, params)
+            source_summary = {"source_model": "okada_dc3d_single_rectangle", "okada": okada_summary, "cache": cache_info}
+            selected_path.append(
+                "load_cached_okada_dc3d_single_rectangle" if cache_info["status"] == "hit" else "compute_okada_dc3d_single_rectangle"
+            )
             checks.append(
                 {
                     "level": "info",
@@ -59,7 +92,7 @@ def generate_earthquake_initial_condition(
                     "details": okada_summary,
                 }
             )
-            model_name = "okada_wrapper_single_rectangle"
+            model_name = "okada_dc3d_single_rectangle"
             model_note = "Single-rectangle earthquake source evaluated with Okada DC3D."
         except Exception as exc:
             selected_path.append("okada_dc3d_single_rectangle_unavailable")
@@ -68,7 +101,7 @@ def generate_earthquake_initial_condition(
                     "level": "error",
                     "code": "OKADA_SINGLE_RECTANGLE_UNAVAILABLE",
                     "message": "Okada DC3D single-rectangle source could not be used; no synthetic fallback initial condition is available.",
-                    "details": {"error": str(exc), "okada_available": okada_available()},
+                    "details": {"error": str(exc)},
                 }
             )
             return {
@@ -91,8 +124,18 @@ def generate_earthquake_initial_condition(
     out_dir = job_dir / "outputs"
     out_dir.mkdir(parents=True, exist_ok=True)
     eta_path = out_dir / "etaInitCond.txt"
-    np.savetxt(eta_path, eta, fmt="%.8e")
+    write_grid_text(eta_path, eta, "%.8e")
     selected_path.append("write_eta_initial_condition_txt")
+    binary_header = None
+    binary_artifacts: list[dict[str, Any]] = []
+    if binary_grid_format() == "float32":
+        binary_header = write_grid_float32(eta_path, eta)
+        eta_f32_path, eta_header_path = binary_grid_paths(eta_path)
+        binary_artifacts = [
+            artifact(job_dir, eta_f32_path, "celeris_eta_initial_condition_f32", "CELERIS initial free surface as raw little-endian float32"),
+            artifact(job_dir, eta_header_path, "celeris_eta_initial_condition_f32_header", "CELERIS etaInitCond.f32 header"),
+        ]
+        selected_path.append("write_eta_initial_condition_f32")
 
     preview_path = out_dir / "earthquake_ic_preview.png"
     write_preview(eta, preview_path)
@@ -106,6 +149,8 @@ def generate_earthquake_initial_condition(
         "parameters": params,
         "source_summary": source_summary,
         "summary": eta_summary(eta),
+        "cache": source_summary.get("cache"),
+        "binary": binary_header,
         "format": {
             "rows": int(eta.shape[0]),
             "columns": int(eta.shape[1]),
@@ -135,6 +180,7 @@ def generate_earthquake_initial_condition(
         "selected_path": selected_path,
         "artifacts": [
             artifact(job_dir, eta_path, "celeris_eta_initial_condition", "CELERIS initial free-surface file"),
+            *binary_artifacts,
             artifact(job_dir, preview_path, "earthquake_ic_preview_png", "Earthquake initial condition preview"),
             artifact(job_dir, manifest_path, "earthquake_ic_manifest", "Earthquake initial condition manifest"),
         ],
@@ -226,11 +272,71 @@ def lon_lat_to_model_xy(lon: float, lat: float, model: dict[str, Any], domain_ge
     }
 
 
-def okada_single_rectangle_initial_surface(model: dict[str, Any], params: dict[str, Any]) -> tuple[np.ndarray, dict[str, Any]]:
-    x = np.asarray(model["x"], dtype=np.float64)
-    y = np.asarray(model["y"], dtype=np.float64)
-    xx, yy = np.meshgrid(x, y, indexing="xy")
-    return okada_rectangular_surface(xx, yy, params)
+def okada_single_rectangle_initial_surface(model: dict[str, Any], params: dict[str, Any]) -> tuple[np.ndarray, dict[str, Any], dict[str, Any]]:
+    key_parts = {
+        "source": "single_rectangle",
+        "parameters": {key: params.get(key) for key in SINGLE_RECTANGLE_CACHE_PARAMETERS},
+        "target_grid": model_grid_fingerprint(model, {}),
+    }
+
+    def compute() -> tuple[np.ndarray, dict[str, Any], bool]:
+        x = np.asarray(model["x"], dtype=np.float64)
+        y = np.asarray(model["y"], dtype=np.float64)
+        xx, yy = np.meshgrid(x, y, indexing="xy")
+        eta, okada_summary = okada_rectangular_surface(xx, yy, params)
+        return eta, {"okada": okada_summary}, True
+
+    eta, payload, cache_info = cached_initial_surface(key_parts, compute)
+    return eta, payload["okada"], cache_info
+
+
+def cached_initial_surface(
+    key_parts: dict[str, Any],
+    compute: Callable[[], tuple[np.ndarray, dict[str, Any], bool]],
+) -> tuple[np.ndarray, dict[str, Any], dict[str, Any]]:
+    """Return a source surface from the shared initial-condition cache, computing and storing it on a miss.
+
+    `compute` returns the eta grid, a JSON-serializable payload and whether the result may be cached.
+    Cache entries live under `workspace/cache/earthquake_ic` and are evicted least-recently-used first.
+    """
+    key = cache_key({"schema": INITIAL_CONDITION_CACHE_SCHEMA, **key_parts})
+    entry = lookup_entry(INITIAL_CONDITION_CACHE, key)
+    if entry is not None:
+        try:
+            payload = read_entry(entry)["payload"]
+            eta = np.load(entry / "eta.npy")
+            return eta, payload, {"status": "hit", "key": key, "stats": cache_stats(INITIAL_CONDITION_CACHE)}
+        except Exception:
+            pass
+    eta, payload, cacheable = compute()
+    status = "miss"
+    if cacheable and np.isfinite(eta).all():
+        staging = new_staging_dir(INITIAL_CONDITION_CACHE)
+        try:
+            np.save(staging / "eta.npy", np.asarray(eta, dtype=np.float64))
+            commit_entry(
+                INITIAL_CONDITION_CACHE,
+                key,
+                staging,
+                {"payload": payload, "key_parts": key_parts},
+                cache_max_bytes("CELERIS_IC_CACHE_MAX_BYTES", DEFAULT_INITIAL_CONDITION_CACHE_MAX_BYTES),
+            )
+            status = "stored"
+        except Exception:
+            discard_staging(staging)
+    return eta, payload, {"status": status, "key": key, "stats": cache_stats(INITIAL_CONDITION_CACHE)}
+
+
+def model_grid_fingerprint(model: dict[str, Any], domain_georeferencing: dict[str, Any]) -> dict[str, Any]:
+    bbox = domain_georeferencing.get("bbox_wgs84") if domain_georeferencing.get("status") == "ok" else None
+    return {
+        "shape": list(np.asarray(model["z"]).shape),
+        "x_sha256": sha256_array(model.get("x")),
+        "y_sha256": sha256_array(model.get("y")),
+        "lon_sha256": sha256_array(model.get("lon")),
+        "lat_sha256": sha256_array(model.get("lat")),
+        "bbox_wgs84": bbox,
+    }
 
 
 def finite_fault_initial_surface(
@@ -258,13 +364,80 @@ def finite_fault_initial_surface(
     data = json.loads(cache_path.read_text(encoding="utf-8"))
     features = data.get("features") or []
     surface_url = finite_fault.get("surface_deformation_url") or infer_surface_deformation_url(url)
+    # The surface grid is downloaded before keying so the cache tracks its content rather than its URL.
+    surface_path: Path | None = None
+    surface_download_error: Exception | None = None
+    if surface_url:
+        try:
+            surface_path = download_surface_deformation(job_dir, surface_url)
+        except Exception as exc:
+            surface_download_error = exc
+    source_model = finite_fault_source_grid(model, domain_georeferencing, finite_fault)
+    poisson_ratio = float(base_params.get("poisson_ratio") or 0.25)
+    key_parts = {
+        "source": "usgs_finite_fault",
+        "ffm_sha256": sha256_file(cache_path),
+        "surface_deformation_sha256": sha256_file(surface_path) if surface_path else ("unavailable" if surface_url else None),
+        "source_grid": {
+            **finite_fault_source_grid_summary(source_model),
+            "lon_sha256": sha256_array(source_model.get("lon")),
+            "lat_sha256": sha256_array(source_model.get("lat")),
+        },
+        "poisson_ratio": poisson_ratio,
+        "target_grid": model_grid_fingerprint(model, domain_georeferencing),
+    }
+
+    def compute() -> tuple[np.ndarray, dict[str, Any], bool]:
+        eta, summary, checks, path = finite_fault_source_surface(
+            job_dir,
+            model,
+            domain_georeferencing,
+            finite_fault,
+            url,
+            cache_path,
+            features,
+            surface_url,
+            surface_path,
+            surface_download_error,
+            source_model,
+            poisson_ratio,
+        )
+        cacheable = bool(summary) and not any(check["level"] in {"warning", "error"} for check in checks)
+        return eta, {"source_summary": summary, "checks": checks, "selected_path": path}, cacheable
+
+    eta, payload, cache_info = cached_initial_surface(key_parts, compute)
+    source_summary = {**payload["source_summary"], "cache": cache_info} if payload["source_summary"] else {}
+    if cache_info["status"] == "hit":
+        checks = [rebase_check_cache_path(check, job_dir) for check in payload["checks"]]
+        return eta, source_summary, checks, [*selected_path, "load_cached_finite_fault_initial_condition"]
+    return eta, source_summary, payload["checks"], [*selected_path, *payload["selected_path"]]
+
+
+def finite_fault_source_surface(
+    job_dir: Path,
+    model: dict[str, Any],
+    domain_georeferencing: dict[str, Any],
+    finite_fault: dict[str, Any],
+    url: str,
+    cache_path: Path,
+    features: list[dict[str, Any]],
+    surface_url: str | None,
+    surface_path: Path | None,
+    surface_download_error: Exception | None,
+    source_model: dict[str, Any],
+    poisson_ratio: float,
+) -> tuple[np.ndarray, dict[str, Any], list[dict[str, Any]], list[str]]:
+    selected_path: list[str] = []
     if surface_url:
         try:
+            if surface_path is None:
+                raise surface_download_error or RuntimeError("surface_deformation.disp was not downloaded.")
             eta, source_summary, source_checks, source_path = finite_fault_surface_deformation_initial_surface(
                 job_dir,
                 model,
                 domain_georeferencing,
                 surface_url,
+                surface_path,
                 url,
                 finite_fault,
             )
@@ -280,25 +453,13 @@ def finite_fault_initial_surface(
     else:
         surface_deformation_error = None
 
-    source_model = finite_fault_source_grid(model, domain_georeferencing, finite_fault)
-    if not okada_available():
-        selected_path.append("okada_dc3d_finite_fault_unavailable")
-        checks = [surface_deformation_error] if surface_deformation_error else []
-        checks.append(
-            finite_fault_error(
-                "OKADA_FINITE_FAULT_UNAVAILABLE",
-                "USGS surface_deformation.disp could not be used and okada-wrapper is not installed; no synthetic finite-fault fallback initial condition is available.",
-            )
-        )
-        return np.zeros_like(np.asarray(model["z"], dtype=np.float64)), {}, checks, selected_path
-
     try:
         source_lon, source_lat = model_lon_lat_mesh(source_model, domain_georeferencing)
         eta_source, okada_summary = okada_finite_fault_surface(
             features,
             source_lon,
             source_lat,
-            poisson_ratio=float(base_params.get("poisson_ratio") or 0.25),
+            poisson_ratio=poisson_ratio,
         )
         eta = interpolate_eta_to_model_grid(eta_source, source_model, model)
         checks = [surface_deformation_error] if surface_deformation_error else []
@@ -318,7 +479,7 @@ def finite_fault_initial_surface(
             }
         )
         summary = {
-            "source_model": "okada_wrapper_finite_fault",
+            "source_model": "okada_dc3d_finite_fault",
             "source_url": url,
             "cache_path": str(cache_path.relative_to(job_dir)),
             "event_id": finite_fault.get("event_id"),
@@ -349,19 +510,11 @@ def finite_fault_surface_deformation_initial_surface(
     model: dict[str, Any],
     domain_georeferencing: dict[str, Any],
     surface_url: str,
+    cache_path: Path,
     ffm_url: str,
     finite_fault: dict[str, Any],
 ) -> tuple[np.ndarray, dict[str, Any], list[dict[str, Any]], list[str]]:
     selected_path = ["download_usgs_surface_deformation", "interpolate_usgs_surface_deformation_to_model_grid"]
-    cache_dir = job_dir / "work" / "usgs_finite_fault"
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    cache_path = cache_dir / "surface_deformation.disp"
-    if not cache_path.exists():
-        import requests
-
-        response = requests.get(surface_url, timeout=60)
-        response.raise_for_status()
-        cache_path.write_bytes(response.content)
     source = load_surface_deformation_grid(cache_path)
     eta = interpolate_surface_deformation_to_model(source, model, domain_georeferencing)
     source_summary = {
@@ -397,6 +550,28 @@ def finite_fault_surface_deformation_initial_surface(
     return eta, source_summary, checks, selected_path
 
 
+def download_surface_deformation(job_dir: Path, surface_url: str) -> Path:
+    cache_dir = job_dir / "work" / "usgs_finite_fault"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_path = cache_dir / "surface_deformation.disp"
+    if not cache_path.exists():
+        import requests
+
+        response = requests.get(surface_url, timeout=60)
+        response.raise_for_status()
+        cache_path.write_bytes(response.content)
+    return cache_path
+
+
+def rebase_check_cache_path(check: dict[str, Any], job_dir: Path) -> dict[str, Any]:
+    """Point a cached check's absolute `cache_path` at the same download inside the current job."""
+    details = check.get("details")
+    if not isinstance(details, dict) or not details.get("cache_path"):
+        return check
+    cache_path = job_dir / "work" / "usgs_finite_fault" / Path(details["cache_path"]).name
+    return {**check, "details": {**details, "cache_path": str(cache_path)}}
+
+
 def infer_surface_deformation_url(ffm_url: str | None) -> str | None:
     if not ffm_url or not ffm_url.endswith("/FFM.geojson"):
         return None
@@ -408,15 +583,7 @@ def load_surface_deformation_grid(path: Path) -> dict[str, Any]:
     data = np.loadtxt(StringIO("\n".join(lines)))
     if data.ndim != 2 or data.shape[1] < 6:
         raise ValueError("surface_deformation.disp did not contain at least six numeric columns.")
-    lon = np.unique(data[:, 0])
-    lat = np.unique(data[:, 1])
-    lon.sort()
-    lat.sort()
-    vertical = np.full((lat.size, lon.size), np.nan, dtype=np.float64)
-    lon_index = {float(value): index for index, value in enumerate(lon)}
-    lat_index = {float(value): index for index, value in enumerate(lat)}
-    for row in data:
-        vertical[lat_index[float(row[1])], lon_index[float(row[0])]] = float(row[5])
+    lon, lat, vertical = points_to_grid(data[:, 0], data[:, 1], data[:, 5])
     if not np.isfinite(vertical).any():
         raise ValueError("surface_deformation.disp vertical displacement column contained no finite values.")
     if not np.isfinite(vertical).all():
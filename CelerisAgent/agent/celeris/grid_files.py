@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from agent.io_utils import write_json
+
+
+TEXT_BLOCK_ROWS = 256
+TEXT_PROGRESS_STEPS = 20
+BINARY_GRID_SUFFIX = ".f32"
+BINARY_HEADER_SUFFIX = ".f32.json"
+BINARY_GRID_FORMATS = ("float32", "none")
+
+
+def binary_grid_format() -> str:
+    value = (os.environ.get("CELERIS_CASE_BINARY_FORMAT") or "float32").strip().lower()
+    return value if value in BINARY_GRID_FORMATS else "float32"
+
+
+def binary_grid_paths(text_path: Path) -> tuple[Path, Path]:
+    return text_path.with_suffix(BINARY_GRID_SUFFIX), text_path.with_suffix(BINARY_HEADER_SUFFIX)
+
+
+def write_grid_text(
+    path: Path,
+    values: np.ndarray,
+    fmt: str,
+    block_rows: int = TEXT_BLOCK_ROWS,
+    progress: Callable[[int, int], None] | None = None,
+) -> None:
+    """Write a 2D grid as space-delimited rows, byte-identical to `np.savetxt(path, values, fmt=fmt)`.
+
+    Rows are formatted and written a block at a time, so only one block of text is held in memory.
+    `progress(rows_written, rows)` is called about `TEXT_PROGRESS_STEPS` times and once at the end.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim != 2:
+        raise ValueError("Grid text output requires a 2D array.")
+    rows = values.shape[0]
+    row_format = " ".join([fmt] * values.shape[1]) + "\n"
+    report_every = max(1, -(-rows // TEXT_PROGRESS_STEPS))
+    next_report = report_every
+    with path.open("w", encoding="ascii", newline="\n") as fh:
+        for start in range(0, rows, block_rows):
+            block = values[start : start + block_rows]
+            fh.write((row_format * block.shape[0]) % tuple(block.ravel().tolist()))
+            rows_written = start + block.shape[0]
+            if progress is not None and (rows_written >= next_report or rows_written == rows):
+                progress(rows_written, rows)
+                next_report = (rows_written // report_every + 1) * report_every
+
+
+def write_grid_float32(text_path: Path, values: np.ndarray) -> dict[str, Any]:
+    """Write the binary companion of a CELERIS grid text file.
+
+    The `.f32` file holds raw little-endian float32 values in the same row order as the text file,
+    and the `.f32.json` header records the shape so readers do not depend on config.json.
+    """
+    values = np.asarray(values)
+    if values.ndim != 2:
+        raise ValueError("Binary grid output requires a 2D array.")
+    data_path, header_path = binary_grid_paths(text_path)
+    np.ascontiguousarray(values, dtype="<f4").tofile(data_path)
+    header = {
+        "format": "float32_le_raw",
+        "data_file": data_path.name,
+        "text_equivalent": text_path.name,
+        "rows": int(values.shape[0]),
+        "columns": int(values.shape[1]),
+        "row_order": f"same as {text_path.name}",
+        "byte_order": "little",
+        "bytes": int(data_path.stat().st_size),
+    }
+    write_json(header_path, header)
+    return header
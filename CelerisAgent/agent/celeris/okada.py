@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 import math
+import os
+import time
 from typing import Any
 
 import numpy as np
 
+DC3D_EPS = 1.0e-6
+OKADA_ENGINES = ("numpy", "okada_wrapper")
+OKADA_POINT_CHUNK_SIZE = 262_144
+DEFAULT_MAX_OKADA_WORKERS = 8
+PARALLEL_MIN_SUBFAULT_POINTS = 5_000_000
+
 
 def okada_available() -> bool:
     try:
@@ -20,63 +28,147 @@ def okada_finite_fault_surface(
     target_lon: np.ndarray,
     target_lat: np.ndarray,
     poisson_ratio: float = 0.25,
+    engine: str = "numpy",
+    workers: int | None = None,
 ) -> tuple[np.ndarray, dict[str, Any]]:
-    from okada_wrapper import dc3dwrapper
-
     target_lon = np.asarray(target_lon, dtype=np.float64)
     target_lat = np.asarray(target_lat, dtype=np.float64)
     if target_lon.shape != target_lat.shape:
         raise ValueError("target_lon and target_lat must have the same shape.")
+    okada_model_name(engine)
     lon0 = float(np.nanmean(target_lon))
     lat0 = float(np.nanmean(target_lat))
     x_obs, y_obs = lon_lat_to_local_meters(target_lon, target_lat, lon0, lat0)
-    obs = np.column_stack([x_obs.ravel(), y_obs.ravel()])
-    eta = np.zeros(obs.shape[0], dtype=np.float64)
+    x_obs = np.ascontiguousarray(x_obs.ravel())
+    y_obs = np.ascontiguousarray(y_obs.ravel())
     alpha = okada_alpha(poisson_ratio)
-    used = 0
+    subfaults: list[dict[str, Any]] = []
     skipped = 0
-    slips: list[float] = []
     for feature in features:
         parsed = parse_okada_subfault(feature, lon0, lat0)
         if parsed is None:
             skipped += 1
             continue
+        subfaults.append(parsed)
+    slips = [parsed["slip_m"] for parsed in subfaults]
+
+    started = time.perf_counter()
+    worker_count = okada_worker_count(workers, len(subfaults), x_obs.size)
+    parallel: dict[str, Any] = {"mode": "serial", "workers": 1, "point_chunk_size": OKADA_POINT_CHUNK_SIZE}
+    eta = None
+    if worker_count > 1:
+        try:
+            eta, worker_timings = okada_subfaults_process_pool(subfaults, x_obs, y_obs, alpha, engine, worker_count)
+            parallel = {"mode": "process_pool", "workers": worker_count, "point_chunk_size": OKADA_POINT_CHUNK_SIZE}
+        except Exception as exc:
+            parallel["process_pool_error"] = str(exc)
+    if eta is None:
+        eta, timing = okada_subfault_batch(subfaults, x_obs, y_obs, alpha, engine)
+        worker_timings = [{"worker": 0, **timing}]
+    parallel["worker_timings"] = worker_timings
+    parallel["wall_time_s"] = time.perf_counter() - started
+    eta = eta.reshape(target_lon.shape)
+    return eta, {
+        "model": okada_model_name(engine),
+        "engine": engine,
+        "used_subfault_count": len(subfaults),
+        "skipped_subfault_count": skipped,
+        "poisson_ratio": float(poisson_ratio),
+        "alpha": alpha,
+        "slip_min_m": min(slips) if slips else None,
+        "slip_max_m": max(slips) if slips else None,
+        "slip_mean_m": float(np.mean(slips)) if slips else None,
+        "parallel": parallel,
+        "geometry_convention": (
+            "subfault-centered Okada DC3D rectangles; x along top-edge strike, y opposite top-to-bottom "
+            "horizontal polygon direction, positive dip-slip from FFM rake"
+        ),
+    }
+
+
+def okada_worker_count(requested: int | None, subfault_count: int, point_count: int) -> int:
+    if requested is None:
+        raw = os.environ.get("CELERIS_OKADA_WORKERS")
+        try:
+            requested = int(raw) if raw else min(os.cpu_count() or 1, DEFAULT_MAX_OKADA_WORKERS)
+        except ValueError:
+            requested = 1
+        if subfault_count * point_count < PARALLEL_MIN_SUBFAULT_POINTS:
+            return 1
+    return max(1, min(int(requested), subfault_count))
+
+
+def okada_subfaults_process_pool(
+    subfaults: list[dict[str, Any]],
+    x_obs: np.ndarray,
+    y_obs: np.ndarray,
+    alpha: float,
+    engine: str,
+    worker_count: int,
+) -> tuple[np.ndarray, list[dict[str, Any]]]:
+    """Sum subfault batches from a process pool into one displacement field.
+
+    Subfaults are dealt round-robin so deep and shallow rows are spread across workers.
+    Each worker returns one point-count partial field, which is added to the total as soon
+    as it completes, so peak memory is bounded by the worker count, not the subfault count.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    batches = [subfaults[index::worker_count] for index in range(worker_count)]
+    eta = np.zeros(x_obs.size, dtype=np.float64)
+    worker_timings: list[dict[str, Any]] = []
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
+        futures = {
+            executor.submit(okada_subfault_batch, batch, x_obs, y_obs, alpha, engine): index
+            for index, batch in enumerate(batches)
+            if batch
+        }
+        for future in as_completed(futures):
+            partial, timing = future.result()
+            eta += partial
+            worker_timings.append({"worker": futures[future], **timing})
+    worker_timings.sort(key=lambda item: item["worker"])
+    return eta, worker_timings
+
+
+def okada_subfault_batch(
+    subfaults: list[dict[str, Any]],
+    x_obs: np.ndarray,
+    y_obs: np.ndarray,
+    alpha: float,
+    engine: str,
+) -> tuple[np.ndarray, dict[str, Any]]:
+    started = time.perf_counter()
+    eta = np.zeros(x_obs.size, dtype=np.float64)
+    for parsed in subfaults:
         slip = parsed["slip_m"]
         rake = math.radians(parsed["rake_deg"])
         dislocation = np.asarray([slip * math.cos(rake), slip * math.sin(rake), 0.0], dtype=np.float64)
         strike_width = np.asarray([-0.5 * parsed["length_m"], 0.5 * parsed["length_m"]], dtype=np.float64)
         dip_width = np.asarray([-0.5 * parsed["width_m"], 0.5 * parsed["width_m"]], dtype=np.float64)
-        rel = obs - parsed["origin_xy_m"]
-        x_local = rel @ parsed["strike_unit"]
-        y_local = rel @ parsed["okada_y_unit"]
-        for index, (x_value, y_value) in enumerate(zip(x_local, y_local)):
-            success, displacement, _grad = dc3dwrapper(
+        for start in range(0, x_obs.size, OKADA_POINT_CHUNK_SIZE):
+            stop = min(start + OKADA_POINT_CHUNK_SIZE, x_obs.size)
+            rel_x = x_obs[start:stop] - parsed["origin_xy_m"][0]
+            rel_y = y_obs[start:stop] - parsed["origin_xy_m"][1]
+            x_local = rel_x * parsed["strike_unit"][0] + rel_y * parsed["strike_unit"][1]
+            y_local = rel_x * parsed["okada_y_unit"][0] + rel_y * parsed["okada_y_unit"][1]
+            uz, success = dc3d_surface_uz(
                 alpha,
-                np.asarray([x_value, y_value, 0.0], dtype=np.float64),
+                x_local,
+                y_local,
                 parsed["origin_depth_m"],
                 parsed["dip_deg"],
                 strike_width,
                 dip_width,
                 dislocation,
+                engine=engine,
             )
-            if success == 0:
-                eta[index] += displacement[2]
-        used += 1
-        slips.append(slip)
-    eta = eta.reshape(target_lon.shape)
+            eta[start:stop] += np.where(success, uz, 0.0)
     return eta, {
-        "model": "okada_wrapper_dc3d",
-        "used_subfault_count": used,
-        "skipped_subfault_count": skipped,
-        "poisson_ratio": float(poisson_ratio),
-        "alpha": alpha,
-        "slip_min_m": min(slips) if slips else None,
-        "slip_max_m": max(slips) if slips else None,
-        "slip_mean_m": float(np.mean(slips)) if slips else None,
-        "geometry_convention": (
-            "subfault-centered Okada DC3D rectangles; x along top-edge strike, y opposite top-to-bottom "
-            "horizontal polygon direction, positive dip-slip from FFM rake"
-        ),
+        "pid": os.getpid(),
+        "subfault_count": len(subfaults),
+        "point_count": int(x_obs.size),
+        "elapsed_s": time.perf_counter() - started,
     }
 
 
@@ -84,9 +176,8 @@ def okada_rectangular_surface(
     target_x: np.ndarray,
     target_y: np.ndarray,
     params: dict[str, Any],
+    engine: str = "numpy",
 ) -> tuple[np.ndarray, dict[str, Any]]:
-    from okada_wrapper import dc3dwrapper
-
     target_x = np.asarray(target_x, dtype=np.float64)
     target_y = np.asarray(target_y, dtype=np.float64)
     if target_x.shape != target_y.shape:
@@ -106,26 +197,23 @@ def okada_rectangular_surface(
     rel = obs - origin_xy
     x_local = rel @ strike_unit
     y_local = rel @ okada_y_unit
-    eta = np.zeros(obs.shape[0], dtype=np.float64)
     alpha = okada_alpha(float(params.get("poisson_ratio") or 0.25))
-    success_count = 0
-    for index, (x_value, y_value) in enumerate(zip(x_local, y_local)):
-        success, displacement, _grad = dc3dwrapper(
-            alpha,
-            np.asarray([x_value, y_value, 0.0], dtype=np.float64),
-            float(params["depth_km"]) * 1000.0,
-            float(params["dip_deg"]),
-            strike_width,
-            dip_width,
-            dislocation,
-        )
-        if success == 0:
-            eta[index] = displacement[2]
-            success_count += 1
-    eta = eta.reshape(target_x.shape)
+    uz, success = dc3d_surface_uz(
+        alpha,
+        x_local,
+        y_local,
+        float(params["depth_km"]) * 1000.0,
+        float(params["dip_deg"]),
+        strike_width,
+        dip_width,
+        dislocation,
+        engine=engine,
+    )
+    eta = np.where(success, uz, 0.0).reshape(target_x.shape)
     return eta, {
-        "model": "okada_wrapper_dc3d_single_rectangle",
-        "success_count": success_count,
+        "model": f"{okada_model_name(engine)}_single_rectangle",
+        "engine": engine,
+        "success_count": int(np.count_nonzero(success)),
         "point_count": int(eta.size),
         "poisson_ratio": float(params.get("poisson_ratio") or 0.25),
         "alpha": alpha,
@@ -136,6 +224,179 @@ def okada_rectangular_surface(
     }
 
 
+def okada_model_name(engine: str) -> str:
+    if engine == "numpy":
+        return "okada_dc3d_surface_numpy"
+    if engine == "okada_wrapper":
+        return "okada_wrapper_dc3d"
+    raise ValueError(f"Unknown Okada engine {engine!r}; expected one of {', '.join(OKADA_ENGINES)}.")
+
+
+def dc3d_surface_uz(
+    alpha: float,
+    x: np.ndarray,
+    y: np.ndarray,
+    depth: float,
+    dip_deg: float,
+    strike_width: np.ndarray,
+    dip_width: np.ndarray,
+    dislocation: np.ndarray,
+    engine: str = "numpy",
+) -> tuple[np.ndarray, np.ndarray]:
+    if engine == "numpy":
+        _ux, _uy, uz, success = dc3d_surface_displacement(alpha, x, y, depth, dip_deg, strike_width, dip_width, dislocation)
+        return uz, success
+    okada_model_name(engine)
+    from okada_wrapper import dc3dwrapper
+
+    x = np.asarray(x, dtype=np.float64).ravel()
+    y = np.asarray(y, dtype=np.float64).ravel()
+    uz = np.zeros(x.size, dtype=np.float64)
+    success = np.zeros(x.size, dtype=bool)
+    for index, (x_value, y_value) in enumerate(zip(x, y)):
+        status, displacement, _grad = dc3dwrapper(
+            alpha,
+            np.asarray([x_value, y_value, 0.0], dtype=np.float64),
+            depth,
+            dip_deg,
+            strike_width,
+            dip_width,
+            dislocation,
+        )
+        if status == 0:
+            uz[index] = displacement[2]
+            success[index] = True
+    return uz, success
+
+
+def dc3d_surface_displacement(
+    alpha: float,
+    x: np.ndarray,
+    y: np.ndarray,
+    depth: float,
+    dip_deg: float,
+    strike_width: np.ndarray,
+    dip_width: np.ndarray,
+    dislocation: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized Okada (1992) DC3D displacement at the free surface (z = 0).
+
+    Arguments follow `okada_wrapper.dc3dwrapper`: fault-local observation coordinates,
+    reference-point depth, dip in degrees, [AL1, AL2] strike and [AW1, AW2] dip extents
+    and [strike-slip, dip-slip, tensile] dislocation. At z = 0 the real- and image-source
+    part A terms cancel, so only the DC3D part B surface terms are evaluated. Singular
+    points on a fault edge return success = False, matching DC3D's IRET = 1.
+    """
+    x = np.asarray(x, dtype=np.float64).ravel()
+    y = np.asarray(y, dtype=np.float64).ravel()
+    al1, al2 = (float(value) for value in strike_width)
+    aw1, aw2 = (float(value) for value in dip_width)
+    disl1, disl2, disl3 = (float(value) for value in dislocation)
+    alp3 = (1.0 - float(alpha)) / float(alpha)
+    sd = math.sin(math.radians(float(dip_deg)))
+    cd = math.cos(math.radians(float(dip_deg)))
+    if abs(cd) < DC3D_EPS:
+        cd = 0.0
+        sd = 1.0 if sd > 0.0 else -1.0
+
+    d = float(depth)
+    p = y * cd + d * sd
+    q = zero_small(y * sd - d * cd)
+    xi = [zero_small(x - al1), zero_small(x - al2)]
+    et = [zero_small(p - aw1), zero_small(p - aw2)]
+
+    on_edge = (q == 0.0) & (
+        ((xi[0] * xi[1] <= 0.0) & (et[0] * et[1] == 0.0)) | ((et[0] * et[1] <= 0.0) & (xi[0] * xi[1] == 0.0))
+    )
+    r12 = np.sqrt(xi[0] ** 2 + et[1] ** 2 + q**2)
+    r21 = np.sqrt(xi[1] ** 2 + et[0] ** 2 + q**2)
+    r22 = np.sqrt(xi[1] ** 2 + et[1] ** 2 + q**2)
+    kxi = [(xi[0] < 0.0) & (r21 + xi[1] < DC3D_EPS), (xi[0] < 0.0) & (r22 + xi[1] < DC3D_EPS)]
+    ket = [(et[0] < 0.0) & (r12 + et[1] < DC3D_EPS), (et[0] < 0.0) & (r22 + et[1] < DC3D_EPS)]
+
+    ux = np.zeros_like(x)
+    uy = np.zeros_like(x)
+    uz = np.zeros_like(x)
+    for k in range(2):
+        for j in range(2):
+            du1, du2, du3 = _dc3d_ub_corner(xi[j], et[k], q, sd, cd, kxi[k], ket[j], alp3, disl1, disl2, disl3)
+            sign = -1.0 if j + k == 1 else 1.0
+            ux += sign * du1
+            uy += sign * (du2 * cd - du3 * sd)
+            uz += sign * (du2 * sd + du3 * cd)
+    success = ~on_edge & np.isfinite(ux) & np.isfinite(uy) & np.isfinite(uz)
+    for component in (ux, uy, uz):
+        component[~success] = 0.0
+    return ux, uy, uz, success
+
+
+def _dc3d_ub_corner(
+    xi: np.ndarray,
+    et: np.ndarray,
+    q: np.ndarray,
+    sd: float,
+    cd: float,
+    kxi: np.ndarray,
+    ket: np.ndarray,
+    alp3: float,
+    disl1: float,
+    disl2: float,
+    disl3: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    xi2 = xi * xi
+    q2 = q * q
+    r = np.sqrt(xi2 + et * et + q2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        safe_r = np.where(r == 0.0, 1.0, r)
+        y = et * cd + q * sd
+        d = et * sd - q * cd
+        tt = np.where(q == 0.0, 0.0, np.arctan(xi * et / np.where(q == 0.0, 1.0, q * safe_r)))
+        x11 = np.where(kxi, 0.0, 1.0 / (safe_r * (r + xi)))
+        ale = np.where(ket, -np.log(r - et), np.log(r + et))
+        y11 = np.where(ket, 0.0, 1.0 / (safe_r * (r + et)))
+        rd = r + d
+        if cd != 0.0:
+            x_term = np.sqrt(xi2 + q2)
+            safe_xi = np.where(xi == 0.0, 1.0, xi)
+            ai4 = np.where(
+                xi == 0.0,
+                0.0,
+                (xi / rd * sd * cd + 2.0 * np.arctan((et * (x_term + q * cd) + x_term * (r + x_term) * sd) / (safe_xi * (r + x_term) * cd)))
+                / (cd * cd),
+            )
+            ai3 = (y * cd / rd - ale + sd * np.log(rd)) / (cd * cd)
+        else:
+            rd2 = rd * rd
+            ai3 = (et / rd + y * q / rd2 - ale) / 2.0
+            ai4 = xi * y / rd2 / 2.0
+        ai1 = -xi / rd * cd - ai4 * sd
+        ai2 = np.log(rd) + ai3 * sd
+        qx = q * x11
+        qy = q * y11
+
+        du1 = np.zeros_like(xi)
+        du2 = np.zeros_like(xi)
+        du3 = np.zeros_like(xi)
+        if disl1 != 0.0:
+            du1 += disl1 * (-xi * qy - tt - alp3 * ai1 * sd)
+            du2 += disl1 * (-q / safe_r + alp3 * y / rd * sd)
+            du3 += disl1 * (q * qy - alp3 * ai2 * sd)
+        if disl2 != 0.0:
+            du1 += disl2 * (-q / safe_r + alp3 * ai3 * sd * cd)
+            du2 += disl2 * (-et * qx - tt - alp3 * xi / rd * sd * cd)
+            du3 += disl2 * (q * qx + alp3 * ai4 * sd * cd)
+        if disl3 != 0.0:
+            du1 += disl3 * (q * qy - alp3 * ai3 * sd * sd)
+            du2 += disl3 * (q * qx + alp3 * xi / rd * sd * sd)
+            du3 += disl3 * (et * qx + xi * qy - tt - alp3 * ai4 * sd * sd)
+    scale = 1.0 / (2.0 * math.pi)
+    return du1 * scale, du2 * scale, du3 * scale
+
+
+def zero_small(values: np.ndarray) -> np.ndarray:
+    return np.where(np.abs(values) < DC3D_EPS, 0.0, values)
+
+
 def okada_alpha(poisson_ratio: float) -> float:
     nu = float(poisson_ratio)
     return 1.0 / (2.0 * (1.0 - nu))
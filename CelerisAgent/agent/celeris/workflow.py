@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Any, Callable
 
@@ -16,6 +17,7 @@ from agent.celeris.request import (
     normalize_celeris_config,
 )
 from agent.celeris.earthquake_ic import generate_earthquake_initial_condition
+from agent.celeris.grid_files import binary_grid_format, binary_grid_paths, write_grid_float32, write_grid_text
 from agent.celeris.waves import write_periodic_waves
 from agent.dem.export import artifact
 from agent.dem.loaders import load_mat as load_dem_mat
@@ -50,6 +52,11 @@ CONFIG_KEYS = [
 ]
 
 MAX_CELERIS_MODEL_CELLS = 10_000_000
+RESAMPLE_TILE_CELLS = 262_144
+NAN_FILL_METHODS = ("auto", "separable", "loop", "nearest")
+DEFAULT_NAN_FILL_METHOD = "auto"
+NAN_FILL_LOOP_MIN_LINE_CELLS = 1024
+NAN_FILL_BLOCK_CELLS = 1_048_576
 STARTUP_VISUALIZATION_KEYS = [
     "surfaceToPlot",
     "colorMap_choice",
@@ -184,9 +191,19 @@ def generate_celeris_inputs(job_dir: Path, request: dict[str, Any], progress_cal
 
     out_dir = job_dir / "outputs"
     bathy_path = out_dir / "bathy.txt"
-    emit_progress(progress_callback, "celeris_write_bathy", "Writing bathy.txt.", {"path": str(bathy_path.relative_to(job_dir)), "shape": [model["HEIGHT"], model["WIDTH"]]})
-    np.savetxt(bathy_path, model["z"], fmt="%.8f")
+    emit_progress(progress_callback, "celeris_write_bathy", "Writing bathy.txt.", {"path": str(bathy_path.relative_to(job_dir)), "shape": [model["HEIGHT"], model["WIDTH"]], "rows_written": 0, "rows": model["HEIGHT"], "percent": 0.0})
+    write_grid_text(bathy_path, model["z"], "%.8f", progress=grid_write_progress(progress_callback, "celeris_write_bathy", bathy_path.name))
     selected_path.append("write_bathy_txt")
+    binary_grids: dict[str, Any] = {}
+    bathy_binary_artifacts: list[dict[str, Any]] = []
+    if binary_grid_format() == "float32":
+        binary_grids["bathy"] = write_grid_float32(bathy_path, model["z"])
+        bathy_f32_path, bathy_header_path = binary_grid_paths(bathy_path)
+        bathy_binary_artifacts = [
+            artifact(job_dir, bathy_f32_path, "celeris_bathy_f32", "CELERIS bathy.txt as raw little-endian float32"),
+            artifact(job_dir, bathy_header_path, "celeris_bathy_f32_header", "CELERIS bathy.f32 header"),
+        ]
+        selected_path.append("write_bathy_f32")
 
     waves_path = out_dir / "waves.txt"
     emit_progress(progress_callback, "celeris_write_waves", "Generating waves.txt.", {"has_incident_wave_forcing": has_incident_wave_forcing(request)})
@@ -232,6 +249,8 @@ def generate_celeris_inputs(job_dir: Path, request: dict[str, Any], progress_cal
     )
     selected_path.extend(initial_condition_result.get("selected_path", []))
     initial_condition_artifacts = initial_condition_result.get("artifacts", [])
+    if (initial_condition_result.get("initial_condition") or {}).get("binary"):
+        binary_grids["initial_eta"] = initial_condition_result["initial_condition"]["binary"]
     initial_condition_checks = initial_condition_result.get("checks", [])
     has_initial_eta = initial_condition_result.get("status") == "completed"
 
@@ -279,6 +298,8 @@ def generate_celeris_inputs(job_dir: Path, request: dict[str, Any], progress_cal
             "domain_georeferencing": domain_georeferencing,
             "overlay": (overlay_result or {}).get("overlay"),
             "initial_condition": initial_condition_result.get("initial_condition"),
+            "initial_condition_cache": (initial_condition_result.get("initial_condition") or {}).get("cache"),
+            "binary_grids": binary_grids,
             "nan_fill": model.get("nan_fill"),
             "depth_cap": model.get("depth_cap"),
             "wave_summary": wave_summary,
@@ -291,6 +312,7 @@ def generate_celeris_inputs(job_dir: Path, request: dict[str, Any], progress_cal
     artifacts = [
         artifact(job_dir, config_path, "celeris_config_json", "CELERIS config.json"),
         artifact(job_dir, bathy_path, "celeris_bathy_txt", "CELERIS bathy.txt"),
+        *bathy_binary_artifacts,
         artifact(job_dir, waves_path, "celeris_waves_txt", "CELERIS waves.txt"),
         artifact(job_dir, manifest_path, "celeris_case_manifest", "CELERIS case manifest"),
         *initial_condition_artifacts,
@@ -323,10 +345,25 @@ def emit_progress(callback: ProgressCallback | None, stage: str, detail: str, da
     callback(stage, detail, data or {})
 
 
+def grid_write_progress(callback: ProgressCallback | None, stage: str, file_name: str) -> Callable[[int, int], None] | None:
+    if callback is None:
+        return None
+
+    def report(rows_written: int, rows: int) -> None:
+        emit_progress(
+            callback,
+            stage,
+            f"Writing {file_name}: {rows_written} of {rows} rows.",
+            {"rows_written": rows_written, "rows": rows, "percent": round(100.0 * rows_written / max(rows, 1), 1)},
+        )
+
+    return report
+
+
 def load_celeris_bathy(path: Path) -> dict[str, np.ndarray | str | None]:
     grid = load_dem_mat(path)
     return {
-        "z": np.asarray(grid.z, dtype=np.float64),
+        "z": np.asarray(grid.z, dtype=np.float32),
         "x": np.asarray(grid.x, dtype=np.float64) if grid.x is not None else None,
         "y": np.asarray(grid.y, dtype=np.float64) if grid.y is not None else None,
         "lon": np.asarray(grid.lon, dtype=np.float64) if grid.lon is not None else None,
@@ -337,7 +374,7 @@ def load_celeris_bathy(path: Path) -> dict[str, np.ndarray | str | None]:
 
 
 def interpolate_to_model_grid(grid: dict[str, Any], dx: float, dy: float, sea_level: float) -> dict[str, Any]:
-    z = np.asarray(grid["z"], dtype=np.float64)
+    z = np.asarray(grid["z"])
     rows, cols = z.shape
     x = grid.get("x")
     y = grid.get("y")
@@ -374,13 +411,11 @@ def interpolate_to_model_grid(grid: dict[str, Any], dx: float, dy: float, sea_le
     if x_interp.size < 2 or y_interp.size < 2:
         raise ValueError("Requested CELERIS dx/dy are too large for the available bathymetry extent.")
 
-    interpolator = RegularGridInterpolator((y_local, x_local), z, bounds_error=False, fill_value=np.nan)
-    yy, xx = np.meshgrid(y_interp, x_interp, indexing="ij")
-    h_interp = interpolator(np.column_stack([yy.ravel(), xx.ravel()])).reshape(y_interp.size, x_interp.size)
-    h_interp = h_interp + float(sea_level)
+    h_interp = resample_rectilinear(y_local, x_local, z, y_interp, x_interp)
+    h_interp += float(sea_level)
     if not np.isfinite(h_interp).any():
         raise ValueError("Interpolated CELERIS bathy grid contains no finite cells.")
-    h_interp, fill_summary = fill_bathy_nans(h_interp)
+    h_interp, fill_summary = fill_bathy_nans(h_interp, copy=False)
     model = {
         "z": h_interp,
         "x": x_interp,
@@ -414,9 +449,59 @@ def interpolate_to_model_grid(grid: dict[str, Any], dx: float, dy: float, sea_le
     return model
 
 
+def resample_rectilinear(
+    y_source: np.ndarray,
+    x_source: np.ndarray,
+    z: np.ndarray,
+    y_target: np.ndarray,
+    x_target: np.ndarray,
+    tile_cells: int = RESAMPLE_TILE_CELLS,
+) -> np.ndarray:
+    """Bilinearly resample `z` from one ascending rectilinear grid onto another.
+
+    Matches `RegularGridInterpolator(..., bounds_error=False, fill_value=nan)` bit for bit, including the
+    order of its four-corner weighted sum, but computes indices and weights once per axis and fills
+    the output a tile of rows at a time instead of building an (N, 2) point array for every cell.
+    """
+    if y_source.size < 2 or x_source.size < 2:
+        interpolator = RegularGridInterpolator((y_source, x_source), np.asarray(z, dtype=np.float64), bounds_error=False, fill_value=np.nan)
+        yy, xx = np.meshgrid(y_target, x_target, indexing="ij")
+        return interpolator(np.column_stack([yy.ravel(), xx.ravel()])).reshape(y_target.size, x_target.size)
+
+    if not np.issubdtype(z.dtype, np.floating):
+        z = z.astype(np.float64)
+    # Float32 sources stay float32; gathered rows promote to float64 against the weights, which is exact.
+    row_index, row_weight, row_outside = axis_interpolation_weights(y_source, y_target)
+    col_index, col_weight, col_outside = axis_interpolation_weights(x_source, x_target)
+    col_keep = 1.0 - col_weight
+    out = np.empty((y_target.size, x_target.size), dtype=np.float64)
+    step = max(1, tile_cells // max(x_target.size, 1))
+    for start in range(0, y_target.size, step):
+        tile = slice(start, start + step)
+        lower = z[row_index[tile]]
+        upper = z[row_index[tile] + 1]
+        weight = row_weight[tile, None]
+        keep = 1.0 - weight
+        values = lower[:, col_index] * keep * col_keep
+        values += lower[:, col_index + 1] * keep * col_weight
+        values += upper[:, col_index] * weight * col_keep
+        values += upper[:, col_index + 1] * weight * col_weight
+        values[row_outside[tile]] = np.nan
+        out[tile] = values
+    out[:, col_outside] = np.nan
+    return out
+
+
+def axis_interpolation_weights(source: np.ndarray, target: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-axis lower-cell index, fractional distance, and out-of-range mask for linear interpolation."""
+    index = np.clip(np.searchsorted(source, target, side="right") - 1, 0, source.size - 2)
+    weight = (target - source[index]) / (source[index + 1] - source[index])
+    outside = (target < source[0]) | (target > source[-1])
+    return index, weight, outside
+
+
 def planned_model_grid(grid: dict[str, Any], dx: float, dy: float) -> dict[str, Any]:
-    z = np.asarray(grid["z"], dtype=np.float64)
-    rows, cols = z.shape
+    rows, cols = np.shape(grid["z"])
     x = grid.get("x")
     y = grid.get("y")
     if x is None or np.asarray(x).size != cols:
@@ -553,8 +638,7 @@ def median_spacing(values: np.ndarray) -> float | None:
 
 
 def native_grid_spacing(grid: dict[str, Any]) -> tuple[float | None, float | None]:
-    z = np.asarray(grid["z"], dtype=np.float64)
-    rows, cols = z.shape
+    rows, cols = np.shape(grid["z"])
     x = grid.get("x")
     y = grid.get("y")
     if x is None or np.asarray(x).size != cols:
@@ -565,12 +649,22 @@ def native_grid_spacing(grid: dict[str, Any]) -> tuple[float | None, float | Non
     return median_spacing(x_local), median_spacing(y_local)
 
 
-def fill_bathy_nans(z: np.ndarray) -> tuple[np.ndarray, dict[str, Any]]:
-    z = np.asarray(z, dtype=np.float64).copy()
+def fill_bathy_nans(z: np.ndarray, method: str | None = None, copy: bool = True) -> tuple[np.ndarray, dict[str, Any]]:
+    """Fill NaN cells with a row pass, then a column pass, of 1D linear interpolation, then EDT nearest fill.
+
+    `separable` fills blocks of lines at once and `loop` calls `np.interp` per line; both give the
+    same values and counts. `auto` picks `loop` for passes over lines of at least
+    `NAN_FILL_LOOP_MIN_LINE_CELLS` cells, where per-line calls are already cheap, and `separable`
+    for shorter lines. `nearest` skips the linear passes. With `copy=False` a float64 `z` is filled in place.
+    An unsupported `CELERIS_BATHY_FILL_METHOD` falls back to the default and is recorded as `ignored_env_method`.
+    """
+    method, ignored_env_method = bathy_fill_method(method)
+    extra = {"ignored_env_method": ignored_env_method} if ignored_env_method else {}
+    z = np.array(z, dtype=np.float64, copy=copy or None)
     missing = ~np.isfinite(z)
     missing_count = int(np.count_nonzero(missing))
     if missing_count == 0:
-        return z, {"filled_cells": 0, "linear_cells": 0, "nearest_cells": 0}
+        return z, {"filled_cells": 0, "linear_cells": 0, "nearest_cells": 0, "method": method, **extra}
 
     finite = np.isfinite(z)
     if not finite.any():
@@ -578,37 +672,11 @@ def fill_bathy_nans(z: np.ndarray) -> tuple[np.ndarray, dict[str, Any]]:
 
     linear_cells = 0
     nearest_cells = 0
-    row_indices = np.where(missing.any(axis=1))[0]
-    for row_index in row_indices:
-        row = z[row_index, :]
-        row_missing = ~np.isfinite(row)
-        if not row_missing.any():
-            continue
-        finite_cols = np.flatnonzero(np.isfinite(row))
-        if finite_cols.size < 2:
-            continue
-        missing_cols = np.flatnonzero(row_missing)
-        interpolated = np.interp(missing_cols, finite_cols, row[finite_cols])
-        inside = (missing_cols >= finite_cols[0]) & (missing_cols <= finite_cols[-1])
-        z[row_index, missing_cols] = interpolated
-        linear_cells += int(np.count_nonzero(inside))
-        nearest_cells += int(np.count_nonzero(~inside))
-
-    col_indices = np.where((~np.isfinite(z)).any(axis=0))[0]
-    for col_index in col_indices:
-        col = z[:, col_index]
-        col_missing = ~np.isfinite(col)
-        if not col_missing.any():
-            continue
-        finite_rows = np.flatnonzero(np.isfinite(col))
-        if finite_rows.size < 2:
-            continue
-        missing_rows = np.flatnonzero(col_missing)
-        interpolated = np.interp(missing_rows, finite_rows, col[finite_rows])
-        inside = (missing_rows >= finite_rows[0]) & (missing_rows <= finite_rows[-1])
-        z[missing_rows, col_index] = interpolated
-        linear_cells += int(np.count_nonzero(inside))
-        nearest_cells += int(np.count_nonzero(~inside))
+    if method != "nearest":
+        for lines in (z, z.T):
+            linear, nearest = fill_line_nans(lines, method)
+            linear_cells += linear
+            nearest_cells += nearest
 
     remaining = ~np.isfinite(z)
     remaining_nearest_cells = int(np.count_nonzero(remaining))
@@ -621,7 +689,115 @@ def fill_bathy_nans(z: np.ndarray) -> tuple[np.ndarray, dict[str, Any]]:
 
     if not np.isfinite(z).all():
         raise ValueError("CELERIS bathy NaN fill failed; bathy.txt would contain NaN values.")
-    return z, {"filled_cells": missing_count, "linear_cells": linear_cells, "nearest_cells": nearest_cells}
+    return z, {"filled_cells": missing_count, "linear_cells": linear_cells, "nearest_cells": nearest_cells, "method": method, **extra}
+
+
+def bathy_fill_method(method: str | None) -> tuple[str, str | None]:
+    """Return the fill method and any ignored `CELERIS_BATHY_FILL_METHOD` value.
+
+    An explicit `method` must be supported; an unsupported environment value falls back to the default.
+    """
+    if method is not None:
+        method = str(method).strip().lower()
+        if method not in NAN_FILL_METHODS:
+            raise ValueError(f"Unsupported bathy NaN fill method {method!r}; expected one of {', '.join(NAN_FILL_METHODS)}.")
+        return method, None
+    raw = os.environ.get("CELERIS_BATHY_FILL_METHOD")
+    if not raw:
+        return DEFAULT_NAN_FILL_METHOD, None
+    env_method = raw.strip().lower()
+    if env_method in NAN_FILL_METHODS:
+        return env_method, None
+    return DEFAULT_NAN_FILL_METHOD, raw
+
+
+def fill_line_nans(lines: np.ndarray, method: str) -> tuple[int, int]:
+    if method == "loop" or (method == "auto" and lines.shape[1] >= NAN_FILL_LOOP_MIN_LINE_CELLS):
+        return fill_line_nans_loop(lines)
+    return fill_line_nans_separable(lines)
+
+
+def fill_line_nans_loop(lines: np.ndarray) -> tuple[int, int]:
+    """Fill NaNs in place along each row of `lines` with one `np.interp` call per row."""
+    linear_cells = 0
+    nearest_cells = 0
+    for row_index in np.where((~np.isfinite(lines)).any(axis=1))[0]:
+        row = lines[row_index, :]
+        row_missing = ~np.isfinite(row)
+        finite_cols = np.flatnonzero(~row_missing)
+        if finite_cols.size < 2:
+            continue
+        missing_cols = np.flatnonzero(row_missing)
+        interpolated = np.interp(missing_cols, finite_cols, row[finite_cols])
+        inside = (missing_cols >= finite_cols[0]) & (missing_cols <= finite_cols[-1])
+        lines[row_index, missing_cols] = interpolated
+        linear_cells += int(np.count_nonzero(inside))
+        nearest_cells += int(np.count_nonzero(~inside))
+    return linear_cells, nearest_cells
+
+
+def fill_line_nans_separable(lines: np.ndarray, block_cells: int = NAN_FILL_BLOCK_CELLS) -> tuple[int, int]:
+    """Vectorized equivalent of `fill_line_nans_loop`, filling a block of rows at once.
+
+    A running count of finite cells over the flattened block gives each missing cell its bracketing
+    finite neighbours, which lie on the same row for cells between a row's first and last finite
+    cell. The interpolation uses `np.interp`'s slope expression on exact integer offsets, so values
+    match the per-row loop bit for bit. Cells before the first or after the last finite cell of a row
+    take that edge value and count as nearest. `lines` may be a transposed view of a C-ordered grid;
+    cells are then addressed through the grid's own flat buffer instead of a transposed copy.
+    """
+    if lines.flags.c_contiguous:
+        flat = lines.reshape(-1)
+        row_stride, column_stride = lines.shape[1], 1
+    elif lines.T.flags.c_contiguous:
+        flat = lines.T.reshape(-1)
+        row_stride, column_stride = 1, lines.shape[0]
+    else:
+        contiguous = np.ascontiguousarray(lines)
+        counts = fill_line_nans_separable(contiguous, block_cells)
+        lines[...] = contiguous
+        return counts
+
+    linear_cells = 0
+    nearest_cells = 0
+    height, width = lines.shape
+    step = max(1, block_cells // max(width, 1))
+    for start in range(0, height, step):
+        finite = np.ascontiguousarray(np.isfinite(lines[start : start + step]))
+        usable = np.count_nonzero(finite, axis=1) >= 2
+        if finite.all() or not usable.any():
+            continue
+        first = np.argmax(finite, axis=1)
+        last = width - 1 - np.argmax(finite[:, ::-1], axis=1)
+
+        missing = np.flatnonzero(~finite)
+        line = missing // width
+        if not usable.all():
+            keep = usable[line]
+            missing = missing[keep]
+            line = line[keep]
+        column = missing - line * width
+        before = column < first[line]
+        after = column > last[line]
+        inside = ~(before | after)
+
+        known = np.flatnonzero(finite)
+        following = np.cumsum(finite.reshape(-1))[missing[inside]]
+        line_inside = line[inside]
+        column_inside = column[inside]
+        row_offset = (start + line_inside) * row_stride
+        left = known[following - 1] - line_inside * width
+        right = known[following] - line_inside * width
+        left_value = flat[row_offset + left * column_stride]
+        slope = (flat[row_offset + right * column_stride] - left_value) / (right - left)
+        flat[row_offset + column_inside * column_stride] = slope * (column_inside - left) + left_value
+        for edge, edge_column in ((before, first), (after, last)):
+            row_offset = (start + line[edge]) * row_stride
+            flat[row_offset + column[edge] * column_stride] = flat[row_offset + edge_column[line[edge]] * column_stride]
+
+        linear_cells += int(line_inside.size)
+        nearest_cells += int(missing.size - line_inside.size)
+    return linear_cells, nearest_cells
 
 
 def apply_boussinesq_depth_cap(z: np.ndarray, request: dict[str, Any]) -> dict[str, Any]:
@@ -818,6 +994,15 @@ def validate_generated_config(request: dict[str, Any], config: dict[str, Any], m
                 "details": fill_summary,
             }
         )
+    if fill_summary.get("ignored_env_method"):
+        checks.append(
+            {
+                "level": "warning",
+                "code": "BATHY_FILL_METHOD_IGNORED",
+                "message": f"CELERIS_BATHY_FILL_METHOD={fill_summary['ignored_env_method']!r} is not one of {', '.join(NAN_FILL_METHODS)}; the {fill_summary.get('method')!r} NaN fill was used instead.",
+                "details": fill_summary,
+            }
+        )
     depth_cap = model.get("depth_cap") or {}
     if depth_cap.get("applied"):
         message = (
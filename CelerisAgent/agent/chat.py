@@ -581,7 +581,7 @@ def handle_attachment_turn(
     options: dict[str, Any],
     action: dict[str, Any],
 ) -> str:
-    result = normalize_attachments(job_dir, attachments, options)
+    result = normalize_attachments(job_dir, attachments, with_dem_request_read_hints(options, state.get("dem_request")))
     state.update(
         {
             "workflow_state": result["status"],
@@ -596,8 +596,15 @@ def handle_attachment_turn(
     return response_for_dem_result(result)
 
 
+def with_dem_request_read_hints(options: dict[str, Any], dem_request: dict[str, Any] | None) -> dict[str, Any]:
+    """Pass the resolved AOI and target resolution to loaders that can read a subset (NetCDF)."""
+    hints = {key: (dem_request or {}).get(key) for key in ("aoi_bbox_wgs84", "target_resolution_m")}
+    hints = {key: value for key, value in hints.items() if value not in (None, "", [])}
+    return {**hints, **options} if hints else options
+
+
 def handle_url_turn(job_dir: Path, state: dict[str, Any], url: str, options: dict[str, Any], action: dict[str, Any]) -> str:
-    result = normalize_direct_url(job_dir, url, options)
+    result = normalize_direct_url(job_dir, url, with_dem_request_read_hints(options, state.get("dem_request")))
     state.update(
         {
             "workflow_state": result["status"],
@@ -923,6 +930,8 @@ def apply_celeris_config_result(
             "celeris_case_manifest",
             "satellite_overlay_jpg",
             "satellite_overlay_manifest",
+            "satellite_overlay_preview_jpg",
+            "satellite_overlay_pyramid_index",
             "celeris_eta_initial_condition",
             "earthquake_ic_preview_png",
             "earthquake_ic_manifest",
@@ -522,9 +522,11 @@ def chat_action_schema() -> dict[str, Any]:
                     "z_units": {"type": ["string", "null"]},
                     "z_scale": {"type": "number"},
                     "max_cells": {"type": "integer"},
+                    "downsample_method": {"type": "string", "enum": ["stride", "mean", "median", "min_depth"]},
+                    "mosaic_overlap": {"type": "string", "enum": ["first", "last", "mean", "min_depth"]},
                     "variable": {"type": ["string", "null"]},
                 },
-                "required": ["sign_mode", "fill_nodata", "crs_override", "vertical_datum", "z_units", "z_scale", "max_cells", "variable"],
+                "required": ["sign_mode", "fill_nodata", "crs_override", "vertical_datum", "z_units", "z_scale", "max_cells", "downsample_method", "mosaic_overlap", "variable"],
                 "additionalProperties": False,
             },
             "missing_information": {"type": "array", "items": {"type": "string"}},
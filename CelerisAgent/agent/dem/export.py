@@ -51,6 +51,7 @@ def write_mat(grid: DemGrid, path: Path) -> None:
     from scipy.io import savemat
 
     rows, cols = grid.z.shape
+    z = np.asarray(grid.z, dtype=np.float32)
     x = grid.x if grid.x is not None and grid.x.size == cols else (grid.x0 or 0.0) + np.arange(cols) * (grid.dx or 1.0)
     y = grid.y if grid.y is not None and grid.y.size == rows else (grid.y0 or 0.0) - np.arange(rows) * (grid.dy or 1.0)
     lon = grid.lon if grid.lon is not None and grid.lon.size == cols else None
@@ -59,8 +60,8 @@ def write_mat(grid: DemGrid, path: Path) -> None:
         lon = np.asarray(x, dtype=np.float64)
         lat = np.asarray(y, dtype=np.float64)
     celeris_bathy = {
-        "z": grid.z.astype(np.float32),
-        "h": grid.z.astype(np.float32),
+        "z": z,
+        "h": z,
         "x": np.asarray(x, dtype=np.float64),
         "y": np.asarray(y, dtype=np.float64),
         "dx": np.array([[grid.dx if grid.dx is not None else np.nan]], dtype=np.float64),
@@ -72,7 +73,7 @@ def write_mat(grid: DemGrid, path: Path) -> None:
         "z_units": grid.z_units,
         "history_json": json.dumps(grid.history),
     }
-    payload: dict[str, Any] = {"celeris_bathy": celeris_bathy, "z": grid.z.astype(np.float32), "h": grid.z.astype(np.float32), "x": x, "y": y}
+    payload: dict[str, Any] = {"celeris_bathy": celeris_bathy, "z": z, "h": z, "x": x, "y": y}
     if lon is not None and lat is not None:
         celeris_bathy["lon"] = np.asarray(lon, dtype=np.float64)
         celeris_bathy["lat"] = np.asarray(lat, dtype=np.float64)
@@ -102,9 +103,10 @@ def write_preview(grid: DemGrid, path: Path) -> None:
     if not finite.any():
         rgb = np.zeros((*z.shape, 3), dtype=np.uint8)
     else:
-        lo, hi = np.nanpercentile(z[finite], [2, 98])
+        lo, hi = (float(value) for value in np.nanpercentile(z[finite], [2, 98]))
         if hi <= lo:
             hi = lo + 1.0
+        # Python-float bounds keep the colour ramp in float32 instead of promoting full-grid temporaries to float64.
         norm = np.clip((z - lo) / (hi - lo), 0, 1)
         norm = np.where(finite, norm, 0)
         water = z < 0
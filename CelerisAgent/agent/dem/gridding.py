@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+# By default only coordinates within this many float64 ulps of the axis magnitude share a grid line, so
+# stretched or irregular axes keep every distinct line and only arithmetic noise such as 0.1 * 3 vs 0.3 merges.
+AXIS_TOLERANCE_ULPS = 16
+
+
+def grid_axis(values: np.ndarray, tolerance: float | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """Return ascending grid-line coordinates and the grid-line index of every value.
+
+    With `tolerance=0` this is `np.unique(values, return_inverse=True)`. Otherwise sorted values
+    separated by no more than `tolerance` collapse onto one grid line placed at their mean. The
+    default is `AXIS_TOLERANCE_ULPS` float64 ulps of the largest coordinate magnitude, which only
+    absorbs floating-point noise; pass a larger `tolerance` for survey grids with real rounding jitter.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    axis, inverse = np.unique(values, return_inverse=True)
+    if axis.size < 2 or tolerance == 0:
+        return axis, inverse.reshape(-1)
+    gaps = np.diff(axis)
+    if tolerance is None:
+        tolerance = AXIS_TOLERANCE_ULPS * float(np.finfo(np.float64).eps) * float(max(abs(axis[0]), abs(axis[-1])))
+    line = np.concatenate([[0], np.cumsum(gaps > tolerance)])
+    if line[-1] == axis.size - 1:
+        return axis, inverse.reshape(-1)
+    counts = np.bincount(inverse.reshape(-1), minlength=axis.size)
+    weights = np.bincount(line, weights=axis * counts)
+    merged = weights / np.bincount(line, weights=counts)
+    return merged, line[inverse.reshape(-1)]
+
+
+def points_to_grid(
+    x: np.ndarray,
+    y: np.ndarray,
+    values: np.ndarray,
+    tolerance: float | None = None,
+    dtype: type = np.float64,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Place gridded point samples into a 2D array with rows along ascending y.
+
+    Returns `(x_axis, y_axis, grid)`; cells without a sample are NaN and, where several samples
+    fall on one cell, the last one wins.
+    """
+    x_axis, column = grid_axis(x, tolerance)
+    y_axis, row = grid_axis(y, tolerance)
+    grid = np.full((y_axis.size, x_axis.size), np.nan, dtype=dtype)
+    grid[row, column] = values
+    return x_axis, y_axis, grid
@@ -1,15 +1,33 @@
 from __future__ import annotations
 
+import math
+import re
+import zipfile
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
+from agent.dem.gridding import points_to_grid
+from agent.dem.processing import DEFAULT_MAX_CELLS, DOWNSAMPLE_TILE_CELLS, block_reduce, downsample_axis, downsample_method, values_inverted
 from agent.dem.types import DemGrid
+from agent.geo import lat_degrees_to_meters, lon_degrees_to_meters, normalize_bbox_wgs84
 from agent.io_utils import extract_zip
 
 
 SUPPORTED = {".tif", ".tiff", ".asc", ".grd", ".txt", ".csv", ".xyz", ".nc", ".cdf", ".mat", ".npy", ".npz"}
+LOAD_PRIORITY = {".tif": 0, ".tiff": 0, ".nc": 1, ".cdf": 1, ".asc": 2, ".grd": 2, ".mat": 3, ".npy": 4, ".npz": 4}
+# Files GDAL or the grid loaders read next to a raster: world files, projections, overviews, and PAM metadata.
+ZIP_SIDECAR_SUFFIXES = (".tfw", ".tifw", ".tiffw", ".prj", ".ovr", ".aux.xml", ".hdr")
+VSIZIP_PREFIX = "/vsizip/"
+WINDOW_EDGE_TOLERANCE = 1e-6
+ASCII_GRID_HEADER_KEYS = {"ncols", "nrows", "xllcorner", "yllcorner", "xllcenter", "yllcenter", "cellsize", "nodata_value"}
+ASCII_GRID_BLOCK_BYTES = 4 * 1024 * 1024
+TEXT_SNIFF_BYTES = 64 * 1024
+TEXT_SNIFF_LINES = 50
+TEXT_DELIMITERS = (",", ";", "\t")
+# GDAL resampling used when a GeoTIFF is decimated on read; other methods reduce row strips in NumPy.
+GEOTIFF_READ_RESAMPLING = {"stride": "nearest", "mean": "average"}
 
 
 class DemLoadError(RuntimeError):
@@ -20,16 +38,67 @@ def expand_inputs(paths: list[Path], work_dir: Path) -> list[Path]:
     expanded: list[Path] = []
     for path in paths:
         if path.suffix.lower() == ".zip":
-            expanded.extend(extract_zip(path, work_dir / "extracted"))
+            expanded.extend(expand_zip(path, work_dir / "extracted"))
         else:
             expanded.append(path)
     return expanded
 
 
+def expand_zip(path: Path, out_dir: Path) -> list[Path]:
+    """Return the loadable members of a ZIP without unpacking the rest of the archive.
+
+    Only the central directory is read up front. GeoTIFFs GDAL can open in place are returned as
+    `/vsizip/` paths; other `SUPPORTED` members and their sidecars are extracted in load-priority
+    order, largest first. Shapefiles, imagery, and metadata the loaders ignore stay in the archive.
+    """
+    with zipfile.ZipFile(path) as zf:
+        members = [item for item in zf.infolist() if not item.is_dir()]
+    loadable = sorted(
+        (item for item in members if Path(item.filename).suffix.lower() in SUPPORTED),
+        key=lambda item: (LOAD_PRIORITY.get(Path(item.filename).suffix.lower(), 9), -item.file_size, item.filename.lower()),
+    )
+    virtual: list[Path] = []
+    extract: list[str] = []
+    for item in loadable:
+        if Path(item.filename).suffix.lower() in {".tif", ".tiff"}:
+            member_path = Path(f"{VSIZIP_PREFIX}{path.resolve().as_posix()}/{item.filename}")
+            if opens_as_raster(member_path):
+                virtual.append(member_path)
+                continue
+        extract.append(item.filename)
+    stems = {Path(name).stem.lower() + "." for name in extract}
+    sidecars = [
+        item.filename
+        for item in members
+        if item.filename.lower().endswith(ZIP_SIDECAR_SUFFIXES) and Path(item.filename).name.lower().startswith(tuple(stems))
+    ] if stems else []
+    extracted = extract_zip(path, out_dir, members=extract + sidecars) if extract else []
+    return virtual + [member for member in extracted if member.suffix.lower() in SUPPORTED]
+
+
+def gdal_path(path: Path) -> str:
+    """Path string for GDAL, restoring the `/vsizip//abs/path` form that `Path` collapses on POSIX."""
+    text = path.as_posix()
+    if text.startswith(VSIZIP_PREFIX):
+        archive = text[len(VSIZIP_PREFIX) :]
+        if not archive.startswith("/") and not re.match(r"[A-Za-z]:", archive):
+            return f"{VSIZIP_PREFIX}/{archive}"
+    return str(path)
+
+
+def opens_as_raster(path: Path) -> bool:
+    try:
+        import rasterio
+
+        with rasterio.open(gdal_path(path)):
+            return True
+    except Exception:
+        return False
+
+
 def load_first(paths: list[Path], options: dict) -> tuple[DemGrid, list[str]]:
     candidates = [p for p in paths if p.suffix.lower() in SUPPORTED]
-    priority = {".tif": 0, ".tiff": 0, ".nc": 1, ".cdf": 1, ".asc": 2, ".grd": 2, ".mat": 3, ".npy": 4, ".npz": 4}
-    candidates.sort(key=lambda p: (priority.get(p.suffix.lower(), 9), p.name.lower()))
+    candidates.sort(key=lambda p: (LOAD_PRIORITY.get(p.suffix.lower(), 9), p.name.lower()))
     errors: list[str] = []
     for path in candidates:
         try:
@@ -46,7 +115,7 @@ def load_first(paths: list[Path], options: dict) -> tuple[DemGrid, list[str]]:
 def load_one(path: Path, options: dict) -> tuple[DemGrid, str]:
     suffix = path.suffix.lower()
     if suffix in {".tif", ".tiff"}:
-        return load_geotiff(path), "load_geotiff"
+        return load_geotiff(path, options), "load_geotiff"
     if suffix in {".asc", ".grd"}:
         return load_ascii_grid(path), "load_ascii_grid"
     if suffix in {".txt", ".csv", ".xyz"}:
@@ -60,23 +129,51 @@ def load_one(path: Path, options: dict) -> tuple[DemGrid, str]:
     raise DemLoadError(f"Unsupported extension: {suffix}")
 
 
-def load_geotiff(path: Path) -> DemGrid:
-    import rasterio
+def load_geotiff(path: Path, options: dict | None = None) -> DemGrid:
+    """Load band 1 of a GeoTIFF, reading only what the options need.
 
-    with rasterio.open(path) as ds:
-        z = ds.read(1).astype(np.float32)
-        if ds.nodata is not None:
-            z = np.where(z == ds.nodata, np.nan, z)
+    `read_bbox_wgs84` limits the read to the raster window covering that bbox, and a positive
+    `max_cells` decimates on read through `out_shape` (GDAL uses overviews when present), so memory
+    follows the output grid rather than the source file.
+    """
+    import rasterio
+    from rasterio.enums import Resampling
+
+    options = options or {}
+    with rasterio.open(gdal_path(path)) as ds:
+        window = geotiff_read_window(ds, options.get("read_bbox_wgs84"))
+        window_rows = int(window.height) if window is not None else ds.height
+        window_cols = int(window.width) if window is not None else ds.width
+        stride = read_decimation(window_rows, window_cols, int(float(options.get("max_cells", DEFAULT_MAX_CELLS) or 0)))
+        out_shape = (math.ceil(window_rows / stride), math.ceil(window_cols / stride))
+        method = downsample_method(options)
+        if stride > 1 and method not in GEOTIFF_READ_RESAMPLING:
+            z = read_block_reduced(ds, window, stride, method, values_inverted(options))
+        else:
+            z = ds.read(
+                1,
+                window=window,
+                out_shape=out_shape if stride > 1 else None,
+                out_dtype="float32",
+                # At stride 1 nothing is resampled, so block-reduce methods read like `stride`.
+                resampling=getattr(Resampling, GEOTIFF_READ_RESAMPLING.get(method, "nearest")),
+            )
+            if ds.nodata is not None:
+                z[z == ds.nodata] = np.nan
         dtypes = [str(value) for value in ds.dtypes]
         colorinterp = [interp.name for interp in ds.colorinterp]
         units = [value for value in ds.units]
         transform = ds.transform
+        row_off = int(window.row_off) if window is not None else 0
+        col_off = int(window.col_off) if window is not None else 0
+        col_scale = window_cols / z.shape[1]
+        row_scale = window_rows / z.shape[0]
         grid = DemGrid(
             z=z,
-            dx=abs(float(transform.a)) if transform.a else None,
-            dy=abs(float(transform.e)) if transform.e else None,
-            x0=float(transform.c),
-            y0=float(transform.f),
+            dx=abs(float(transform.a) * col_scale) if transform.a else None,
+            dy=abs(float(transform.e) * row_scale) if transform.e else None,
+            x0=float(transform.c + col_off * transform.a + row_off * transform.b),
+            y0=float(transform.f + col_off * transform.d + row_off * transform.e),
             crs=ds.crs.to_string() if ds.crs else None,
         )
         grid.metadata["geotiff"] = {
@@ -89,12 +186,76 @@ def load_geotiff(path: Path) -> DemGrid:
             "nodata": ds.nodata,
             "likely_image": is_likely_image_geotiff(ds.count, dtypes, colorinterp, units),
         }
+        if window is not None or stride > 1:
+            grid.metadata["geotiff"]["read"] = {
+                "source_shape": [ds.height, ds.width],
+                "window": [row_off, col_off, window_rows, window_cols] if window is not None else None,
+                "decimation": stride,
+                "downsample_method": method,
+                "shape": list(z.shape),
+            }
         if any(unit and unit.lower() in {"meter", "metre", "meters", "metres", "m"} for unit in units):
             grid.z_units = "meters"
         grid.add_history("load_geotiff", file=path.name, band_count=ds.count, dtypes=dtypes, color_interpretation=colorinterp)
+        if window is not None or stride > 1:
+            grid.add_history("read_geotiff_window", **grid.metadata["geotiff"]["read"])
         return grid
 
 
+def geotiff_read_window(ds: Any, bbox_wgs84: Any):
+    """Return the pixel window covering `bbox_wgs84` on a north-up raster, or None to read the full raster."""
+    transform = ds.transform
+    if not bbox_wgs84 or ds.crs is None or transform.b or transform.d or not transform.a or not transform.e:
+        return None
+    from rasterio.warp import transform_bounds
+    from rasterio.windows import Window
+
+    west, south, east, north = transform_bounds("EPSG:4326", ds.crs, *[float(value) for value in bbox_wgs84], densify_pts=21)
+    cols = sorted(((west - transform.c) / transform.a, (east - transform.c) / transform.a))
+    rows = sorted(((north - transform.f) / transform.e, (south - transform.f) / transform.e))
+    col_start = max(0, int(math.floor(cols[0] + WINDOW_EDGE_TOLERANCE)))
+    col_stop = min(ds.width, int(math.ceil(cols[1] - WINDOW_EDGE_TOLERANCE)))
+    row_start = max(0, int(math.floor(rows[0] + WINDOW_EDGE_TOLERANCE)))
+    row_stop = min(ds.height, int(math.ceil(rows[1] - WINDOW_EDGE_TOLERANCE)))
+    if col_stop - col_start < 2 or row_stop - row_start < 2:
+        raise DemLoadError(f"The requested bbox {list(bbox_wgs84)} covers fewer than 2x2 cells of {Path(ds.name).name}.")
+    if col_start == 0 and row_start == 0 and col_stop == ds.width and row_stop == ds.height:
+        return None
+    return Window(col_start, row_start, col_stop - col_start, row_stop - row_start)
+
+
+def read_block_reduced(ds: Any, window: Any, stride: int, method: str, inverted: bool = False) -> np.ndarray:
+    """Read band 1 in full-resolution row strips and block-reduce each strip as it arrives.
+
+    `inverted` says the values are sign-flipped after loading, which `min_depth` has to account for.
+    """
+    from rasterio.windows import Window
+
+    row_off = int(window.row_off) if window is not None else 0
+    col_off = int(window.col_off) if window is not None else 0
+    rows = int(window.height) if window is not None else ds.height
+    cols = int(window.width) if window is not None else ds.width
+    out_cols = math.ceil(cols / stride)
+    strip_rows = stride * max(1, DOWNSAMPLE_TILE_CELLS // (stride * stride * out_cols))
+    strips = []
+    for start in range(0, rows, strip_rows):
+        strip = ds.read(1, window=Window(col_off, row_off + start, cols, min(strip_rows, rows - start)), out_dtype="float32")
+        if ds.nodata is not None:
+            strip[strip == ds.nodata] = np.nan
+        strips.append(block_reduce(strip, stride, method, inverted=inverted))
+    return np.concatenate(strips, axis=0).astype(np.float32, copy=False)
+
+
+def read_decimation(rows: int, cols: int, max_cells: int) -> int:
+    """Smallest integer stride whose strided shape fits in `max_cells` (1 when no limit applies)."""
+    if max_cells <= 0 or rows * cols <= max_cells:
+        return 1
+    stride = int(math.ceil(math.sqrt(rows * cols / max_cells)))
+    while math.ceil(rows / stride) * math.ceil(cols / stride) > max_cells:
+        stride += 1
+    return stride
+
+
 def is_likely_image_geotiff(band_count: int, dtypes: list[str], colorinterp: list[str], units: list[str | None]) -> bool:
     color_names = {name.lower() for name in colorinterp}
     if band_count >= 3 and {"red", "green", "blue"}.issubset(color_names):
@@ -107,27 +268,17 @@ def is_likely_image_geotiff(band_count: int, dtypes: list[str], colorinterp: lis
 
 
 def load_ascii_grid(path: Path) -> DemGrid:
-    lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    header: dict[str, float] = {}
-    data_start = 0
-    for idx, line in enumerate(lines[:20]):
-        parts = line.strip().split()
-        if len(parts) < 2:
-            continue
-        key = parts[0].lower()
-        if key in {"ncols", "nrows", "xllcorner", "yllcorner", "xllcenter", "yllcenter", "cellsize", "nodata_value"}:
-            header[key] = float(parts[1])
-            data_start = idx + 1
-    required = {"ncols", "nrows", "cellsize"}
-    if not required.issubset(header):
-        raise DemLoadError("Missing ESRI ASCII grid header fields.")
-    z = np.loadtxt(lines[data_start:], dtype=np.float32)
-    expected = (int(header["nrows"]), int(header["ncols"]))
-    if z.shape != expected:
-        raise DemLoadError(f"ASCII grid shape mismatch: expected {expected}, got {z.shape}")
+    """Load an ESRI ASCII grid by parsing the header lines, then streaming the body into a float32 array."""
+    with path.open("rb") as fh:
+        header = read_ascii_grid_header(fh)
+        required = {"ncols", "nrows", "cellsize"}
+        if not required.issubset(header):
+            raise DemLoadError("Missing ESRI ASCII grid header fields.")
+        expected = (int(header["nrows"]), int(header["ncols"]))
+        z = read_ascii_grid_body(fh, expected)
     nodata = header.get("nodata_value")
     if nodata is not None:
-        z = np.where(z == nodata, np.nan, z)
+        z[z == np.float32(nodata)] = np.nan
     dx = float(header["cellsize"])
     x0 = header.get("xllcorner", header.get("xllcenter"))
     yll = header.get("yllcorner", header.get("yllcenter"))
@@ -137,42 +288,129 @@ def load_ascii_grid(path: Path) -> DemGrid:
     return grid
 
 
-def load_text(path: Path) -> DemGrid:
-    arr = None
-    for delimiter in (None, ",", ";", "\t"):
-        try:
-            candidate = np.genfromtxt(path, delimiter=delimiter, comments="#", dtype=np.float64)
-            if candidate.size and np.isfinite(candidate).any():
-                arr = candidate
+def read_ascii_grid_header(fh: Any) -> dict[str, float]:
+    """Read header lines and leave `fh` positioned at the first data line."""
+    header: dict[str, float] = {}
+    for _ in range(20):
+        position = fh.tell()
+        parts = fh.readline().decode("utf-8", errors="ignore").split()
+        if not parts:
+            if fh.tell() == position:
                 break
-        except Exception:
-            pass
+            continue
+        key = parts[0].lower()
+        if key not in ASCII_GRID_HEADER_KEYS or len(parts) < 2:
+            fh.seek(position)
+            break
+        header[key] = float(parts[1])
+    return header
+
+
+def read_ascii_grid_body(fh: Any, shape: tuple[int, int], block_bytes: int = ASCII_GRID_BLOCK_BYTES) -> np.ndarray:
+    """Parse the grid body in large blocks of whole lines straight into a preallocated float32 array.
+
+    Each block goes through `np.loadtxt`, so values and row-length checks match a whole-file
+    `np.loadtxt(..., dtype=np.float32)` while only one block of text is held at a time.
+    """
+    z = np.empty(shape, dtype=np.float32)
+    filled = 0
+    carry = b""
+    while True:
+        block = fh.read(block_bytes)
+        text = carry + block
+        if block:
+            cut = text.rfind(b"\n") + 1
+            text, carry = text[:cut], text[cut:]
+        if text.strip():
+            try:
+                rows = np.loadtxt(text.decode("utf-8", errors="ignore").splitlines(), dtype=np.float32, ndmin=2)
+            except ValueError as exc:
+                raise DemLoadError(f"Could not parse ESRI ASCII grid values: {exc}") from exc
+            if rows.shape[1] != shape[1] or filled + rows.shape[0] > shape[0]:
+                raise DemLoadError(f"ASCII grid shape mismatch: expected {shape}, got rows of {rows.shape[1]} values past row {filled}")
+            z[filled : filled + rows.shape[0]] = rows
+            filled += rows.shape[0]
+        if not block:
+            break
+    if filled != shape[0]:
+        raise DemLoadError(f"ASCII grid shape mismatch: expected {shape}, got {(filled, shape[1])}")
+    return z
+
+
+def load_text(path: Path) -> DemGrid:
+    delimiter, header_rows = sniff_text_layout(path)
+    layout = {"delimiter": delimiter, "header_rows": header_rows, "reader": "loadtxt"}
+    try:
+        arr = np.loadtxt(path, delimiter=delimiter, comments="#", skiprows=header_rows, dtype=np.float64, ndmin=2)
+        if not arr.size or not np.isfinite(arr).any():
+            arr = None
+    except ValueError:
+        arr = None
+    if arr is None:
+        # Missing fields, ragged rows, or an unexpected layout: fall back to the tolerant reader.
+        layout["reader"] = "genfromtxt"
+        for candidate_delimiter in dict.fromkeys((delimiter, None, ",", ";", "\t")):
+            try:
+                candidate = np.genfromtxt(path, delimiter=candidate_delimiter, comments="#", dtype=np.float64)
+                if candidate.size and np.isfinite(candidate).any():
+                    arr = candidate
+                    layout["delimiter"] = candidate_delimiter
+                    layout["header_rows"] = 0
+                    break
+            except Exception:
+                pass
     if arr is None:
         raise DemLoadError("Could not parse numeric text.")
     arr = np.asarray(arr)
     if arr.ndim == 2 and arr.shape[1] == 3 and arr.shape[0] > 3:
-        return xyz_to_grid(arr, path)
+        grid = xyz_to_grid(arr, path)
+        grid.metadata["text_layout"] = layout
+        return grid
     if arr.ndim == 2 and arr.shape[0] >= 2 and arr.shape[1] >= 2:
         grid = DemGrid(z=arr.astype(np.float32))
+        grid.metadata["text_layout"] = layout
         grid.add_history("load_text_or_xyz", file=path.name, interpretation="2D matrix")
         return grid
     raise DemLoadError(f"Unsupported numeric text shape: {arr.shape}")
 
 
+def sniff_text_layout(path: Path) -> tuple[str | None, int]:
+    """Guess the delimiter and the number of leading non-numeric lines from the start of a text file.
+
+    Returns `(delimiter, skip_lines)` for `np.loadtxt`; `None` means whitespace-delimited.
+    """
+    with path.open("rb") as fh:
+        sample = fh.read(TEXT_SNIFF_BYTES)
+    lines = sample.decode("utf-8", errors="ignore").splitlines()
+    if len(sample) == TEXT_SNIFF_BYTES and len(lines) > 1:
+        lines = lines[:-1]
+    data_lines = [(index, line.strip()) for index, line in enumerate(lines) if line.strip() and not line.lstrip().startswith("#")]
+    sample_lines = [line for _index, line in data_lines[:TEXT_SNIFF_LINES]]
+    delimiter = None
+    for candidate in TEXT_DELIMITERS:
+        counts = {line.count(candidate) for line in sample_lines[1:] or sample_lines}
+        if len(counts) == 1 and counts.pop() > 0:
+            delimiter = candidate
+            break
+    skip_lines = 0
+    for index, line in data_lines:
+        fields = [field for field in (line.split(delimiter) if delimiter else line.split()) if field.strip()]
+        try:
+            [float(field) for field in fields]
+        except ValueError:
+            skip_lines = index + 1
+            continue
+        break
+    return delimiter, skip_lines
+
+
 def xyz_to_grid(arr: np.ndarray, path: Path) -> DemGrid:
     arr = arr[np.all(np.isfinite(arr), axis=1)]
-    xvals = np.unique(arr[:, 0])
-    yvals = np.unique(arr[:, 1])
+    xvals, yvals, z = points_to_grid(arr[:, 0], arr[:, 1], arr[:, 2], dtype=np.float32)
     if xvals.size * yvals.size != arr.shape[0]:
         raise DemLoadError("XYZ points do not form a complete regular grid.")
-    xvals.sort()
-    yvals.sort()
     y_desc = yvals[::-1]
-    xi = {float(v): i for i, v in enumerate(xvals)}
-    yi = {float(v): i for i, v in enumerate(y_desc)}
-    z = np.full((y_desc.size, xvals.size), np.nan, dtype=np.float32)
-    for x, y, elev in arr:
-        z[yi[float(y)], xi[float(x)]] = elev
+    z = z[::-1]
     grid = DemGrid(
         z=z,
         x=xvals,
@@ -187,6 +425,12 @@ def xyz_to_grid(arr: np.ndarray, path: Path) -> DemGrid:
 
 
 def load_netcdf(path: Path, options: dict) -> DemGrid:
+    """Load one 2D variable of a NetCDF file, reading only the AOI window at the needed stride.
+
+    The variable stays lazy until a window is chosen from its 1D coordinates: `read_bbox_wgs84`
+    (or the DEM request's `aoi_bbox_wgs84`) crops geographic grids, and the stride is the coarser of
+    what `target_resolution_m` allows and what `max_cells` requires, so global grids never load whole.
+    """
     import xarray as xr
 
     variable = (options.get("variable") or "").strip()
@@ -206,10 +450,27 @@ def load_netcdf(path: Path, options: dict) -> DemGrid:
                 raise DemLoadError("No numeric 2D variable found.")
         if da.ndim > 2:
             da = da.isel({dim: 0 for dim in da.dims[:-2]})
-        z = np.asarray(da.values, dtype=np.float32)
         y_dim, x_dim = da.dims[-2], da.dims[-1]
         x = np.asarray(ds[x_dim].values, dtype=np.float64) if x_dim in ds.coords else None
         y = np.asarray(ds[y_dim].values, dtype=np.float64) if y_dim in ds.coords else None
+        rows, cols = da.shape
+        row_slice, col_slice, read = netcdf_read_window(ds, x_dim, y_dim, x, y, options)
+        window_rows = row_slice.stop - row_slice.start
+        window_cols = col_slice.stop - col_slice.start
+        stride = max(
+            netcdf_resolution_stride(x, y, row_slice, col_slice, ds, x_dim, y_dim, options.get("target_resolution_m")),
+            read_decimation(window_rows, window_cols, int(float(options.get("max_cells", DEFAULT_MAX_CELLS) or 0))),
+        )
+        method = downsample_method(options)
+        window = da.isel({y_dim: row_slice, x_dim: col_slice})
+        if stride > 1 and method != "stride":
+            z = read_netcdf_block_reduced(window, stride, method, values_inverted(options))
+            x = downsample_axis(x[col_slice], stride, method) if x is not None else None
+            y = downsample_axis(y[row_slice], stride, method) if y is not None else None
+        else:
+            z = np.asarray(window[::stride, ::stride].values, dtype=np.float32)
+            x = x[col_slice][::stride] if x is not None else None
+            y = y[row_slice][::stride] if y is not None else None
         grid = DemGrid(z=z, x=x, y=y, crs=ds.attrs.get("crs") or ds.attrs.get("spatial_ref"))
         grid.infer_spacing()
         if x is not None and x.size:
@@ -218,9 +479,112 @@ def load_netcdf(path: Path, options: dict) -> DemGrid:
             grid.y0 = float(y[0])
         grid.metadata["netcdf_variable"] = variable
         grid.add_history("load_netcdf", file=path.name, variable=variable)
+        if read or stride > 1:
+            read.update(
+                {
+                    "source_shape": [rows, cols],
+                    "window": [row_slice.start, col_slice.start, window_rows, window_cols],
+                    "decimation": stride,
+                    "downsample_method": method,
+                    "shape": list(z.shape),
+                }
+            )
+            grid.metadata["netcdf_read"] = read
+            grid.add_history("read_netcdf_window", **read)
         return grid
 
 
+def netcdf_read_window(ds: Any, x_dim: str, y_dim: str, x: np.ndarray | None, y: np.ndarray | None, options: dict) -> tuple[slice, slice, dict]:
+    """Return row/column slices covering the requested bbox on a geographic NetCDF grid.
+
+    An explicit `read_bbox_wgs84` that misses the grid is an error, as for GeoTIFFs; the DEM request's
+    `aoi_bbox_wgs84` is only a hint, so a grid it does not overlap (or a projected one) is read whole.
+    """
+    rows = ds.sizes[y_dim]
+    cols = ds.sizes[x_dim]
+    full = (slice(0, rows), slice(0, cols), {})
+    explicit = options.get("read_bbox_wgs84")
+    bbox = explicit or options.get("aoi_bbox_wgs84")
+    if not bbox:
+        return full
+    if x is None or y is None or not (is_geographic_coordinate(ds[x_dim], "lon") and is_geographic_coordinate(ds[y_dim], "lat")):
+        if explicit:
+            raise DemLoadError(f"Cannot crop {x_dim}/{y_dim} to a WGS84 bbox: the NetCDF coordinates are not longitude/latitude.")
+        return (*full[:2], {"bbox_wgs84": list(bbox), "skipped": "non-geographic coordinates"})
+    west, south, east, north = normalize_bbox_wgs84(bbox)
+    if np.nanmax(x) > 180.0 and west < 0.0:
+        west += 360.0
+        east += 360.0
+    col_range = coordinate_index_range(x, west, east)
+    row_range = coordinate_index_range(y, south, north)
+    if col_range is None or row_range is None:
+        if explicit:
+            raise DemLoadError(f"The requested bbox {list(bbox)} covers fewer than 2x2 cells of the NetCDF grid.")
+        return (*full[:2], {"bbox_wgs84": list(bbox), "skipped": "bbox outside grid"})
+    return slice(*row_range), slice(*col_range), {"bbox_wgs84": list(bbox)}
+
+
+def coordinate_index_range(axis: np.ndarray, low: float, high: float) -> tuple[int, int] | None:
+    """Index range of a monotonic axis spanning [low, high], padded by one cell on each side."""
+    size = axis.size
+    ascending = size < 2 or axis[-1] >= axis[0]
+    values = axis if ascending else axis[::-1]
+    if size < 2 or high < values[0] or low > values[-1]:
+        return None
+    start = max(0, int(np.searchsorted(values, low, side="right")) - 1)
+    stop = min(size, int(np.searchsorted(values, high, side="left")) + 1)
+    if stop - start < 2:
+        return None
+    return (start, stop) if ascending else (size - stop, size - start)
+
+
+def is_geographic_coordinate(coord: Any, kind: str) -> bool:
+    units = str(coord.attrs.get("units") or "").lower()
+    names = [str(coord.name or "").lower(), str(coord.attrs.get("standard_name") or "").lower()]
+    return "degree" in units or any(name.startswith(kind) for name in names)
+
+
+def netcdf_resolution_stride(
+    x: np.ndarray | None,
+    y: np.ndarray | None,
+    row_slice: slice,
+    col_slice: slice,
+    ds: Any,
+    x_dim: str,
+    y_dim: str,
+    target_resolution_m: Any,
+) -> int:
+    """Largest stride that keeps the grid at least as fine as `target_resolution_m` (1 when unknown)."""
+    try:
+        target = float(target_resolution_m or 0.0)
+    except (TypeError, ValueError):
+        return 1
+    if target <= 0.0 or x is None or y is None or x.size < 2 or y.size < 2:
+        return 1
+    dx = float(np.median(np.abs(np.diff(x[col_slice])))) if col_slice.stop - col_slice.start > 1 else 0.0
+    dy = float(np.median(np.abs(np.diff(y[row_slice])))) if row_slice.stop - row_slice.start > 1 else 0.0
+    if is_geographic_coordinate(ds[x_dim], "lon") and is_geographic_coordinate(ds[y_dim], "lat"):
+        center_lat = float(np.mean(y[row_slice]))
+        dx = lon_degrees_to_meters(dx, center_lat)
+        dy = lat_degrees_to_meters(dy)
+    native = max(dx, dy)
+    if native <= 0.0:
+        return 1
+    return max(1, int(math.floor(target / native + WINDOW_EDGE_TOLERANCE)))
+
+
+def read_netcdf_block_reduced(window: Any, stride: int, method: str, inverted: bool = False) -> np.ndarray:
+    """Load a lazy 2D window in row strips and block-reduce each strip as it arrives."""
+    rows, cols = window.shape
+    out_cols = math.ceil(cols / stride)
+    strip_rows = stride * max(1, DOWNSAMPLE_TILE_CELLS // (stride * stride * out_cols))
+    strips = [
+        block_reduce(np.asarray(window[start : start + strip_rows].values, dtype=np.float32), stride, method, inverted=inverted)
+        for start in range(0, rows, strip_rows)
+    ]
+    return np.concatenate(strips, axis=0).astype(np.float32, copy=False)
+
+
 def load_mat(path: Path) -> DemGrid:
     from scipy.io import loadmat
 
@@ -379,8 +743,15 @@ def align_axes_to_matrix(
 
 
 def load_numpy(path: Path) -> DemGrid:
+    """Load a 2D array from `.npy` or `.npz`.
+
+    `.npy` files are memory-mapped read-only, so a float32 array is used in place until a transform
+    needs a private copy (see `DemGrid.writable_z`); other dtypes are converted once on read.
+    """
     if path.suffix.lower() == ".npy":
-        z = np.load(path)
+        z = np.load(path, mmap_mode="r")
+        if z.ndim != 2:
+            raise DemLoadError(f"NPY array must be 2D, got shape {z.shape}.")
     else:
         archive = np.load(path)
         z = None
@@ -391,5 +762,5 @@ def load_numpy(path: Path) -> DemGrid:
         if z is None:
             raise DemLoadError("No 2D array found in NPZ file.")
     grid = DemGrid(z=np.asarray(z, dtype=np.float32))
-    grid.add_history("load_numpy", file=path.name)
+    grid.add_history("load_numpy", file=path.name, memory_mapped=isinstance(z, np.memmap) and not grid.z.flags.writeable)
     return grid
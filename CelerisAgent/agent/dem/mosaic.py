@@ -0,0 +1,433 @@
+from __future__ import annotations
+
+import math
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from agent.dem.loaders import DemLoadError, gdal_path, is_likely_image_geotiff, load_first, read_decimation
+from agent.dem.processing import DEFAULT_MAX_CELLS, DOWNSAMPLE_TILE_CELLS, block_reduce, downsample_method, values_inverted
+from agent.dem.types import DemGrid
+from agent.geo import lat_degrees_to_meters, lon_degrees_to_meters
+
+
+MOSAIC_SUFFIXES = {".tif", ".tiff"}
+MOSAIC_OVERLAP_RULES = ("first", "last", "mean", "min_depth")
+DEFAULT_MOSAIC_OVERLAP = "first"
+DEFAULT_MAX_MOSAIC_WORKERS = 8
+# Tiles whose origin and pixel size agree with the reference lattice to this fraction of a pixel are pasted, not warped.
+LATTICE_TOLERANCE = 1e-6
+
+
+def load_mosaic_or_first(paths: list[Path], options: dict) -> tuple[DemGrid, list[str]]:
+    """Mosaic every usable GeoTIFF tile when there are several, otherwise load the single best file."""
+    tiles, skipped = probe_geotiff_tiles(paths)
+    if len(tiles) < 2:
+        return load_first(paths, options)
+    grid = load_mosaic(tiles, skipped, options)
+    return grid, ["detect_attachment_format", "mosaic_geotiff_tiles"]
+
+
+def probe_geotiff_tiles(paths: list[Path]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Read GeoTIFF headers and keep single-surface, north-up, georeferenced tiles in name order."""
+    import rasterio
+
+    tiles: list[dict[str, Any]] = []
+    skipped: list[dict[str, Any]] = []
+    for path in sorted((p for p in paths if p.suffix.lower() in MOSAIC_SUFFIXES), key=lambda p: p.name.lower()):
+        try:
+            with rasterio.open(gdal_path(path)) as ds:
+                transform = ds.transform
+                dtypes = [str(value) for value in ds.dtypes]
+                colorinterp = [interp.name for interp in ds.colorinterp]
+                units = [value for value in ds.units]
+                tile = {
+                    "path": path,
+                    "crs": ds.crs.to_string() if ds.crs else None,
+                    "transform": (transform.a, transform.b, transform.c, transform.d, transform.e, transform.f),
+                    "width": ds.width,
+                    "height": ds.height,
+                    "geotiff": {
+                        "band_count": ds.count,
+                        "dtypes": dtypes,
+                        "color_interpretation": colorinterp,
+                        "descriptions": list(ds.descriptions),
+                        "units": units,
+                        "tags": dict(ds.tags()),
+                        "nodata": ds.nodata,
+                        "likely_image": is_likely_image_geotiff(ds.count, dtypes, colorinterp, units),
+                    },
+                }
+        except Exception as exc:
+            skipped.append({"file": path.name, "reason": f"unreadable: {exc}", "failed": True})
+            continue
+        a, b, _c, d, e, _f = tile["transform"]
+        if tile["geotiff"]["likely_image"]:
+            skipped.append({"file": path.name, "reason": "image raster"})
+        elif not tile["crs"]:
+            skipped.append({"file": path.name, "reason": "no CRS"})
+        elif b or d or not a or not e:
+            skipped.append({"file": path.name, "reason": "rotated or degenerate transform"})
+        else:
+            xs = (tile["transform"][2], tile["transform"][2] + a * tile["width"])
+            ys = (tile["transform"][5], tile["transform"][5] + e * tile["height"])
+            tile["bounds"] = (min(xs), min(ys), max(xs), max(ys))
+            tiles.append(tile)
+    return tiles, skipped
+
+
+def load_mosaic(tiles: list[dict[str, Any]], skipped: list[dict[str, Any]], options: dict) -> DemGrid:
+    """Merge GeoTIFF tiles onto the pixel lattice of a reference tile in the CRS most tiles share.
+
+    Within that CRS the finest tile, by pixel size in metres, then the largest one is the reference, so
+    only tiles in other CRSs or on other lattices are warped.
+
+    Tiles are read in worker threads, at most one per worker in flight, and each is decimated in
+    row strips before it is merged, so memory follows the output grid plus one strip per worker.
+    Tiles on the reference lattice are block-reduced and pasted; others are warped onto it.
+    Overlaps follow `mosaic_overlap`: `first`/`last` keep the earliest/latest tile in name order,
+    `mean` averages, and `min_depth` keeps the highest elevation. Both `min_depth` rules run on the
+    values as read, so they keep the lowest raw value when `apply_options` will flip the sign later.
+
+    Tiles left out on purpose (image rasters, no CRS, outside the read bbox) are only listed in
+    `skipped`. Tiles that should have contributed but could not be read or warped are also marked
+    `failed`, and `failed_tiles` records how much of the mosaic is NaN inside their footprints;
+    `validation.validate` turns that into a `MOSAIC_TILES_MISSING` warning.
+    """
+    started = time.perf_counter()
+    overlap = mosaic_overlap(options)
+    method = downsample_method(options)
+    reference = reference_tile(tiles)
+    a, _b, c, _d, e, f = reference["transform"]
+    bounds = mosaic_bounds(tiles, reference["crs"], options.get("read_bbox_wgs84"), skipped)
+    if bounds is None:
+        raise DemLoadError("None of the GeoTIFF tiles overlap the requested bbox.")
+    west, south, east, north, tiles = bounds
+    col0 = math.floor((west - c) / a + LATTICE_TOLERANCE)
+    col1 = math.ceil((east - c) / a - LATTICE_TOLERANCE)
+    row0 = math.floor((north - f) / e + LATTICE_TOLERANCE)
+    row1 = math.ceil((south - f) / e - LATTICE_TOLERANCE)
+    rows, cols = row1 - row0, col1 - col0
+    stride = read_decimation(rows, cols, int(float(options.get("max_cells", DEFAULT_MAX_CELLS) or 0)))
+    lattice = {
+        "x0": c + col0 * a,
+        "y0": f + row0 * e,
+        "a": a,
+        "e": e,
+        "rows": rows,
+        "cols": cols,
+        "stride": stride,
+        "crs": reference["crs"],
+        "inverted": values_inverted(options),
+    }
+    merger = MosaicMerger((math.ceil(rows / stride), math.ceil(cols / stride)), overlap, lattice["inverted"])
+    workers = mosaic_worker_count(len(tiles))
+    reprojected: list[str] = []
+    merged: list[str] = []
+    failed: list[dict[str, Any]] = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        queue = list(enumerate(tiles))
+        pending: dict[Any, tuple[int, dict[str, Any]]] = {}
+        while queue or pending:
+            while queue and len(pending) < workers:
+                rank, tile = queue.pop(0)
+                pending[executor.submit(read_mosaic_tile, tile, lattice, method)] = (rank, tile)
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                rank, tile = pending.pop(future)
+                try:
+                    out_row, out_col, block, warped = future.result()
+                except Exception as exc:
+                    skipped.append({"file": tile["path"].name, "reason": f"read failed: {exc}", "failed": True})
+                    failed.append(tile)
+                    continue
+                merger.add(rank, out_row, out_col, block)
+                merged.append(tile["path"].name)
+                if warped:
+                    reprojected.append(tile["path"].name)
+    if not merged:
+        raise DemLoadError("; ".join(f"{item['file']}: {item['reason']}" for item in skipped) or "No GeoTIFF tile could be read.")
+
+    z = merger.result()
+    grid = DemGrid(
+        z=z,
+        dx=abs(a * stride),
+        dy=abs(e * stride),
+        x0=float(lattice["x0"]),
+        y0=float(lattice["y0"]),
+        crs=reference["crs"],
+    )
+    grid.source_files.extend(str(tile["path"]) for tile in tiles if tile["path"].name in merged)
+    grid.metadata["geotiff"] = dict(reference["geotiff"])
+    grid.metadata["mosaic"] = {
+        "tiles": sorted(merged),
+        "skipped": skipped,
+        "reprojected": sorted(reprojected),
+        "failed_tiles": failed_tile_summary(skipped, failed, lattice, z),
+        "reference_tile": reference["path"].name,
+        "overlap": overlap,
+        "decimation": stride,
+        "downsample_method": method,
+        "source_shape": [rows, cols],
+        "shape": list(z.shape),
+        "workers": workers,
+        "elapsed_s": time.perf_counter() - started,
+    }
+    units = reference["geotiff"]["units"]
+    if any(unit and unit.lower() in {"meter", "metre", "meters", "metres", "m"} for unit in units):
+        grid.z_units = "meters"
+    grid.add_history(
+        "mosaic_geotiff_tiles",
+        tiles=sorted(merged),
+        skipped=[item["file"] for item in skipped],
+        reprojected=sorted(reprojected),
+        failed=[item["file"] for item in skipped if item.get("failed")],
+        overlap=overlap,
+        decimation=stride,
+        shape=list(z.shape),
+    )
+    return grid
+
+
+def failed_tile_summary(
+    skipped: list[dict[str, Any]],
+    failed: list[dict[str, Any]],
+    lattice: dict[str, Any],
+    z: np.ndarray,
+) -> dict[str, Any] | None:
+    """Tiles that failed to read or warp and the NaN cells of the output grid inside their footprints.
+
+    Tiles whose header could not be read have no known footprint, so they are listed without cells.
+    """
+    files = [item["file"] for item in skipped if item.get("failed")]
+    if not files:
+        return None
+    footprint = np.zeros(z.shape, dtype=bool)
+    for tile in failed:
+        row0, row1, col0, col1 = output_window(tile["target_bounds"], lattice)
+        footprint[row0:row1, col0:col1] = True
+    missing_cells = int(np.count_nonzero(footprint & ~np.isfinite(z)))
+    return {
+        "files": files,
+        "unknown_footprint": [name for name in files if name not in {tile["path"].name for tile in failed}],
+        "missing_cells": missing_cells,
+        "missing_fraction": missing_cells / z.size if z.size else 0.0,
+    }
+
+
+def output_window(bounds: tuple[float, float, float, float], lattice: dict[str, Any]) -> tuple[int, int, int, int]:
+    """Output `(row0, row1, col0, col1)` covered by bounds in the lattice CRS, clipped to the grid."""
+    stride = lattice["stride"]
+    cell_x = lattice["a"] * stride
+    cell_y = lattice["e"] * stride
+    west, south, east, north = bounds
+    col0 = max(0, math.floor((west - lattice["x0"]) / cell_x + LATTICE_TOLERANCE))
+    col1 = min(math.ceil(lattice["cols"] / stride), math.ceil((east - lattice["x0"]) / cell_x - LATTICE_TOLERANCE))
+    row0 = max(0, math.floor((north - lattice["y0"]) / cell_y + LATTICE_TOLERANCE))
+    row1 = min(math.ceil(lattice["rows"] / stride), math.ceil((south - lattice["y0"]) / cell_y - LATTICE_TOLERANCE))
+    return row0, row1, col0, col1
+
+
+def reference_tile(tiles: list[dict[str, Any]]) -> dict[str, Any]:
+    """The tile whose lattice the mosaic uses: majority CRS first, then finest metric pixel, then largest."""
+    crs_counts: dict[str, int] = {}
+    for tile in tiles:
+        crs_counts[tile["crs"]] = crs_counts.get(tile["crs"], 0) + 1
+    return min(tiles, key=lambda tile: (-crs_counts[tile["crs"]], pixel_size_m(tile), -tile["width"] * tile["height"]))
+
+
+def pixel_size_m(tile: dict[str, Any]) -> float:
+    """Larger pixel side in metres, so tiles in degrees, metres, and feet compare on one scale."""
+    from rasterio.crs import CRS
+
+    a, e = abs(tile["transform"][0]), abs(tile["transform"][4])
+    crs = CRS.from_user_input(tile["crs"])
+    if crs.is_geographic:
+        west, south, east, north = tile["bounds"]
+        return max(lon_degrees_to_meters(a, 0.5 * (south + north)), lat_degrees_to_meters(e))
+    try:
+        _name, factor = crs.linear_units_factor
+    except Exception:
+        factor = 1.0
+    return max(a, e) * float(factor)
+
+
+def mosaic_overlap(options: dict) -> str:
+    rule = str(options.get("mosaic_overlap") or DEFAULT_MOSAIC_OVERLAP).strip().lower()
+    if rule not in MOSAIC_OVERLAP_RULES:
+        raise ValueError(f"Unsupported mosaic_overlap {rule!r}; expected one of {', '.join(MOSAIC_OVERLAP_RULES)}.")
+    return rule
+
+
+def mosaic_worker_count(tile_count: int) -> int:
+    raw = os.environ.get("CELERIS_MOSAIC_WORKERS")
+    try:
+        requested = int(raw) if raw else min(os.cpu_count() or 1, DEFAULT_MAX_MOSAIC_WORKERS)
+    except ValueError:
+        requested = 1
+    return max(1, min(requested, tile_count))
+
+
+def mosaic_bounds(
+    tiles: list[dict[str, Any]],
+    crs: str,
+    bbox_wgs84: Any,
+    skipped: list[dict[str, Any]],
+) -> tuple[float, float, float, float, list[dict[str, Any]]] | None:
+    """Union of tile bounds in the reference CRS, clipped to `bbox_wgs84`; drops tiles outside it."""
+    from rasterio.warp import transform_bounds
+
+    clip = transform_bounds("EPSG:4326", crs, *[float(value) for value in bbox_wgs84], densify_pts=21) if bbox_wgs84 else None
+    kept: list[dict[str, Any]] = []
+    union: list[float] | None = None
+    for tile in tiles:
+        west, south, east, north = tile["bounds"] if tile["crs"] == crs else transform_bounds(tile["crs"], crs, *tile["bounds"], densify_pts=21)
+        if clip is not None:
+            west, south, east, north = max(west, clip[0]), max(south, clip[1]), min(east, clip[2]), min(north, clip[3])
+            if west >= east or south >= north:
+                skipped.append({"file": tile["path"].name, "reason": "outside read bbox"})
+                continue
+        tile["target_bounds"] = (west, south, east, north)
+        kept.append(tile)
+        union = [west, south, east, north] if union is None else [min(union[0], west), min(union[1], south), max(union[2], east), max(union[3], north)]
+    if union is None:
+        return None
+    return (*union, kept)
+
+
+def read_mosaic_tile(tile: dict[str, Any], lattice: dict[str, Any], method: str) -> tuple[int, int, np.ndarray, bool]:
+    """Return `(out_row, out_col, block, warped)` for one tile on the output lattice."""
+    import rasterio
+
+    with rasterio.open(gdal_path(tile["path"])) as ds:
+        offsets = lattice_offsets(tile, lattice)
+        if offsets is None:
+            return (*warp_tile(ds, tile, lattice, method), True)
+        return (*read_aligned_tile(ds, offsets, lattice, method), False)
+
+
+def lattice_offsets(tile: dict[str, Any], lattice: dict[str, Any]) -> tuple[int, int] | None:
+    """Full-resolution (row, col) of the tile origin on the lattice, or None if the tile needs warping."""
+    a, _b, c, _d, e, f = tile["transform"]
+    if tile["crs"] != lattice["crs"]:
+        return None
+    if abs(a - lattice["a"]) > LATTICE_TOLERANCE * abs(lattice["a"]) or abs(e - lattice["e"]) > LATTICE_TOLERANCE * abs(lattice["e"]):
+        return None
+    col = (c - lattice["x0"]) / lattice["a"]
+    row = (f - lattice["y0"]) / lattice["e"]
+    if abs(col - round(col)) > LATTICE_TOLERANCE or abs(row - round(row)) > LATTICE_TOLERANCE:
+        return None
+    return int(round(row)), int(round(col))
+
+
+def read_aligned_tile(ds: Any, offsets: tuple[int, int], lattice: dict[str, Any], method: str) -> tuple[int, int, np.ndarray]:
+    """Read the tile part inside the lattice in row strips and reduce each strip onto the output blocks.
+
+    Strips are padded with NaN to whole blocks, so a block shared with a neighbouring tile is reduced
+    over this tile's cells only and the overlap rule combines the partial results.
+    """
+    from rasterio.windows import Window
+
+    stride = lattice["stride"]
+    tile_row, tile_col = offsets
+    row_start, row_stop = max(0, tile_row), min(lattice["rows"], tile_row + ds.height)
+    col_start, col_stop = max(0, tile_col), min(lattice["cols"], tile_col + ds.width)
+    out_row, out_col = row_start // stride, col_start // stride
+    out_rows = math.ceil(row_stop / stride) - out_row
+    out_cols = math.ceil(col_stop / stride) - out_col
+    block = np.empty((out_rows, out_cols), dtype=np.float32)
+    strip_blocks = max(1, DOWNSAMPLE_TILE_CELLS // (stride * stride * out_cols))
+    for first in range(0, out_rows, strip_blocks):
+        count = min(strip_blocks, out_rows - first)
+        lattice_row = (out_row + first) * stride
+        read_start = max(row_start, lattice_row)
+        read_stop = min(row_stop, lattice_row + count * stride)
+        values = ds.read(
+            1,
+            window=Window(col_start - tile_col, read_start - tile_row, col_stop - col_start, read_stop - read_start),
+            out_dtype="float32",
+        )
+        if ds.nodata is not None:
+            values[values == ds.nodata] = np.nan
+        if stride == 1:
+            block[first : first + count] = values
+            continue
+        padded = np.full((count * stride, out_cols * stride), np.nan, dtype=np.float32)
+        pad_col = col_start - out_col * stride
+        padded[read_start - lattice_row : read_stop - lattice_row, pad_col : pad_col + values.shape[1]] = values
+        block[first : first + count] = padded[::stride, ::stride] if method == "stride" else block_reduce(padded, stride, method, inverted=lattice["inverted"])
+    return out_row, out_col, block
+
+
+def warp_tile(ds: Any, tile: dict[str, Any], lattice: dict[str, Any], method: str) -> tuple[int, int, np.ndarray]:
+    """Warp a tile in another CRS, resolution, or lattice phase onto the output cells it covers."""
+    from affine import Affine
+    import rasterio
+    from rasterio.enums import Resampling
+    from rasterio.warp import reproject
+
+    stride = lattice["stride"]
+    cell_x = lattice["a"] * stride
+    cell_y = lattice["e"] * stride
+    row0, row1, col0, col1 = output_window(tile["target_bounds"], lattice)
+    block = np.full((max(row1 - row0, 0), max(col1 - col0, 0)), np.nan, dtype=np.float32)
+    if block.size:
+        source_cell = max(abs(tile["transform"][0]), abs(tile["transform"][4]))
+        coarser = tile["crs"] == lattice["crs"] and min(abs(cell_x), abs(cell_y)) > source_cell * (1.0 + LATTICE_TOLERANCE)
+        if not coarser or method == "stride":
+            resampling = Resampling.bilinear
+        elif method == "min_depth":
+            resampling = Resampling.min if lattice["inverted"] else Resampling.max
+        else:
+            resampling = Resampling.average
+        reproject(
+            source=rasterio.band(ds, 1),
+            destination=block,
+            src_nodata=ds.nodata,
+            dst_transform=Affine(cell_x, 0.0, lattice["x0"] + col0 * cell_x, 0.0, cell_y, lattice["y0"] + row0 * cell_y),
+            dst_crs=lattice["crs"],
+            dst_nodata=np.nan,
+            resampling=resampling,
+        )
+    return row0, col0, block
+
+
+class MosaicMerger:
+    """Accumulate tile blocks into one output grid under an overlap rule, in any completion order."""
+
+    def __init__(self, shape: tuple[int, int], overlap: str, inverted: bool = False) -> None:
+        self.overlap = overlap
+        self.inverted = inverted
+        if overlap == "mean":
+            self.total = np.zeros(shape, dtype=np.float64)
+            self.count = np.zeros(shape, dtype=np.uint16)
+        else:
+            self.z = np.full(shape, np.nan, dtype=np.float32)
+        if overlap in {"first", "last"}:
+            self.rank = np.full(shape, -1, dtype=np.int32)
+
+    def add(self, rank: int, out_row: int, out_col: int, block: np.ndarray) -> None:
+        window = (slice(out_row, out_row + block.shape[0]), slice(out_col, out_col + block.shape[1]))
+        finite = np.isfinite(block)
+        if self.overlap == "mean":
+            self.total[window][finite] += block[finite]
+            self.count[window][finite] += 1
+        elif self.overlap == "min_depth":
+            (np.fmin if self.inverted else np.fmax)(self.z[window], block, out=self.z[window])
+        else:
+            ranks = self.rank[window]
+            take = finite & ((ranks < 0) | (ranks > rank if self.overlap == "first" else ranks < rank))
+            self.z[window][take] = block[take]
+            ranks[take] = rank
+
+    def result(self) -> np.ndarray:
+        if self.overlap != "mean":
+            return self.z
+        z = np.full(self.total.shape, np.nan, dtype=np.float32)
+        covered = self.count > 0
+        z[covered] = self.total[covered] / self.count[covered]
+        return z
@@ -1,21 +1,29 @@
 from __future__ import annotations
 
 import math
+import warnings
 
 import numpy as np
 
 from agent.dem.types import DemGrid
 
 
+DEFAULT_MAX_CELLS = 1_500_000
+DOWNSAMPLE_METHODS = ("stride", "mean", "median", "min_depth")
+DOWNSAMPLE_TILE_CELLS = 1_048_576
+
+
 def apply_options(grid: DemGrid, options: dict) -> DemGrid:
     sign_mode = (options.get("sign_mode") or "auto").lower()
     if sign_mode == "invert":
-        grid.z = -grid.z
+        z = grid.writable_z()
+        np.negative(z, out=z)
         grid.add_history("apply_options", sign_mode="invert")
 
     z_scale = _float(options.get("z_scale"), 1.0)
     if z_scale != 1.0:
-        grid.z = grid.z * z_scale
+        z = grid.writable_z()
+        z *= z_scale
         grid.add_history("apply_options", z_scale=z_scale)
 
     if options.get("vertical_datum"):
@@ -31,9 +39,9 @@ def apply_options(grid: DemGrid, options: dict) -> DemGrid:
     if options.get("output_grid") == "local_meters":
         localize_grid_to_meters(grid, options)
 
-    max_cells = int(_float(options.get("max_cells"), 1_500_000))
+    max_cells = int(_float(options.get("max_cells"), DEFAULT_MAX_CELLS))
     if max_cells > 0 and grid.cell_count > max_cells:
-        downsample(grid, max_cells)
+        downsample(grid, max_cells, downsample_method(options))
 
     return grid
 
@@ -65,24 +73,94 @@ def fill_nodata(grid: DemGrid) -> None:
     from scipy import ndimage
 
     idx = ndimage.distance_transform_edt(mask, return_distances=False, return_indices=True)
-    grid.z = grid.z[tuple(idx)]
+    z = grid.writable_z()
+    z[mask] = z[tuple(axis[mask] for axis in idx)]
     grid.add_history("fill_nodata", method="nearest_finite")
 
 
-def downsample(grid: DemGrid, max_cells: int) -> None:
+def downsample_method(options: dict) -> str:
+    method = str(options.get("downsample_method") or "stride").strip().lower()
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Unsupported downsample_method {method!r}; expected one of {', '.join(DOWNSAMPLE_METHODS)}.")
+    return method
+
+
+def values_inverted(options: dict) -> bool:
+    """True when `apply_options` will flip the sign of the values as read, via `sign_mode` or a negative `z_scale`.
+
+    Reductions applied while reading run before that flip, so `min_depth` must keep the lowest raw value then.
+    """
+    inverted = (options.get("sign_mode") or "auto").lower() == "invert"
+    return inverted != (_float(options.get("z_scale"), 1.0) < 0)
+
+
+def downsample(grid: DemGrid, max_cells: int, method: str = "stride") -> None:
+    """Reduce the grid by an integer stride so it fits in `max_cells`.
+
+    `stride` keeps every stride-th cell. `mean`, `median`, and `min_depth` reduce each stride x stride
+    block over its finite cells; `min_depth` keeps the highest elevation, so shoals and crests survive.
+    """
     stride = int(math.ceil(math.sqrt(grid.cell_count / max_cells)))
     if stride <= 1:
         return
-    grid.z = grid.z[::stride, ::stride]
+    grid.z = grid.z[::stride, ::stride] if method == "stride" else block_reduce(grid.z, stride, method)
     if grid.x is not None:
-        grid.x = grid.x[::stride]
+        grid.x = downsample_axis(grid.x, stride, method)
     if grid.y is not None:
-        grid.y = grid.y[::stride]
+        grid.y = downsample_axis(grid.y, stride, method)
+    if grid.lon is not None and grid.lon.ndim == 1:
+        grid.lon = downsample_axis(grid.lon, stride, method)
+    if grid.lat is not None and grid.lat.ndim == 1:
+        grid.lat = downsample_axis(grid.lat, stride, method)
     if grid.dx:
         grid.dx *= stride
     if grid.dy:
         grid.dy *= stride
-    grid.add_history("downsample", stride=stride, max_cells=max_cells, shape=list(grid.z.shape))
+    grid.add_history("downsample", method=method, stride=stride, max_cells=max_cells, shape=list(grid.z.shape))
+
+
+def downsample_axis(axis: np.ndarray, stride: int, method: str) -> np.ndarray:
+    """Stride an axis, or take block centres to match a block-reduced grid."""
+    if method == "stride":
+        return axis[::stride]
+    return block_reduce(axis[None, :], (1, stride), "mean")[0]
+
+
+def block_reduce(
+    values: np.ndarray,
+    stride: int | tuple[int, int],
+    method: str,
+    tile_cells: int = DOWNSAMPLE_TILE_CELLS,
+    *,
+    inverted: bool = False,
+) -> np.ndarray:
+    """Reduce non-overlapping blocks of a 2D array, ignoring NaN, one tile of block rows at a time.
+
+    Edge blocks that extend past the array are reduced over the cells they contain, so the output
+    has the same shape as `values[::row_stride, ::col_stride]`. Blocks with no finite cells are NaN.
+    `inverted` marks values whose sign is flipped later (see `values_inverted`), so `min_depth`
+    keeps the block minimum, which becomes the highest elevation.
+    """
+    row_stride, col_stride = (stride, stride) if isinstance(stride, int) else stride
+    reducer = {"mean": np.nanmean, "median": np.nanmedian, "min_depth": np.nanmin if inverted else np.nanmax}[method]
+    rows, cols = values.shape
+    out_rows = -(-rows // row_stride)
+    out_cols = -(-cols // col_stride)
+    dtype = np.result_type(values.dtype, np.float32)
+    out = np.empty((out_rows, out_cols), dtype=dtype)
+    tile_rows = max(1, tile_cells // max(row_stride * out_cols * col_stride, 1))
+    for start in range(0, out_rows, tile_rows):
+        source = values[start * row_stride : (start + tile_rows) * row_stride]
+        count = -(-source.shape[0] // row_stride)
+        if source.shape != (count * row_stride, out_cols * col_stride):
+            padded = np.full((count * row_stride, out_cols * col_stride), np.nan, dtype=dtype)
+            padded[: source.shape[0], :cols] = source
+            source = padded
+        blocks = source.reshape(count, row_stride, out_cols, col_stride)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            out[start : start + count] = reducer(blocks, axis=(1, 3))
+    return out
 
 
 def _float(value, default: float) -> float:
@@ -45,6 +45,12 @@ class DemGrid:
     def cell_count(self) -> int:
         return int(self.z.shape[0] * self.z.shape[1])
 
+    def writable_z(self) -> np.ndarray:
+        """Return `z` ready for in-place edits, copying it first if it is a read-only (memory-mapped) array."""
+        if not self.z.flags.writeable:
+            self.z = np.array(self.z, dtype=np.float32)
+        return self.z
+
     def add_history(self, node_id: str, **details: Any) -> None:
         self.history.append({"node_id": node_id, **details})
 
@@ -78,7 +84,7 @@ class DemGrid:
             out["lat_max"] = float(np.nanmax(self.lat))
         if finite.any():
             vals = self.z[finite]
-            out["z_min"] = float(np.nanmin(vals))
-            out["z_max"] = float(np.nanmax(vals))
-            out["z_mean"] = float(np.nanmean(vals))
+            out["z_min"] = float(vals.min())
+            out["z_max"] = float(vals.max())
+            out["z_mean"] = float(vals.mean())
         return out
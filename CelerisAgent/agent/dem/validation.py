@@ -42,6 +42,16 @@ def validate(grid: DemGrid) -> dict[str, Any]:
             },
         )
 
+    failed_tiles = ((grid.metadata or {}).get("mosaic") or {}).get("failed_tiles")
+    if failed_tiles:
+        message = (
+            f"{len(failed_tiles['files'])} GeoTIFF tile(s) that overlap the requested area could not be read or warped and are "
+            f"missing from the mosaic: {', '.join(failed_tiles['files'])}. {failed_tiles['missing_fraction']:.1%} of the mosaic is NaN inside their footprints."
+        )
+        if failed_tiles.get("unknown_footprint"):
+            message += f" The footprint of {', '.join(failed_tiles['unknown_footprint'])} is unknown because its header could not be read."
+        add("warning", "MOSAIC_TILES_MISSING", message, failed_tiles)
+
     finite = np.isfinite(grid.z)
     finite_fraction = float(finite.mean()) if finite.size else 0.0
     if finite_fraction < 0.5:
@@ -7,7 +7,8 @@ from urllib.parse import urlparse
 import requests
 
 from agent.dem.export import export_all
-from agent.dem.loaders import expand_inputs, load_first
+from agent.dem.loaders import expand_inputs
+from agent.dem.mosaic import load_mosaic_or_first
 from agent.dem.processing import apply_options
 from agent.dem.validation import validate
 
@@ -15,7 +16,7 @@ from agent.dem.validation import validate
 def normalize_attachments(job_dir: Path, attachments: list[Path], options: dict) -> dict:
     selected_path: list[str] = []
     expanded = expand_inputs(attachments, job_dir / "work")
-    grid, load_path = load_first(expanded, options)
+    grid, load_path = load_mosaic_or_first(expanded, options)
     selected_path.extend(load_path)
     apply_options(grid, options)
     selected_path.append("normalize_to_canonical_dem")
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Iterator
+
+import numpy as np
+
+from agent.config import CACHE
+from agent.io_utils import read_json, write_json
+
+
+ENTRY_FILE = "entry.json"
+STATS_FILE = "stats.json"
+STAGING_DIR = "_staging"
+
+
+def cache_key(parts: dict[str, Any]) -> str:
+    text = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_file(path: Path, block_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for block in iter(lambda: fh.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def sha256_array(values: Any) -> str | None:
+    if values is None:
+        return None
+    array = np.ascontiguousarray(np.asarray(values, dtype=np.float64))
+    digest = hashlib.sha256(str(array.shape).encode("ascii"))
+    digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def namespace_dir(namespace: str) -> Path:
+    return CACHE / namespace
+
+
+def entry_dir(namespace: str, key: str) -> Path:
+    return namespace_dir(namespace) / key[:2] / key
+
+
+def cache_max_bytes(env_name: str, default: int) -> int:
+    raw = os.environ.get(env_name)
+    if raw:
+        try:
+            value = int(raw)
+            if value >= 0:
+                return value
+        except ValueError:
+            pass
+    return default
+
+
+def lookup_entry(namespace: str, key: str) -> Path | None:
+    """Return a committed cache entry directory and mark it as recently used."""
+    path = entry_dir(namespace, key)
+    marker = path / ENTRY_FILE
+    if not marker.exists():
+        record_cache_event(namespace, "misses")
+        return None
+    touch_entry(path)
+    record_cache_event(namespace, "hits")
+    return path
+
+
+def touch_entry(path: Path) -> None:
+    try:
+        os.utime(path / ENTRY_FILE)
+    except OSError:
+        pass
+
+
+def read_entry(path: Path) -> dict[str, Any]:
+    return read_json(path / ENTRY_FILE)
+
+
+def iter_entries(namespace: str) -> Iterator[tuple[Path, dict[str, Any]]]:
+    """Yield `(entry_dir, metadata)` for every committed entry, for lookups that are not exact key matches."""
+    root = namespace_dir(namespace)
+    if not root.exists():
+        return
+    for marker in root.glob(f"*/*/{ENTRY_FILE}"):
+        if marker.parent.parent.name == STAGING_DIR:
+            continue
+        try:
+            metadata = read_json(marker)
+        except (OSError, json.JSONDecodeError):
+            continue
+        yield marker.parent, metadata
+
+
+def new_staging_dir(namespace: str) -> Path:
+    path = namespace_dir(namespace) / STAGING_DIR / uuid.uuid4().hex
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def commit_entry(namespace: str, key: str, staging: Path, metadata: dict[str, Any], max_bytes: int) -> Path:
+    """Atomically publish a staged entry, then evict least-recently-used entries over `max_bytes`."""
+    write_json(staging / ENTRY_FILE, {**metadata, "key": key, "created_at": time.time()})
+    target = entry_dir(namespace, key)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        staging.rename(target)
+    except OSError:
+        # Another worker committed the same key first; keep its entry.
+        shutil.rmtree(staging, ignore_errors=True)
+    record_cache_event(namespace, "stores")
+    evict_lru(namespace, max_bytes)
+    return target
+
+
+def discard_staging(staging: Path) -> None:
+    shutil.rmtree(staging, ignore_errors=True)
+
+
+def evict_lru(namespace: str, max_bytes: int) -> int:
+    entries = []
+    total = 0
+    root = namespace_dir(namespace)
+    if not root.exists():
+        return 0
+    for marker in root.glob(f"*/*/{ENTRY_FILE}"):
+        if marker.parent.parent.name == STAGING_DIR:
+            continue
+        try:
+            used_at = marker.stat().st_mtime
+            size = sum(item.stat().st_size for item in marker.parent.rglob("*") if item.is_file())
+        except OSError:
+            continue
+        entries.append((used_at, size, marker.parent))
+        total += size
+    evicted = 0
+    for _used_at, size, path in sorted(entries, key=lambda item: item[0]):
+        if total <= max_bytes:
+            break
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
+        evicted += 1
+    if evicted:
+        record_cache_event(namespace, "evictions", evicted)
+    return evicted
+
+
+def record_cache_event(namespace: str, event: str, count: int = 1) -> dict[str, Any]:
+    path = namespace_dir(namespace) / STATS_FILE
+    try:
+        stats = read_json(path, {})
+    except (OSError, json.JSONDecodeError):
+        stats = {}
+    stats[event] = int(stats.get(event) or 0) + count
+    stats["updated_at"] = time.time()
+    try:
+        write_json(path, stats)
+    except OSError:
+        pass
+    return stats
+
+
+def cache_stats(namespace: str) -> dict[str, Any]:
+    try:
+        stats = read_json(namespace_dir(namespace) / STATS_FILE, {})
+    except (OSError, json.JSONDecodeError):
+        stats = {}
+    hits = int(stats.get("hits") or 0)
+    misses = int(stats.get("misses") or 0)
+    return {
+        "hits": hits,
+        "misses": misses,
+        "stores": int(stats.get("stores") or 0),
+        "evictions": int(stats.get("evictions") or 0),
+        "hit_rate": hits / (hits + misses) if hits + misses else None,
+    }
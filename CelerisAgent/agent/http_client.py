@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_TIMEOUT_SECONDS = 60.0
+DEFAULT_MAX_PER_HOST = 6
+DEFAULT_RETRIES = 3
+DEFAULT_POOL_MAXSIZE = 16
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 30.0
+
+_LOCK = threading.Lock()
+_SESSION: requests.Session | None = None
+_SESSION_PID: int | None = None
+_HOST_SLOTS: dict[str, threading.BoundedSemaphore] = {}
+_STATS: dict[str, dict[str, Any]] = {}
+
+
+def http_get(url: str, **kwargs: Any) -> requests.Response:
+    return http_request("GET", url, **kwargs)
+
+
+def http_post(url: str, **kwargs: Any) -> requests.Response:
+    return http_request("POST", url, **kwargs)
+
+
+def http_head(url: str, **kwargs: Any) -> requests.Response:
+    return http_request("HEAD", url, **kwargs)
+
+
+def http_request(method: str, url: str, *, retries: int | None = None, timeout: Any = None, **kwargs: Any) -> requests.Response:
+    """Send a request through the shared keep-alive session.
+
+    Accepts the same keywords as `requests.request`. Connection errors, timeouts, and 429/5xx responses
+    are retried with jittered exponential backoff (honouring `Retry-After`); by default only idempotent
+    methods retry, and `retries=` overrides that for calls known to be safe to repeat. The last retryable
+    response is returned as-is, so callers keep using `raise_for_status()`. Concurrent requests to one host
+    are capped; a streamed response holds its host slot until it is closed.
+    """
+    method = method.upper()
+    attempts = 1 + max(0, retries if retries is not None else (http_retries() if method in IDEMPOTENT_METHODS else 0))
+    host = urlsplit(url).netloc.lower()
+    slot = host_slot(host)
+    stream = bool(kwargs.get("stream"))
+    timeout = DEFAULT_TIMEOUT_SECONDS if timeout is None else timeout
+    for attempt in range(attempts):
+        slot.acquire()
+        started = time.perf_counter()
+        try:
+            response = http_session().request(method, url, timeout=timeout, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            slot.release()
+            record_request(host, time.perf_counter() - started, None, error=True)
+            if attempt + 1 >= attempts:
+                raise
+            record_retry(host)
+            time.sleep(backoff_seconds(attempt))
+            continue
+        except Exception:
+            slot.release()
+            record_request(host, time.perf_counter() - started, None, error=True)
+            raise
+        record_request(host, time.perf_counter() - started, response.status_code)
+        if response.status_code in RETRY_STATUSES and attempt + 1 < attempts:
+            delay = backoff_seconds(attempt, response.headers.get("Retry-After"))
+            response.close()
+            slot.release()
+            record_retry(host)
+            time.sleep(delay)
+            continue
+        if stream:
+            release_on_close(response, slot)
+        else:
+            slot.release()
+        return response
+    raise AssertionError("unreachable")
+
+
+def http_session() -> requests.Session:
+    """Process-wide session; recreated after a fork so workers never share pooled sockets with the parent."""
+    global _SESSION, _SESSION_PID
+    pid = os.getpid()
+    with _LOCK:
+        if _SESSION is None or _SESSION_PID != pid:
+            session = requests.Session()
+            pool_size = max(DEFAULT_POOL_MAXSIZE, http_max_per_host())
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSION = session
+            _SESSION_PID = pid
+            _HOST_SLOTS.clear()
+        return _SESSION
+
+
+def host_slot(host: str) -> threading.BoundedSemaphore:
+    with _LOCK:
+        slot = _HOST_SLOTS.get(host)
+        if slot is None:
+            slot = threading.BoundedSemaphore(http_max_per_host())
+            _HOST_SLOTS[host] = slot
+        return slot
+
+
+def release_on_close(response: requests.Response, slot: threading.BoundedSemaphore) -> None:
+    close = response.close
+    released = threading.Event()
+
+    def close_and_release() -> None:
+        try:
+            close()
+        finally:
+            if not released.is_set():
+                released.set()
+                slot.release()
+
+    response.close = close_and_release
+
+
+def backoff_seconds(attempt: int, retry_after: str | None = None) -> float:
+    if retry_after:
+        try:
+            return min(BACKOFF_MAX_SECONDS, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    return random.uniform(0.0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt))
+
+
+def http_retries() -> int:
+    return env_int("CELERIS_HTTP_RETRIES", DEFAULT_RETRIES, minimum=0)
+
+
+def http_max_per_host() -> int:
+    return env_int("CELERIS_HTTP_MAX_PER_HOST", DEFAULT_MAX_PER_HOST, minimum=1)
+
+
+def env_int(name: str, default: int, *, minimum: int) -> int:
+    raw = os.environ.get(name)
+    if raw:
+        try:
+            value = int(raw)
+            if value >= minimum:
+                return value
+        except ValueError:
+            pass
+    return default
+
+
+def record_request(host: str, seconds: float, status: int | None, *, error: bool = False) -> None:
+    with _LOCK:
+        stats = _STATS.setdefault(host, {"requests": 0, "errors": 0, "retries": 0, "total_seconds": 0.0, "max_seconds": 0.0, "statuses": {}})
+        stats["requests"] += 1
+        stats["total_seconds"] += seconds
+        stats["max_seconds"] = max(stats["max_seconds"], seconds)
+        if error:
+            stats["errors"] += 1
+        if status is not None:
+            stats["statuses"][str(status)] = stats["statuses"].get(str(status), 0) + 1
+
+
+def record_retry(host: str) -> None:
+    with _LOCK:
+        stats = _STATS.get(host)
+        if stats is not None:
+            stats["retries"] += 1
+
+
+def http_stats() -> dict[str, dict[str, Any]]:
+    """Per-host request counts, retries, errors, status codes, and time-to-headers in this process."""
+    with _LOCK:
+        return {
+            host: {
+                **{key: value for key, value in stats.items() if key != "statuses"},
+                "statuses": dict(stats["statuses"]),
+                "mean_seconds": stats["total_seconds"] / stats["requests"] if stats["requests"] else None,
+            }
+            for host, stats in _STATS.items()
+        }
+
+
+def reset_http_stats() -> None:
+    with _LOCK:
+        _STATS.clear()
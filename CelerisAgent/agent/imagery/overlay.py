@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 import math
 import os
+import random
+import time
 from pathlib import Path
 from typing import Any
 
 from PIL import Image
-import requests
 
 from agent.dem.export import artifact
+from agent.http_client import http_get
+from agent.imagery.pyramid import OVERLAY_JPEG_OPTIONS, overlay_pyramid_enabled, remove_overlay_pyramid, write_overlay_pyramid
+from agent.imagery.tile_cache import TileCache, TileCacheMiss
 from agent.io_utils import read_json, write_json
 
 
@@ -23,6 +29,10 @@ MAX_OVERLAY_SIDE_PX = 8192
 TARGET_GSD_M = 5.0
 TILE_MAX_PX = 2000
 REQUEST_TIMEOUT_SECONDS = 45
+# Tiles come from one host, so `CELERIS_HTTP_MAX_PER_HOST` also bounds the requests actually in flight.
+DEFAULT_OVERLAY_TILE_WORKERS = 8
+TILE_FETCH_ATTEMPTS = 2
+TILE_RETRY_BACKOFF_SECONDS = 0.5
 
 
 def build_domain_georeferencing(job_dir: Path, model: dict[str, Any]) -> dict[str, Any]:
@@ -125,6 +135,7 @@ def generate_satellite_overlay(
     domain_georeferencing: dict[str, Any],
     max_side_px: int | None = None,
     target_gsd_m: float | None = None,
+    pyramid: bool | None = None,
 ) -> dict[str, Any]:
     selected_path = ["satellite_overlay_generation", "resolve_overlay_domain_georeferencing"]
     if domain_georeferencing.get("status") != "ok":
@@ -169,8 +180,15 @@ def generate_satellite_overlay(
 
     out_dir = job_dir / "outputs"
     overlay_path = out_dir / "overlay.jpg"
-    image.save(overlay_path, format="JPEG", quality=100, optimize=True)
+    pyramid = overlay_pyramid_enabled() if pyramid is None else pyramid
     selected_path.extend(["fetch_satellite_overlay", "write_overlay_jpg"])
+    if pyramid:
+        pyramid_summary = write_overlay_pyramid(image, out_dir, overlay_path, bbox_wgs84)
+        selected_path.append("write_overlay_pyramid")
+    else:
+        remove_overlay_pyramid(out_dir)
+        image.save(overlay_path, **OVERLAY_JPEG_OPTIONS)
+        pyramid_summary = None
     source = summary.pop("source")
 
     overlay_manifest = {
@@ -188,6 +206,8 @@ def generate_satellite_overlay(
             **summary,
         },
     }
+    if pyramid_summary:
+        overlay_manifest["pyramid"] = pyramid_summary
     manifest_path = out_dir / "overlay_manifest.json"
     write_json(manifest_path, overlay_manifest)
     selected_path.append("write_overlay_manifest")
@@ -196,6 +216,13 @@ def generate_satellite_overlay(
         artifact(job_dir, overlay_path, "satellite_overlay_jpg", "Satellite overlay.jpg"),
         artifact(job_dir, manifest_path, "satellite_overlay_manifest", "Satellite overlay manifest"),
     ]
+    if pyramid_summary:
+        artifacts.extend(
+            [
+                artifact(job_dir, job_dir / pyramid_summary["preview_path"], "satellite_overlay_preview_jpg", "Satellite overlay preview"),
+                artifact(job_dir, job_dir / pyramid_summary["index_path"], "satellite_overlay_pyramid_index", "Satellite overlay tile pyramid index"),
+            ]
+        )
     checks = [
         {
             "level": "info",
@@ -248,26 +275,27 @@ def fetch_eox_sentinel2_cloudless(
         height_px = max(1, int(round(height_px * scale)))
 
     image = Image.new("RGB", (width_px, height_px), (0, 0, 0))
-    failed_tiles: list[dict[str, Any]] = []
-    tile_count = 0
+    tasks = []
     for row0 in range(0, height_px, TILE_MAX_PX):
         row1 = min(height_px, row0 + TILE_MAX_PX)
         for col0 in range(0, width_px, TILE_MAX_PX):
             col1 = min(width_px, col0 + TILE_MAX_PX)
-            tile_count += 1
             tile_bbox = [
                 min_lon + (max_lon - min_lon) * col0 / width_px,
                 max_lat - (max_lat - min_lat) * row1 / height_px,
                 min_lon + (max_lon - min_lon) * col1 / width_px,
                 max_lat - (max_lat - min_lat) * row0 / height_px,
             ]
-            tile_width = col1 - col0
-            tile_height = row1 - row0
-            try:
-                tile = fetch_wms_tile(tile_bbox, tile_width, tile_height)
-                image.paste(tile, (col0, row0))
-            except Exception as exc:
-                failed_tiles.append({"row0": row0, "col0": col0, "width": tile_width, "height": tile_height, "error": str(exc)})
+            tasks.append({"row0": row0, "col0": col0, "width": col1 - col0, "height": row1 - row0, "bbox": tile_bbox})
+    tile_count = len(tasks)
+    cache = TileCache("eox_wms")
+    failed_tiles, fetch_stats = fetch_tiles(
+        tasks,
+        lambda task: fetch_wms_tile(task["bbox"], task["width"], task["height"], cache),
+        lambda task, tile: image.paste(tile, (task["col0"], task["row0"])),
+    )
+    tile_cache = cache.finish()
+    failed_tiles = [{key: task[key] for key in ("row0", "col0", "width", "height")} | {"error": error} for task, error in failed_tiles]
 
     if failed_tiles and len(failed_tiles) == tile_count:
         raise RuntimeError(f"All {tile_count} WMS overlay tiles failed. First error: {failed_tiles[0]['error']}")
@@ -287,6 +315,8 @@ def fetch_eox_sentinel2_cloudless(
         "effective_gsd_y_m": height_m / height_px,
         "tile_count": tile_count,
         "failed_tiles": failed_tiles,
+        "fetch_stats": fetch_stats,
+        "tile_cache": tile_cache,
         "wms_version": "1.1.1",
         "wms_crs": "EPSG:4326",
     }
@@ -313,14 +343,15 @@ def fetch_esri_world_imagery(bbox_wgs84: list[float], max_side_px: int) -> tuple
         raise RuntimeError("Resolved Esri tile range is empty.")
 
     mosaic = Image.new("RGB", (tiles_x * 256, tiles_y * 256), (0, 0, 0))
-    failed_tiles: list[dict[str, Any]] = []
-    for tile_y in range(tile_min_y, tile_max_y + 1):
-        for tile_x in range(tile_min_x, tile_max_x + 1):
-            try:
-                tile = fetch_esri_tile(zoom, tile_x, tile_y)
-                mosaic.paste(tile, ((tile_x - tile_min_x) * 256, (tile_y - tile_min_y) * 256))
-            except Exception as exc:
-                failed_tiles.append({"z": zoom, "x": tile_x, "y": tile_y, "error": str(exc)})
+    tasks = [(tile_x, tile_y) for tile_y in range(tile_min_y, tile_max_y + 1) for tile_x in range(tile_min_x, tile_max_x + 1)]
+    cache = TileCache("esri_world_imagery")
+    failed_tiles, fetch_stats = fetch_tiles(
+        tasks,
+        lambda task: fetch_esri_tile(zoom, task[0], task[1], cache),
+        lambda task, tile: mosaic.paste(tile, ((task[0] - tile_min_x) * 256, (task[1] - tile_min_y) * 256)),
+    )
+    tile_cache = cache.finish()
+    failed_tiles = [{"z": zoom, "x": task[0], "y": task[1], "error": error} for task, error in failed_tiles]
 
     if failed_tiles and len(failed_tiles) == tile_count:
         raise RuntimeError(f"All {tile_count} Esri tiles failed. First error: {failed_tiles[0]['error']}")
@@ -354,10 +385,95 @@ def fetch_esri_world_imagery(bbox_wgs84: list[float], max_side_px: int) -> tuple
         "effective_gsd_y_m": height_m / output_height,
         "tile_count": tile_count,
         "failed_tiles": failed_tiles,
+        "fetch_stats": fetch_stats,
+        "tile_cache": tile_cache,
         "tile_scheme": "ArcGIS Web Mercator XYZ-compatible rows/columns",
     }
 
 
+def fetch_tiles(tasks: list[Any], fetch, paste) -> tuple[list[tuple[Any, str]], dict[str, Any]]:
+    """Fetch `tasks` on a bounded thread pool and paste results in task order on the calling thread.
+
+    At most twice the worker count is in flight, so a large mosaic never buffers more than a window of decoded
+    tiles. Each tile is attempted up to `TILE_FETCH_ATTEMPTS` times (HTTP-level 429/5xx retries happen inside
+    `http_get`); tiles that still fail are returned with their last error and left black.
+    """
+    workers = min(overlay_tile_workers(), max(1, len(tasks)))
+    failures: list[tuple[Any, str]] = []
+    latencies: list[float] = []
+    retries = 0
+    started = time.perf_counter()
+    remaining = iter(tasks)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="overlay-tile") as pool:
+        pending: deque = deque()
+
+        def submit_next() -> None:
+            task = next(remaining, None)
+            if task is not None:
+                pending.append((task, pool.submit(fetch_tile_with_retry, fetch, task)))
+
+        for _ in range(2 * workers):
+            submit_next()
+        while pending:
+            task, future = pending.popleft()
+            tile, error, attempts, latency = future.result()
+            submit_next()
+            retries += attempts - 1
+            if tile is None:
+                failures.append((task, error))
+                continue
+            latencies.append(latency)
+            paste(task, tile)
+    elapsed = time.perf_counter() - started
+    return failures, {
+        "workers": workers,
+        "tiles": len(tasks),
+        "fetched": len(latencies),
+        "failed": len(failures),
+        "retries": retries,
+        "elapsed_s": round(elapsed, 3),
+        "tiles_per_s": round(len(latencies) / elapsed, 2) if elapsed > 0 else None,
+        "latency_p50_s": percentile(latencies, 50),
+        "latency_p95_s": percentile(latencies, 95),
+    }
+
+
+def fetch_tile_with_retry(fetch, task: Any) -> tuple[Image.Image | None, str | None, int, float | None]:
+    error = None
+    for attempt in range(1, TILE_FETCH_ATTEMPTS + 1):
+        started = time.perf_counter()
+        try:
+            tile = fetch(task)
+            return tile, None, attempt, time.perf_counter() - started
+        except TileCacheMiss as exc:
+            return None, str(exc), attempt, None
+        except Exception as exc:
+            error = str(exc)
+            if attempt < TILE_FETCH_ATTEMPTS:
+                time.sleep(random.uniform(0.0, TILE_RETRY_BACKOFF_SECONDS * attempt))
+    return None, error, TILE_FETCH_ATTEMPTS, None
+
+
+def overlay_tile_workers() -> int:
+    raw = os.environ.get("CELERIS_OVERLAY_TILE_WORKERS")
+    if raw:
+        try:
+            value = int(raw)
+            if value > 0:
+                return value
+        except ValueError:
+            pass
+    return DEFAULT_OVERLAY_TILE_WORKERS
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(math.ceil(q / 100.0 * len(ordered))) - 1))
+    return round(ordered[index], 4)
+
+
 def choose_esri_zoom(mercator_bbox: list[float], max_side_px: int) -> tuple[int, tuple[float, float, float, float]]:
     max_zoom = int(os.environ.get("CELERIS_OVERLAY_ESRI_MAX_ZOOM") or 18)
     max_tiles = int(os.environ.get("CELERIS_OVERLAY_MAX_TILES") or 256)
@@ -404,30 +520,36 @@ def lon_lat_to_web_mercator(lon: float, lat: float) -> tuple[float, float]:
     return x, y
 
 
-def fetch_esri_tile(zoom: int, tile_x: int, tile_y: int) -> Image.Image:
-    url = ESRI_TILE_URL.format(z=zoom, y=tile_y, x=tile_x)
-    response = requests.get(
-        url,
-        timeout=REQUEST_TIMEOUT_SECONDS,
-        headers={"User-Agent": "CelerisAgent/0.1 satellite overlay generator"},
-    )
-    response.raise_for_status()
-    content_type = response.headers.get("Content-Type", "")
-    if "image" not in content_type.lower():
-        text = response.text[:400].replace("\n", " ")
-        raise RuntimeError(f"Esri tile returned non-image content ({content_type}): {text}")
-    return Image.open(BytesIO(response.content)).convert("RGB")
-
-
-def fetch_wms_tile(bbox_wgs84: list[float], output_width: int, output_height: int) -> Image.Image:
+def fetch_esri_tile(zoom: int, tile_x: int, tile_y: int, cache: TileCache | None = None) -> Image.Image:
+    parts = {"z": zoom, "x": tile_x, "y": tile_y}
+    data = cache.get(parts) if cache else None
+    if data is None:
+        url = ESRI_TILE_URL.format(z=zoom, y=tile_y, x=tile_x)
+        response = http_get(
+            url,
+            timeout=REQUEST_TIMEOUT_SECONDS,
+            headers={"User-Agent": "CelerisAgent/0.1 satellite overlay generator"},
+        )
+        response.raise_for_status()
+        content_type = response.headers.get("Content-Type", "")
+        if "image" not in content_type.lower():
+            text = response.text[:400].replace("\n", " ")
+            raise RuntimeError(f"Esri tile returned non-image content ({content_type}): {text}")
+        data = response.content
+        if cache:
+            cache.put(parts, data)
+    return Image.open(BytesIO(data)).convert("RGB")
+
+
+def fetch_wms_tile(bbox_wgs84: list[float], output_width: int, output_height: int, cache: TileCache | None = None) -> Image.Image:
     request_width = max(256, int(output_width))
     request_height = max(256, int(output_height))
     try:
-        return request_wms_tile(bbox_wgs84, request_width, request_height, output_width, output_height)
+        return request_wms_tile(bbox_wgs84, request_width, request_height, output_width, output_height, cache)
     except Exception:
         retry_width = max(256, int(request_width * 0.75))
         retry_height = max(256, int(request_height * 0.75))
-        return request_wms_tile(bbox_wgs84, retry_width, retry_height, output_width, output_height)
+        return request_wms_tile(bbox_wgs84, retry_width, retry_height, output_width, output_height, cache)
 
 
 def request_wms_tile(
@@ -436,6 +558,7 @@ def request_wms_tile(
     request_height: int,
     output_width: int,
     output_height: int,
+    cache: TileCache | None = None,
 ) -> Image.Image:
     params = {
         "SERVICE": "WMS",
@@ -449,18 +572,25 @@ def request_wms_tile(
         "WIDTH": str(request_width),
         "HEIGHT": str(request_height),
     }
-    response = requests.get(
-        EOX_WMS_URL,
-        params=params,
-        timeout=REQUEST_TIMEOUT_SECONDS,
-        headers={"User-Agent": "CelerisAgent/0.1 satellite overlay generator"},
-    )
-    response.raise_for_status()
-    content_type = response.headers.get("Content-Type", "")
-    if "image" not in content_type.lower():
-        text = response.text[:400].replace("\n", " ")
-        raise RuntimeError(f"WMS returned non-image content ({content_type}): {text}")
-    image = Image.open(BytesIO(response.content)).convert("RGB")
+    # The formatted BBOX string is the key, so float noise below the request precision still hits.
+    parts = {"layer": EOX_LAYER, "bbox": params["BBOX"], "width": request_width, "height": request_height}
+    data = cache.get(parts) if cache else None
+    if data is None:
+        response = http_get(
+            EOX_WMS_URL,
+            params=params,
+            timeout=REQUEST_TIMEOUT_SECONDS,
+            headers={"User-Agent": "CelerisAgent/0.1 satellite overlay generator"},
+        )
+        response.raise_for_status()
+        content_type = response.headers.get("Content-Type", "")
+        if "image" not in content_type.lower():
+            text = response.text[:400].replace("\n", " ")
+            raise RuntimeError(f"WMS returned non-image content ({content_type}): {text}")
+        data = response.content
+        if cache:
+            cache.put(parts, data)
+    image = Image.open(BytesIO(data)).convert("RGB")
     if image.size != (output_width, output_height):
         image = image.resize((output_width, output_height), Image.Resampling.BICUBIC)
     return image
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import math
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from PIL import Image
+
+from agent.io_utils import write_json
+
+
+OVERLAY_JPEG_OPTIONS = {"format": "JPEG", "quality": 100, "optimize": True}
+OVERLAY_PYRAMID_DIR = "overlay_pyramid"
+OVERLAY_PYRAMID_INDEX = "overlay_pyramid.json"
+OVERLAY_PREVIEW = "overlay_preview.jpg"
+PYRAMID_TILE_PX = 512
+PYRAMID_JPEG_QUALITY = 90
+PREVIEW_MAX_SIDE_PX = 1024
+PREVIEW_JPEG_QUALITY = 85
+DEFAULT_OVERLAY_ENCODE_WORKERS = 4
+
+
+def write_overlay_pyramid(
+    image: Image.Image,
+    out_dir: Path,
+    overlay_path: Path,
+    bbox_wgs84: list[float],
+) -> dict[str, Any]:
+    """Write `overlay.jpg`, a downsampled preview, and a tiled power-of-two pyramid with a JSON index.
+
+    Level 0 is the coarsest level and fits in one tile; each following level doubles the resolution up
+    to the full overlay. Tiles are `PYRAMID_TILE_PX` squares (edge tiles are smaller) stored as
+    `overlay_pyramid/<level>/<row>_<col>.jpg`. All JPEGs, including the full-resolution `overlay.jpg`,
+    are encoded on one thread pool; Pillow releases the GIL while encoding.
+    """
+    remove_overlay_pyramid(out_dir)
+    tile_root = out_dir / OVERLAY_PYRAMID_DIR
+    levels = pyramid_levels(image)
+    preview = preview_image(levels)
+    index_levels = []
+    # The preview goes first so it lands early even on one worker; the slow full-resolution encode follows.
+    jobs = [(preview, None, out_dir / OVERLAY_PREVIEW, jpeg_options(PREVIEW_JPEG_QUALITY)), (image, None, overlay_path, OVERLAY_JPEG_OPTIONS)]
+    for level, level_image in enumerate(levels):
+        columns = math.ceil(level_image.width / PYRAMID_TILE_PX)
+        rows = math.ceil(level_image.height / PYRAMID_TILE_PX)
+        (tile_root / str(level)).mkdir(parents=True, exist_ok=True)
+        for row in range(rows):
+            for col in range(columns):
+                box = (
+                    col * PYRAMID_TILE_PX,
+                    row * PYRAMID_TILE_PX,
+                    min(level_image.width, (col + 1) * PYRAMID_TILE_PX),
+                    min(level_image.height, (row + 1) * PYRAMID_TILE_PX),
+                )
+                jobs.append((level_image, box, tile_root / str(level) / f"{row}_{col}.jpg", jpeg_options(PYRAMID_JPEG_QUALITY)))
+        index_levels.append(
+            {
+                "level": level,
+                "downsample": 2 ** (len(levels) - 1 - level),
+                "width_px": level_image.width,
+                "height_px": level_image.height,
+                "columns": columns,
+                "rows": rows,
+                "path_template": f"{OVERLAY_PYRAMID_DIR}/{level}/{{row}}_{{col}}.jpg",
+            }
+        )
+
+    workers = overlay_encode_workers()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        sizes = list(pool.map(lambda job: encode_jpeg(*job), jobs))
+    encode_seconds = time.perf_counter() - started
+
+    index = {
+        "schema_version": "0.1.0",
+        "format": "jpeg",
+        "tile_size_px": PYRAMID_TILE_PX,
+        "width_px": image.width,
+        "height_px": image.height,
+        "bbox_wgs84": bbox_wgs84,
+        "full_resolution": {"path": overlay_path.name, "width_px": image.width, "height_px": image.height},
+        "preview": {"path": OVERLAY_PREVIEW, "width_px": preview.width, "height_px": preview.height},
+        "levels": index_levels,
+    }
+    write_json(out_dir / OVERLAY_PYRAMID_INDEX, index)
+    return {
+        "index_path": f"outputs/{OVERLAY_PYRAMID_INDEX}",
+        "preview_path": f"outputs/{OVERLAY_PREVIEW}",
+        "tile_dir": f"outputs/{OVERLAY_PYRAMID_DIR}",
+        "levels": len(levels),
+        "tile_count": len(jobs) - 2,
+        "tile_size_px": PYRAMID_TILE_PX,
+        "tile_bytes": sum(sizes[2:]),
+        "preview_bytes": sizes[0],
+        "overlay_bytes": sizes[1],
+        "encode_workers": workers,
+        "encode_seconds": encode_seconds,
+    }
+
+
+def pyramid_levels(image: Image.Image) -> list[Image.Image]:
+    """Images from the coarsest (fits one tile) to full resolution, each half the size of the next."""
+    levels = [image]
+    while max(levels[0].size) > PYRAMID_TILE_PX:
+        levels.insert(0, levels[0].reduce(2))
+    return levels
+
+
+def preview_image(levels: list[Image.Image]) -> Image.Image:
+    source = next((level for level in levels if max(level.size) >= PREVIEW_MAX_SIDE_PX), levels[-1])
+    if max(source.size) <= PREVIEW_MAX_SIDE_PX:
+        return source
+    scale = PREVIEW_MAX_SIDE_PX / max(source.size)
+    size = (max(1, round(source.width * scale)), max(1, round(source.height * scale)))
+    return source.resize(size, Image.Resampling.LANCZOS)
+
+
+def encode_jpeg(image: Image.Image, box: tuple[int, int, int, int] | None, path: Path, options: dict[str, Any]) -> int:
+    (image.crop(box) if box else image).save(path, **options)
+    return path.stat().st_size
+
+
+def jpeg_options(quality: int) -> dict[str, Any]:
+    return {"format": "JPEG", "quality": quality, "optimize": True}
+
+
+def remove_overlay_pyramid(out_dir: Path) -> None:
+    """Drop pyramid outputs from an earlier overlay so they never outlive the `overlay.jpg` they came from."""
+    shutil.rmtree(out_dir / OVERLAY_PYRAMID_DIR, ignore_errors=True)
+    (out_dir / OVERLAY_PYRAMID_INDEX).unlink(missing_ok=True)
+    (out_dir / OVERLAY_PREVIEW).unlink(missing_ok=True)
+
+
+def overlay_pyramid_enabled() -> bool:
+    return str(os.environ.get("CELERIS_OVERLAY_PYRAMID") or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def overlay_encode_workers() -> int:
+    raw = os.environ.get("CELERIS_OVERLAY_ENCODE_WORKERS")
+    if raw:
+        try:
+            value = int(raw)
+            if value > 0:
+                return value
+        except ValueError:
+            pass
+    return min(DEFAULT_OVERLAY_ENCODE_WORKERS, os.cpu_count() or 1)
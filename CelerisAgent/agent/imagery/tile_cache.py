@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Any
+
+from agent.disk_cache import cache_key, cache_max_bytes, cache_stats, namespace_dir, record_cache_event
+
+
+OVERLAY_TILE_CACHE = "overlay_tiles"
+OVERLAY_TILE_CACHE_SCHEMA = 1
+DEFAULT_OVERLAY_TILE_CACHE_MAX_BYTES = 2 * 1024**3
+TILE_SUFFIX = ".tile"
+
+
+class TileCacheMiss(RuntimeError):
+    """Raised in offline mode when a tile is not in the store; tile fetchers do not retry it."""
+
+
+class TileCache:
+    """One overlay's handle on the shared tile store under `workspace/cache/overlay_tiles`.
+
+    Tiles are stored as the encoded bytes the provider served, one file per tile, and their mtime is the
+    LRU clock. Hits and misses are counted per overlay and flushed to the namespace `stats.json` once by
+    `finish()`, which also applies the size cap, so worker threads never contend on shared files.
+    """
+
+    def __init__(self, provider: str, *, offline: bool | None = None) -> None:
+        self.provider = provider
+        self.max_bytes = cache_max_bytes("CELERIS_OVERLAY_TILE_CACHE_MAX_BYTES", DEFAULT_OVERLAY_TILE_CACHE_MAX_BYTES)
+        self.offline = overlay_offline() if offline is None else offline
+        self.enabled = self.max_bytes > 0 or self.offline
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.lock = threading.Lock()
+
+    def get(self, parts: dict[str, Any]) -> bytes | None:
+        if not self.enabled:
+            return None
+        path = self.path_for(parts)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            data = None
+        with self.lock:
+            if data:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if not data and self.offline:
+            raise TileCacheMiss(f"{self.provider} tile is not in the offline overlay cache.")
+        return data or None
+
+    def put(self, parts: dict[str, Any], data: bytes) -> None:
+        if not self.enabled or self.max_bytes <= 0 or not data:
+            return
+        path = self.path_for(parts)
+        staging = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            staging.write_bytes(data)
+            staging.replace(path)
+        except OSError:
+            staging.unlink(missing_ok=True)
+            return
+        with self.lock:
+            self.stores += 1
+
+    def path_for(self, parts: dict[str, Any]) -> Path:
+        key = cache_key({"schema": OVERLAY_TILE_CACHE_SCHEMA, "provider": self.provider, **parts})
+        return namespace_dir(OVERLAY_TILE_CACHE) / key[:2] / f"{key}{TILE_SUFFIX}"
+
+    def finish(self) -> dict[str, Any]:
+        """Flush this overlay's counters, enforce the size cap, and return the manifest summary."""
+        evicted = 0
+        if self.enabled:
+            for event, count in (("hits", self.hits), ("misses", self.misses), ("stores", self.stores)):
+                if count:
+                    record_cache_event(OVERLAY_TILE_CACHE, event, count)
+            if self.stores and self.max_bytes > 0:
+                evicted = evict_tiles(self.max_bytes)
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "offline": self.offline,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evicted": evicted,
+            "hit_rate": self.hits / lookups if lookups else None,
+            "store_stats": cache_stats(OVERLAY_TILE_CACHE) if self.enabled else None,
+        }
+
+
+def evict_tiles(max_bytes: int) -> int:
+    root = namespace_dir(OVERLAY_TILE_CACHE)
+    entries = []
+    total = 0
+    for path in root.glob(f"*/*{TILE_SUFFIX}"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+        total += stat.st_size
+    evicted = 0
+    for _used_at, size, path in sorted(entries, key=lambda item: item[0]):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        evicted += 1
+    if evicted:
+        record_cache_event(OVERLAY_TILE_CACHE, "evictions", evicted)
+    return evicted
+
+
+def overlay_offline() -> bool:
+    return str(os.environ.get("CELERIS_OVERLAY_OFFLINE") or "").strip().lower() in {"1", "true", "yes", "on"}
@@ -34,11 +34,13 @@ def safe_filename(name: str) -> str:
     return re.sub(r"[^A-Za-z0-9._-]", "_", Path(name).name) or "upload.bin"
 
 
-def extract_zip(path: Path, out_dir: Path) -> list[Path]:
+def extract_zip(path: Path, out_dir: Path, members: list[str] | None = None) -> list[Path]:
+    """Extract files from a ZIP into `out_dir`, flattening names; `members` limits and orders the extraction."""
     out_dir.mkdir(parents=True, exist_ok=True)
     files: list[Path] = []
     with zipfile.ZipFile(path) as zf:
-        for item in zf.infolist():
+        items = zf.infolist() if members is None else [zf.getinfo(name) for name in members]
+        for item in items:
             if item.is_dir():
                 continue
             filename = safe_filename(item.filename)
@@ -500,9 +500,10 @@ def usgs_event_id_from_text(message: str) -> str | None:
 
 
 def search_usgs_event_id(message: str) -> str | None:
-    import requests
     from datetime import datetime, timedelta, timezone
 
+    from agent.http_client import http_get
+
     lower = (message or "").lower()
     mag_match = re.search(r"\b(?:mw|m)\s*([0-9]+(?:\.[0-9]+)?)\b", lower)
     min_mag = max(6.5, float(mag_match.group(1)) - 0.4) if mag_match else 7.0
@@ -519,7 +520,7 @@ def search_usgs_event_id(message: str) -> str | None:
     if "philippines" in lower or "mindanao" in lower or "kablalan" in lower:
         params.update({"latitude": 12.8797, "longitude": 121.7740, "maxradiuskm": 2500})
     url = f"https://earthquake.usgs.gov/fdsnws/event/1/query?{urlencode(params)}"
-    response = requests.get(url, timeout=30)
+    response = http_get(url, timeout=30)
     response.raise_for_status()
     features = response.json().get("features") or []
     if not features:
@@ -534,10 +535,11 @@ def search_usgs_event_id(message: str) -> str | None:
 
 def extract_usgs_event_products(event_id: str) -> dict[str, Any]:
     import math
-    import requests
+
+    from agent.http_client import http_get
 
     url = f"https://earthquake.usgs.gov/fdsnws/event/1/query?format=geojson&eventid={event_id}"
-    response = requests.get(url, timeout=30)
+    response = http_get(url, timeout=30)
     response.raise_for_status()
     data = response.json()
     properties = data.get("properties") or {}
@@ -638,12 +640,12 @@ def newest_product(products: list[dict[str, Any]], prefer_code: str | None = Non
 
 
 def finite_fault_grid_summary(product: dict[str, Any], model_length_km: float | None = None, model_width_km: float | None = None) -> dict[str, Any] | None:
-    import requests
+    from agent.http_client import http_get
 
     url = (((product.get("contents") or {}).get("FFM.geojson") or {}).get("url"))
     if not url:
         return None
-    response = requests.get(url, timeout=30)
+    response = http_get(url, timeout=30)
     response.raise_for_status()
     features = response.json().get("features") or []
     slips = []
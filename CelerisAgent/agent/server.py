@@ -28,6 +28,7 @@ from agent.auth import (
     mark_feedback_seen,
     unread_feedback_count,
 )
+from agent.celeris.grid_files import binary_grid_paths
 from agent.chat import handle_chat, make_job
 from agent.chat_utils import now
 from agent.config import AGENT_PREFIX, API_PREFIX, CORE_ROOT, JOBS, ROOT, ensure_dirs, load_local_env
@@ -35,6 +36,7 @@ from agent.io_utils import is_inside, read_json, safe_filename, write_json
 from agent.job_queue import QueueUnavailable, enqueue_chat_job
 from agent.progress import read_progress
 from agent.registry import load_registry
+from agent.shoreline.anchor import preload_shoreline_indexes
 from agent.thread_archive import build_thread_archive
 
 
@@ -414,9 +416,20 @@ class Handler(BaseHTTPRequestHandler):
             name: f"{origin}{API_PREFIX}/jobs/{job_id}/files/{file_path.relative_to(job_dir).as_posix()}"
             for name, file_path in required.items()
         }
+        for name, text_name in (("bathy", "bathy.txt"), ("initial_eta", "etaInitCond.txt")):
+            text_path = job_dir / "outputs" / text_name
+            binary_path, header_path = binary_grid_paths(text_path)
+            # Only advertise binary grids written alongside the current text file, never stale ones.
+            if text_path.exists() and binary_path.exists() and header_path.exists() and binary_path.stat().st_mtime >= text_path.stat().st_mtime:
+                file_urls[f"{name}_f32"] = f"{origin}{API_PREFIX}/jobs/{job_id}/files/{binary_path.relative_to(job_dir).as_posix()}"
+                file_urls[f"{name}_f32_header"] = f"{origin}{API_PREFIX}/jobs/{job_id}/files/{header_path.relative_to(job_dir).as_posix()}"
         overlay_path = job_dir / "outputs" / "overlay.jpg"
         if overlay_path.exists():
             file_urls["overlay"] = f"{origin}{API_PREFIX}/jobs/{job_id}/files/{overlay_path.relative_to(job_dir).as_posix()}"
+            for name, file_name in (("overlay_preview", "overlay_preview.jpg"), ("overlay_pyramid", "overlay_pyramid.json")):
+                pyramid_path = job_dir / "outputs" / file_name
+                if pyramid_path.exists():
+                    file_urls[name] = f"{origin}{API_PREFIX}/jobs/{job_id}/files/{pyramid_path.relative_to(job_dir).as_posix()}"
         initial_eta_path = job_dir / "outputs" / "etaInitCond.txt"
         if initial_eta_path.exists():
             file_urls["initial_eta"] = f"{origin}{API_PREFIX}/jobs/{job_id}/files/{initial_eta_path.relative_to(job_dir).as_posix()}"
@@ -604,6 +617,7 @@ def run(host: str = "127.0.0.1", port: int = 8765) -> None:
     load_local_env()
     ensure_dirs()
     ensure_auth_dirs()
+    preload_shoreline_indexes()
     server = ThreadingHTTPServer((host, port), Handler)
     print(f"CelerisAgent chat running at http://{host}:{port}{AGENT_PREFIX}/")
     print(f"Root CELERIS core served at http://{host}:{port}/")
@@ -7,6 +7,7 @@ from typing import Any
 
 from agent.config import ROOT
 from agent.geo import lat_degrees_to_meters, lon_degrees_to_meters
+from agent.shoreline.packed_index import packed_shoreline_index
 
 
 SHORELINE_ROOT = ROOT / "shoreline_database"
@@ -15,6 +16,8 @@ NATURAL_EARTH_COASTLINE = SHORELINE_ROOT / "ne_10m_coastline.shp"
 SEARCH_RADII_M = (2_000.0, 5_000.0, 10_000.0, 25_000.0, 50_000.0)
 MAX_ANCHOR_DISTANCE_FACTOR = 0.75
 MAX_ANCHOR_DISTANCE_M = 25_000.0
+NEAREST_PREFILTER_FACTOR = 1.5
+NEAREST_PREFILTER_MARGIN_M = 100.0
 
 
 def anchor_center_to_shoreline(
@@ -100,6 +103,12 @@ def should_anchor_to_shoreline(dem_request: dict[str, Any], center: dict[str, An
     return True
 
 
+def preload_shoreline_indexes() -> None:
+    """Map the packed shoreline indexes up front so the first anchored request does not pay for it."""
+    for path in (OSM_COASTLINE, NATURAL_EARTH_COASTLINE):
+        packed_shoreline_index(path)
+
+
 def nearest_shoreline_point(lon: float, lat: float, domain_max_m: float) -> dict[str, Any] | None:
     datasets = (
         ("osm_coastline", "OSM coastline", OSM_COASTLINE),
@@ -128,17 +137,22 @@ def nearest_shoreline_point(lon: float, lat: float, domain_max_m: float) -> dict
 
 @lru_cache(maxsize=256)
 def load_candidate_geometries(path: str, lon: float, lat: float, radius_m: float) -> tuple[Any, ...]:
-    try:
-        import geopandas as gpd
-    except Exception as exc:
-        raise RuntimeError("Local shoreline anchoring requires geopandas, shapely, and pyproj.") from exc
-
     query_lon = round(float(lon), 4)
     query_lat = round(float(lat), 4)
     radius = float(radius_m)
     dlon = abs(radius / max(lon_degrees_to_meters(1.0, query_lat), 1.0))
     dlat = abs(radius / max(lat_degrees_to_meters(1.0), 1.0))
     bbox = (query_lon - dlon, query_lat - dlat, query_lon + dlon, query_lat + dlat)
+
+    # Built by scripts/build_shoreline_index.py; without it every radius is a shapefile scan.
+    index = packed_shoreline_index(Path(path))
+    if index is not None:
+        return index.feature_geometries(index.query_features(bbox))
+
+    try:
+        import geopandas as gpd
+    except Exception as exc:
+        raise RuntimeError("Local shoreline anchoring requires geopandas, shapely, and pyproj.") from exc
     try:
         gdf = gpd.read_file(path, bbox=bbox)
     except Exception as exc:
@@ -149,29 +163,75 @@ def load_candidate_geometries(path: str, lon: float, lat: float, radius_m: float
 
 
 def nearest_point_from_geometries(geometries: tuple[Any, ...], lon: float, lat: float) -> dict[str, Any] | None:
+    """Nearest point on any candidate geometry, measured in the local UTM zone.
+
+    Every segment is scored at once with NumPy. A local equirectangular pass shortlists the segments
+    that can be nearest, and only their vertices are projected, in one pyproj call. Ties keep the lowest
+    feature index, as the former per-geometry loop did.
+    """
+    import numpy as np
+    import shapely
     from pyproj import Transformer
-    from shapely.geometry import Point
-    from shapely.ops import nearest_points, transform
+
+    parts, owners = shapely.get_parts(np.asarray(geometries, dtype=object), return_index=True)
+    polygonal = shapely.get_type_id(parts) == 3
+    if polygonal.any():
+        rings, ring_owner = shapely.get_rings(parts[polygonal], return_index=True)
+        parts = np.concatenate([parts[~polygonal], rings])
+        owners = np.concatenate([owners[~polygonal], owners[polygonal][ring_owner]])
+        # Coastlines are linework; polygon candidates are measured to their rings, kept in feature order.
+        order = np.argsort(owners, kind="stable")
+        parts, owners = parts[order], owners[order]
+    coords, part_index = shapely.get_coordinates(parts, return_index=True)
+    if not len(coords):
+        return None
+
+    # A segment joins consecutive vertices of one part; a lone vertex becomes a zero-length segment.
+    same_part = part_index[:-1] == part_index[1:]
+    lone = np.ones(len(coords), dtype=bool)
+    lone[:-1] &= ~same_part
+    lone[1:] &= ~same_part
+    starts = np.concatenate([np.flatnonzero(same_part), np.flatnonzero(lone)])
+    order = np.argsort(starts, kind="stable")
+    ends = np.concatenate([np.flatnonzero(same_part) + 1, np.flatnonzero(lone)])[order]
+    starts = starts[order]
+
+    east = (np.mod(coords[:, 0] - lon + 180.0, 360.0) - 180.0) * lon_degrees_to_meters(1.0, lat)
+    north = (coords[:, 1] - lat) * lat_degrees_to_meters(1.0)
+    approx, _qx, _qy = segment_distances(east, north, starts, ends, 0.0, 0.0)
+    # The equirectangular error is a few percent at 50 km even near the poles, so this margin never
+    # drops the true nearest segment.
+    keep = np.flatnonzero(approx <= NEAREST_PREFILTER_FACTOR * approx.min() + NEAREST_PREFILTER_MARGIN_M)
+    starts, ends = starts[keep], ends[keep]
+    vertices, inverse = np.unique(np.concatenate([starts, ends]), return_inverse=True)
 
     epsg = local_utm_epsg(lon, lat)
-    to_local = Transformer.from_crs("EPSG:4326", epsg, always_xy=True).transform
-    to_wgs84 = Transformer.from_crs(epsg, "EPSG:4326", always_xy=True).transform
-    point_local = transform(to_local, Point(lon, lat))
-    best = None
-    for index, geom in enumerate(geometries):
-        geom_local = transform(to_local, geom)
-        _p0, shoreline_point = nearest_points(point_local, geom_local)
-        distance = float(point_local.distance(shoreline_point))
-        if best is None or distance < best["distance_m"]:
-            shoreline_wgs84 = transform(to_wgs84, shoreline_point)
-            best = {
-                "lon": float(shoreline_wgs84.x),
-                "lat": float(shoreline_wgs84.y),
-                "distance_m": distance,
-                "feature_index": index,
-                "local_projection": epsg,
-            }
-    return best
+    to_local = Transformer.from_crs("EPSG:4326", epsg, always_xy=True)
+    to_wgs84 = Transformer.from_crs(epsg, "EPSG:4326", always_xy=True)
+    xs, ys = to_local.transform(np.append(coords[vertices, 0], lon), np.append(coords[vertices, 1], lat))
+    distances, qx, qy = segment_distances(xs, ys, inverse[: len(starts)], inverse[len(starts) :], xs[-1], ys[-1])
+    best = int(np.argmin(distances))
+    shoreline_lon, shoreline_lat = to_wgs84.transform(qx[best], qy[best])
+    return {
+        "lon": float(shoreline_lon),
+        "lat": float(shoreline_lat),
+        "distance_m": float(distances[best]),
+        "feature_index": int(owners[part_index[starts[best]]]),
+        "local_projection": epsg,
+    }
+
+
+def segment_distances(xs: Any, ys: Any, starts: Any, ends: Any, px: float, py: float) -> tuple[Any, Any, Any]:
+    """Planar distance from `(px, py)` to each segment `starts[i] -> ends[i]`, and the closest points."""
+    import numpy as np
+
+    ax, ay = xs[starts], ys[starts]
+    dx, dy = xs[ends] - ax, ys[ends] - ay
+    length_sq = dx * dx + dy * dy
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.clip(np.where(length_sq > 0, ((px - ax) * dx + (py - ay) * dy) / length_sq, 0.0), 0.0, 1.0)
+    qx, qy = ax + t * dx, ay + t * dy
+    return np.hypot(px - qx, py - qy), qx, qy
 
 
 def local_utm_epsg(lon: float, lat: float) -> str:
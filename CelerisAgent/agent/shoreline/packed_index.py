@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import json
+import math
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+
+PACKED_INDEX_SCHEMA = 1
+PACKED_INDEX_DIRNAME = "packed"
+RTREE_NODE_SIZE = 16
+PACKED_ARRAYS = ("coords", "part_offsets", "feature_part_offsets", "segment_starts", "segment_features", "node_boxes", "level_offsets")
+
+_INDEX_LOCK = threading.Lock()
+_INDEXES: dict[str, tuple[Any, PackedShorelineIndex | None]] = {}
+
+
+class PackedShorelineIndex:
+    """Memory-mapped shoreline linework with a bulk-loaded packed R-tree over segment bounding boxes.
+
+    Vertices live in one `(V, 2)` lon/lat array; `part_offsets` splits it into linestring parts and
+    `feature_part_offsets` groups parts into the source features. Tree leaves are segments in
+    Sort-Tile-Recursive order, identified by their first vertex; leaf boxes are derived from the two
+    vertices on demand, and each upper level stores float32 node boxes rounded outward, `RTREE_NODE_SIZE`
+    children per node, concatenated leaf-parent level first as delimited by `level_offsets`.
+    """
+
+    def __init__(self, index_dir: Path, meta: dict[str, Any], arrays: dict[str, np.ndarray]) -> None:
+        self.index_dir = index_dir
+        self.meta = meta
+        self.stamp = (meta["source_mtime_ns"], meta["source_size"])
+        self.node_size = int(meta["node_size"])
+        for name in PACKED_ARRAYS:
+            setattr(self, name, arrays[name])
+
+    @classmethod
+    def open(cls, index_dir: Path) -> PackedShorelineIndex:
+        meta = json.loads((index_dir / "meta.json").read_text(encoding="utf-8"))
+        if meta.get("schema_version") != PACKED_INDEX_SCHEMA:
+            raise ValueError(f"Unsupported packed shoreline index schema {meta.get('schema_version')!r}.")
+        # Plain ndarray views over the maps: np.memmap slicing adds per-call overhead on every query.
+        arrays = {name: np.asarray(np.load(index_dir / f"{name}.npy", mmap_mode="r")) for name in PACKED_ARRAYS}
+        return cls(index_dir, meta, arrays)
+
+    @property
+    def feature_count(self) -> int:
+        return len(self.feature_part_offsets) - 1
+
+    def query_segments(self, bbox: tuple[float, float, float, float]) -> np.ndarray:
+        """Leaf positions of segments whose bounding box intersects `(min_lon, min_lat, max_lon, max_lat)`."""
+        min_x, min_y, max_x, max_y = bbox
+        levels = len(self.level_offsets) - 1
+        nodes = np.arange(self.level_offsets[levels] - self.level_offsets[levels - 1]) if levels else np.arange(len(self.segment_starts))
+        for level in range(levels - 1, -1, -1):
+            boxes = self.node_boxes[self.level_offsets[level] + nodes]
+            nodes = nodes[~((boxes[:, 2] < min_x) | (boxes[:, 0] > max_x) | (boxes[:, 3] < min_y) | (boxes[:, 1] > max_y))]
+            if not nodes.size:
+                return nodes
+            child_count = self.level_offsets[level] - self.level_offsets[level - 1] if level else len(self.segment_starts)
+            nodes = (nodes[:, None] * self.node_size + np.arange(self.node_size)).ravel()
+            nodes = nodes[nodes < child_count]
+        starts = self.segment_starts[nodes]
+        x0, y0 = self.coords[starts, 0], self.coords[starts, 1]
+        x1, y1 = self.coords[starts + 1, 0], self.coords[starts + 1, 1]
+        hit = ~(
+            (np.maximum(x0, x1) < min_x)
+            | (np.minimum(x0, x1) > max_x)
+            | (np.maximum(y0, y1) < min_y)
+            | (np.minimum(y0, y1) > max_y)
+        )
+        return nodes[hit]
+
+    def query_features(self, bbox: tuple[float, float, float, float]) -> np.ndarray:
+        """Sorted source feature indices with at least one segment in `bbox`, i.e. file order."""
+        return np.unique(self.segment_features[self.query_segments(bbox)])
+
+    def feature_geometries(self, features: np.ndarray) -> tuple[Any, ...]:
+        """Rebuild the selected features as shapely LineStrings (one part) or MultiLineStrings."""
+        import shapely
+
+        if not len(features):
+            return ()
+        first_part = self.feature_part_offsets[features]
+        part_counts = self.feature_part_offsets[features + 1] - first_part
+        parts = np.repeat(first_part - np.cumsum(part_counts) + part_counts, part_counts) + np.arange(part_counts.sum())
+        vertex_start = self.part_offsets[parts]
+        vertex_counts = self.part_offsets[parts + 1] - vertex_start
+        vertices = np.repeat(vertex_start - np.cumsum(vertex_counts) + vertex_counts, vertex_counts) + np.arange(vertex_counts.sum())
+        lines = shapely.linestrings(np.asarray(self.coords[vertices]), indices=np.repeat(np.arange(len(parts)), vertex_counts))
+        owners = np.repeat(np.arange(len(features)), part_counts)
+        geometries = np.empty(len(features), dtype=object)
+        single = part_counts == 1
+        geometries[single] = lines[np.flatnonzero(single[owners])]
+        if not single.all():
+            multi = ~single[owners]
+            geometries[~single] = shapely.multilinestrings(lines[multi], indices=np.unique(owners[multi], return_inverse=True)[1])
+        return tuple(geometries)
+
+
+def packed_index_dir(source: Path) -> Path:
+    return source.parent / PACKED_INDEX_DIRNAME / source.stem
+
+
+def packed_shoreline_index(source: Path) -> PackedShorelineIndex | None:
+    """Process-wide packed index for a shoreline shapefile, or None when none was built for the current file.
+
+    The arrays are mapped once; later calls only stat the shapefile and `meta.json`, so a rebuilt index
+    or a replaced shapefile is picked up without a restart.
+    """
+    key = str(source)
+    index_dir = packed_index_dir(source)
+    stamp = (file_stamp(source), file_stamp(index_dir / "meta.json"))
+    with _INDEX_LOCK:
+        cached = _INDEXES.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        index = None
+        if None not in stamp:
+            try:
+                candidate = PackedShorelineIndex.open(index_dir)
+            except (OSError, ValueError, KeyError):
+                candidate = None
+            # An index built from an older copy of the shapefile is ignored until it is rebuilt.
+            if candidate is not None and candidate.stamp == stamp[0]:
+                index = candidate
+        _INDEXES[key] = (stamp, index)
+        return index
+
+
+def file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def build_packed_shoreline_index(source: Path, *, node_size: int = RTREE_NODE_SIZE) -> dict[str, Any]:
+    """Read a line shapefile once and publish its packed index next to it under `packed/<stem>/`."""
+    import geopandas as gpd
+    import shapely
+
+    stamp = file_stamp(source)
+    if stamp is None:
+        raise FileNotFoundError(f"Shoreline file {source} does not exist.")
+    geometries = gpd.read_file(source, columns=[]).geometry.to_numpy()
+    valid = np.flatnonzero(~(shapely.is_missing(geometries) | shapely.is_empty(geometries)))
+    parts, part_features = shapely.get_parts(geometries[valid], return_index=True)
+    polygonal = shapely.get_type_id(parts) == 3
+    if polygonal.any():
+        rings, ring_owner = shapely.get_rings(parts[polygonal], return_index=True)
+        keep = np.flatnonzero(~polygonal)
+        parts = np.concatenate([parts[keep], rings])
+        part_features = np.concatenate([part_features[keep], part_features[polygonal][ring_owner]])
+        order = np.argsort(part_features, kind="stable")
+        parts, part_features = parts[order], part_features[order]
+    part_features = valid[part_features]
+    vertex_counts = shapely.get_num_coordinates(parts)
+    usable = vertex_counts >= 2
+    parts, part_features, vertex_counts = parts[usable], part_features[usable], vertex_counts[usable]
+
+    coords = shapely.get_coordinates(parts).astype(np.float64)
+    part_offsets = np.zeros(len(parts) + 1, dtype=np.int64)
+    np.cumsum(vertex_counts, out=part_offsets[1:])
+    feature_part_offsets = np.zeros(len(geometries) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(part_features, minlength=len(geometries)), out=feature_part_offsets[1:])
+
+    # Every vertex except the last of its part starts a segment.
+    is_start = np.ones(len(coords), dtype=bool)
+    is_start[part_offsets[1:] - 1] = False
+    segment_starts = np.flatnonzero(is_start)
+    segment_features = np.repeat(part_features, vertex_counts - 1).astype(np.int32)
+    order = str_order(coords[segment_starts] + coords[segment_starts + 1], node_size)
+    segment_starts = segment_starts[order]
+    segment_features = segment_features[order]
+    node_boxes, level_offsets = pack_levels(coords, segment_starts, node_size)
+
+    arrays = {
+        "coords": coords,
+        "part_offsets": part_offsets,
+        "feature_part_offsets": feature_part_offsets,
+        "segment_starts": segment_starts,
+        "segment_features": segment_features,
+        "node_boxes": node_boxes,
+        "level_offsets": level_offsets,
+    }
+    meta = {
+        "schema_version": PACKED_INDEX_SCHEMA,
+        "source": source.name,
+        "source_mtime_ns": stamp[0],
+        "source_size": stamp[1],
+        "node_size": node_size,
+        "feature_count": len(geometries),
+        "part_count": len(parts),
+        "vertex_count": len(coords),
+        "segment_count": len(segment_starts),
+        "tree_levels": len(level_offsets) - 1,
+    }
+    index_dir = packed_index_dir(source)
+    staging = index_dir.with_name(f"{index_dir.name}.{uuid.uuid4().hex}.tmp")
+    staging.mkdir(parents=True)
+    try:
+        for name, array in arrays.items():
+            np.save(staging / f"{name}.npy", array)
+        (staging / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        shutil.rmtree(index_dir, ignore_errors=True)
+        staging.replace(index_dir)
+    except Exception:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    meta["index_dir"] = str(index_dir)
+    meta["index_bytes"] = sum(path.stat().st_size for path in index_dir.iterdir())
+    return meta
+
+
+def str_order(centers: np.ndarray, node_size: int) -> np.ndarray:
+    """Sort-Tile-Recursive leaf order: vertical slices by x, then y within each slice."""
+    count = len(centers)
+    if not count:
+        return np.arange(0)
+    slice_count = math.ceil(math.sqrt(math.ceil(count / node_size)))
+    slice_size = node_size * math.ceil(count / (node_size * slice_count))
+    by_x = np.argsort(centers[:, 0], kind="stable")
+    slices = np.empty(count, dtype=np.int64)
+    slices[by_x] = np.arange(count) // slice_size
+    return np.lexsort((centers[:, 1], slices))
+
+
+def pack_levels(coords: np.ndarray, segment_starts: np.ndarray, node_size: int) -> tuple[np.ndarray, np.ndarray]:
+    """Group leaves `node_size` at a time into parent boxes, level by level, until one root remains."""
+    x0, y0 = coords[segment_starts, 0], coords[segment_starts, 1]
+    x1, y1 = coords[segment_starts + 1, 0], coords[segment_starts + 1, 1]
+    boxes = np.column_stack((np.minimum(x0, x1), np.minimum(y0, y1), np.maximum(x0, x1), np.maximum(y0, y1)))
+    levels = []
+    while len(boxes) > 1 or not levels:
+        groups = np.arange(0, len(boxes), node_size)
+        if not len(groups):
+            break
+        boxes = np.column_stack(
+            (
+                np.minimum.reduceat(boxes[:, 0], groups),
+                np.minimum.reduceat(boxes[:, 1], groups),
+                np.maximum.reduceat(boxes[:, 2], groups),
+                np.maximum.reduceat(boxes[:, 3], groups),
+            )
+        )
+        levels.append(outward_float32(boxes))
+    level_offsets = np.zeros(len(levels) + 1, dtype=np.int64)
+    np.cumsum([len(level) for level in levels], out=level_offsets[1:])
+    node_boxes = np.concatenate(levels) if levels else np.empty((0, 4), dtype=np.float32)
+    return node_boxes, level_offsets
+
+
+def outward_float32(boxes: np.ndarray) -> np.ndarray:
+    packed = boxes.astype(np.float32)
+    packed[:, :2] = np.where(packed[:, :2] > boxes[:, :2], np.nextafter(packed[:, :2], np.float32(-np.inf)), packed[:, :2])
+    packed[:, 2:] = np.where(packed[:, 2:] < boxes[:, 2:], np.nextafter(packed[:, 2:], np.float32(np.inf)), packed[:, 2:])
+    return packed
@@ -4,9 +4,8 @@ import copy
 import time
 from typing import Any
 
-import requests
-
 from agent.geo import lat_degrees_to_meters, lon_degrees_to_meters
+from agent.http_client import http_get
 from agent.sources.common import USER_AGENT
 
 
@@ -39,7 +38,7 @@ def cached_geocoder_query(query: str) -> list[dict[str, Any]]:
     if GEOCODER_CACHE:
         time.sleep(1.1)
     try:
-        response = requests.get(
+        response = http_get(
             NOMINATIM_SEARCH,
             headers={"User-Agent": USER_AGENT},
             params={"format": "json", "q": query, "limit": 6, "polygon_geojson": 1},
@@ -110,7 +109,7 @@ def geocode_first_match(query: str) -> dict[str, Any] | None:
     if not query:
         return None
     try:
-        response = requests.get(
+        response = http_get(
             NOMINATIM_SEARCH,
             headers={"User-Agent": USER_AGENT},
             params={"format": "json", "q": query, "limit": 1},
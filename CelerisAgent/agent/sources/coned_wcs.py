@@ -3,18 +3,22 @@ from __future__ import annotations
 import math
 import os
 import re
+import threading
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import requests
 
 from agent.config import CACHE
 from agent.dem.export import artifact
 from agent.dem.workflow import normalize_attachments
+from agent.http_client import http_get
 from agent.io_utils import read_json, write_json
 from agent.sources.aoi import aoi_resolution_steps, resolve_aoi
 from agent.sources.common import USER_AGENT, normalize_name
+from agent.sources.download_cache import fetch_cached_raster, store_cached_raster
 
 
 VIEWER_URL = "https://topotools.cr.usgs.gov/topobathy_viewer/"
@@ -25,23 +29,24 @@ WCS_NS = {
     "gml": "http://www.opengis.net/gml/3.2",
 }
 DEFAULT_MAX_NATIVE_SOURCE_CELLS = 10_000_000
-
-
-def retrieve_coned_wcs_dem(job_dir: Path, dem_request: dict[str, Any], options: dict[str, Any] | None = None) -> dict[str, Any]:
+CATALOG_SCHEMA_VERSION = 2
+_LAYER_INDEX: ConedLayerIndex | None = None
+_LAYER_INDEX_LOCK = threading.RLock()
+
+
+def retrieve_coned_wcs_dem(
+    job_dir: Path,
+    dem_request: dict[str, Any],
+    options: dict[str, Any] | None = None,
+    *,
+    probe: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Extract a service-native CoNED GeoTIFF for the AOI; `probe` is a finished `probe_coned_wcs` result."""
     options = dict(options or {})
-    aoi = resolve_aoi(dem_request)
-    catalog = load_coned_catalog()
-    candidates = find_covering_layers(catalog["layers"], aoi["bbox_wgs84"])
-    source_search = {
-        "source": "usgs_coned_wcs",
-        "viewer_url": VIEWER_URL,
-        "wcs_endpoint": WCS_ENDPOINT,
-        "aoi": aoi,
-        "catalog_layer_count": len(catalog["layers"]),
-        "candidate_count": len(candidates),
-        "candidates": candidates[:20],
-        "selection": None,
-    }
+    probe = probe or probe_coned_wcs(job_dir, dem_request, describe=False)
+    source_search = probe["source_search"]
+    aoi = source_search["aoi"]
+    candidates = probe["candidates"]
     selected_path = [
         "parse_dem_request",
         "resolve_aoi_center",
@@ -68,7 +73,7 @@ def retrieve_coned_wcs_dem(job_dir: Path, dem_request: dict[str, Any], options:
     source_search["selection"] = {"reason": "smallest_covering_coned_wcs_layer", "layer_name": selected["name"]}
     write_json(job_dir / "work" / "usgs_coned_wcs_candidates.json", source_search)
     try:
-        description = describe_coverage(selected)
+        description = probe.get("coverage_description") or describe_coverage_cached(selected)
         selected_path.append("usgs_coned_wcs_describe")
         if not described_coverage_intersects_aoi(aoi, description):
             retrieval = {
@@ -180,6 +185,7 @@ def retrieve_coned_wcs_dem(job_dir: Path, dem_request: dict[str, Any], options:
         "service_crs": description["crs"],
         "width": exported.get("width"),
         "height": exported.get("height"),
+        "download_cache": exported.get("download_cache"),
     }
     write_json(
         job_dir / "work" / "usgs_coned_wcs_retrieval.json",
@@ -193,29 +199,162 @@ def retrieve_coned_wcs_dem(job_dir: Path, dem_request: dict[str, Any], options:
     return result
 
 
+def probe_coned_wcs(job_dir: Path, dem_request: dict[str, Any], *, describe: bool = True) -> dict[str, Any]:
+    """Metadata phase of `retrieve_coned_wcs_dem`: catalog match and, with `describe`, DescribeCoverage for the best layer."""
+    aoi = resolve_aoi(dem_request)
+    index = coned_layer_index()
+    candidates = index.query(aoi["bbox_wgs84"])
+    source_search = {
+        "source": "usgs_coned_wcs",
+        "viewer_url": VIEWER_URL,
+        "wcs_endpoint": WCS_ENDPOINT,
+        "aoi": aoi,
+        "catalog_layer_count": len(index.layers),
+        "candidate_count": len(candidates),
+        "candidates": candidates[:20],
+        "selection": None,
+    }
+    description = None
+    if describe and candidates:
+        try:
+            description = describe_coverage_cached(candidates[0])
+        except Exception:
+            # The retrieval phase repeats the call and reports the failure.
+            description = None
+    return {"source_search": source_search, "candidates": candidates, "coverage_description": description}
+
+
 def load_coned_catalog(force_refresh: bool = False) -> dict[str, Any]:
     if not force_refresh:
         cached = read_json(CATALOG_PATH, default={})
         if cached.get("layers"):
+            if cached.get("schema_version") != CATALOG_SCHEMA_VERSION:
+                cached = upgrade_catalog(cached)
+                write_catalog(cached)
             return cached
-    html = requests.get(VIEWER_URL, headers={"User-Agent": USER_AGENT}, timeout=30).text
+    previous = read_json(CATALOG_PATH, default={})
+    html = http_get(VIEWER_URL, headers={"User-Agent": USER_AGENT}, timeout=30).text
     match = re.search(r'src="(main\.[^"]+\.js)"', html)
     if not match:
         raise RuntimeError("Could not find CoNED viewer main JavaScript bundle.")
     js_url = f"{VIEWER_URL.rstrip('/')}/{match.group(1)}"
-    js = requests.get(js_url, headers={"User-Agent": USER_AGENT}, timeout=60).text
+    js = http_get(js_url, headers={"User-Agent": USER_AGENT}, timeout=60).text
     layers = parse_viewer_layers(js)
-    catalog = {
-        "source": "usgs_coned_project_viewer",
-        "viewer_url": VIEWER_URL,
-        "bundle_url": js_url,
-        "wcs_endpoint": WCS_ENDPOINT,
-        "layers": layers,
-    }
-    write_json(CATALOG_PATH, catalog)
+    names = {layer["name"] for layer in layers}
+    catalog = upgrade_catalog(
+        {
+            "source": "usgs_coned_project_viewer",
+            "viewer_url": VIEWER_URL,
+            "bundle_url": js_url,
+            "wcs_endpoint": WCS_ENDPOINT,
+            "layers": layers,
+            # Keep DescribeCoverage results for layers the refreshed viewer still lists.
+            "coverage_descriptions": {name: value for name, value in (previous.get("coverage_descriptions") or {}).items() if name in names},
+        }
+    )
+    write_catalog(catalog)
+    return catalog
+
+
+def upgrade_catalog(catalog: dict[str, Any]) -> dict[str, Any]:
+    """Fill the precomputed per-layer fields: WGS84 footprint and, once described, native grid spacing."""
+    descriptions = catalog.setdefault("coverage_descriptions", {})
+    for layer in catalog["layers"]:
+        layer.setdefault("extent_wgs84", wgs84_bbox_from_webmercator(layer["extent_epsg3857"]))
+        description = descriptions.get(layer["name"])
+        if description:
+            layer["grid_spacing_m"] = description.get("grid_spacing_m")
+    catalog["schema_version"] = CATALOG_SCHEMA_VERSION
     return catalog
 
 
+def write_catalog(catalog: dict[str, Any]) -> None:
+    # Jobs read the catalog concurrently, so publish it with a rename instead of rewriting in place.
+    staging = CATALOG_PATH.with_name(f"{CATALOG_PATH.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    write_json(staging, catalog)
+    staging.replace(CATALOG_PATH)
+
+
+class ConedLayerIndex:
+    """In-memory CoNED catalog: layer footprints packed into one array for vectorized bbox queries."""
+
+    def __init__(self, catalog: dict[str, Any], stamp: Any = None) -> None:
+        self.catalog = catalog
+        self.stamp = stamp
+        self.layers = catalog["layers"]
+        self.descriptions: dict[str, dict[str, Any]] = catalog.setdefault("coverage_descriptions", {})
+        self.extents = np.array([layer["extent_epsg3857"] for layer in self.layers], dtype=np.float64).reshape(-1, 4)
+        # Rank by (area, name) once so a query only sorts its matches by containment and this rank.
+        order = sorted(range(len(self.layers)), key=lambda index: (self.layers[index]["area_m2"], self.layers[index]["name"]))
+        self.rank = np.empty(len(self.layers), dtype=np.int64)
+        self.rank[order] = np.arange(len(self.layers))
+
+    def query(self, bbox_wgs84: list[float]) -> list[dict[str, Any]]:
+        bbox = webmercator_bbox_from_wgs84(bbox_wgs84)
+        extents = self.extents
+        intersects = ~((extents[:, 2] < bbox[0]) | (extents[:, 0] > bbox[2]) | (extents[:, 3] < bbox[1]) | (extents[:, 1] > bbox[3]))
+        hits = np.flatnonzero(intersects)
+        if not hits.size:
+            return []
+        found = extents[hits]
+        contains = (found[:, 0] <= bbox[0]) & (found[:, 1] <= bbox[1]) & (found[:, 2] >= bbox[2]) & (found[:, 3] >= bbox[3])
+        matches = []
+        for position in np.lexsort((self.rank[hits], ~contains)):
+            item = dict(self.layers[int(hits[position])])
+            item["coverage"] = {
+                "contains_aoi": bool(contains[position]),
+                "intersects_aoi": True,
+                "request_bbox_epsg3857": bbox,
+            }
+            matches.append(item)
+        return matches
+
+
+def coned_layer_index() -> ConedLayerIndex:
+    """Process-wide layer index, rebuilt only when the catalog file changes on disk."""
+    global _LAYER_INDEX
+    with _LAYER_INDEX_LOCK:
+        stamp = catalog_stamp()
+        if _LAYER_INDEX is None or stamp is None or _LAYER_INDEX.stamp != stamp:
+            catalog = load_coned_catalog()
+            _LAYER_INDEX = ConedLayerIndex(catalog, catalog_stamp())
+        return _LAYER_INDEX
+
+
+def catalog_stamp() -> tuple[int, int] | None:
+    try:
+        stat = CATALOG_PATH.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def describe_coverage_cached(layer: dict[str, Any]) -> dict[str, Any]:
+    """DescribeCoverage through the catalog: known layers never hit the WCS endpoint again."""
+    index = coned_layer_index()
+    cached = index.descriptions.get(layer["name"])
+    if cached:
+        return dict(cached)
+    description = describe_coverage(layer)
+    remember_coverage_description(index, layer["name"], description)
+    return description
+
+
+def remember_coverage_description(index: ConedLayerIndex, name: str, description: dict[str, Any]) -> None:
+    with _LAYER_INDEX_LOCK:
+        # Another process may have described other layers since this index was loaded; keep those too.
+        on_disk = read_json(CATALOG_PATH, default={}).get("coverage_descriptions") or {}
+        for other, value in on_disk.items():
+            index.descriptions.setdefault(other, value)
+        index.descriptions[name] = description
+        upgrade_catalog(index.catalog)
+        try:
+            write_catalog(index.catalog)
+        except OSError:
+            return
+        index.stamp = catalog_stamp()
+
+
 def parse_viewer_layers(js: str) -> list[dict[str, Any]]:
     pattern = re.compile(
         r'\{type:"layer",id:"([^"]+)",name:"(topo:[^"]+)",title:"TBDEM".*?extent:\[([^\]]+)\].*?srs:"([^"]+)"',
@@ -252,22 +391,8 @@ def title_from_layer_name(name: str) -> str:
 
 
 def find_covering_layers(layers: list[dict[str, Any]], bbox_wgs84: list[float]) -> list[dict[str, Any]]:
-    bbox = webmercator_bbox_from_wgs84(bbox_wgs84)
-    matches = []
-    for layer in layers:
-        extent = layer["extent_epsg3857"]
-        contains = extent[0] <= bbox[0] and extent[1] <= bbox[1] and extent[2] >= bbox[2] and extent[3] >= bbox[3]
-        intersects = not (extent[2] < bbox[0] or extent[0] > bbox[2] or extent[3] < bbox[1] or extent[1] > bbox[3])
-        if contains or intersects:
-            item = dict(layer)
-            item["coverage"] = {
-                "contains_aoi": contains,
-                "intersects_aoi": intersects,
-                "request_bbox_epsg3857": bbox,
-            }
-            matches.append(item)
-    matches.sort(key=lambda item: (not item["coverage"]["contains_aoi"], item["area_m2"], item["name"]))
-    return matches
+    """Layers whose footprint intersects the AOI, containing layers first, then smallest area."""
+    return ConedLayerIndex({"layers": layers}).query(bbox_wgs84)
 
 
 def describe_coverage(layer: dict[str, Any]) -> dict[str, Any]:
@@ -277,7 +402,7 @@ def describe_coverage(layer: dict[str, Any]) -> dict[str, Any]:
         "version": "2.0.1",
         "coverageId": layer["name"],
     }
-    response = requests.get(WCS_ENDPOINT, headers={"User-Agent": USER_AGENT}, params=params, timeout=30)
+    response = http_get(WCS_ENDPOINT, headers={"User-Agent": USER_AGENT}, params=params, timeout=30)
     response.raise_for_status()
     root = ET.fromstring(response.content)
     coverage = root.find(".//wcs:CoverageDescription", WCS_NS)
@@ -369,24 +494,34 @@ def export_coverage(job_dir: Path, aoi: dict[str, Any], layer: dict[str, Any], d
     downloads = job_dir / "downloads"
     downloads.mkdir(parents=True, exist_ok=True)
     dst = downloads / f"usgs_coned_wcs_{safe_layer_filename(layer['id'])}.tif"
-    with requests.get(WCS_ENDPOINT, headers={"User-Agent": USER_AGENT}, params=params, stream=True, timeout=180) as response:
-        response.raise_for_status()
-        chunks = response.iter_content(1024 * 1024)
-        first_chunk = next(chunks, b"")
-        if first_chunk.lstrip().startswith(b"<?xml"):
-            error_path = job_dir / "work" / "usgs_coned_wcs_error.xml"
-            with error_path.open("wb") as out:
+    cache_layer = {
+        "source": "usgs_coned_wcs",
+        "coverage_id": description["coverage_id"],
+        "grid_spacing_m": description["grid_spacing_m"],
+    }
+    cache = fetch_cached_raster(cache_layer, subset_bbox, "EPSG:3857", dst)
+    if cache:
+        request_url = requests.Request("GET", WCS_ENDPOINT, params=params).prepare().url
+    else:
+        with http_get(WCS_ENDPOINT, headers={"User-Agent": USER_AGENT}, params=params, stream=True, timeout=180) as response:
+            response.raise_for_status()
+            chunks = response.iter_content(1024 * 1024)
+            first_chunk = next(chunks, b"")
+            if first_chunk.lstrip().startswith(b"<?xml"):
+                error_path = job_dir / "work" / "usgs_coned_wcs_error.xml"
+                with error_path.open("wb") as out:
+                    out.write(first_chunk)
+                    for chunk in chunks:
+                        if chunk:
+                            out.write(chunk)
+                raise RuntimeError(f"WCS GetCoverage returned XML error payload: {error_path}")
+            with dst.open("wb") as out:
                 out.write(first_chunk)
                 for chunk in chunks:
                     if chunk:
                         out.write(chunk)
-            raise RuntimeError(f"WCS GetCoverage returned XML error payload: {error_path}")
-        with dst.open("wb") as out:
-            out.write(first_chunk)
-            for chunk in chunks:
-                if chunk:
-                    out.write(chunk)
-        request_url = response.url
+            request_url = response.url
+        cache = store_cached_raster(cache_layer, subset_bbox, "EPSG:3857", dst, request_url)
 
     width = height = None
     try:
@@ -407,6 +542,7 @@ def export_coverage(job_dir: Path, aoi: dict[str, Any], layer: dict[str, Any], d
         "grid_spacing_m": {"dx": dx, "dy": dy},
         "width": width,
         "height": height,
+        "download_cache": cache,
     }
 
 
@@ -425,6 +561,19 @@ def lonlat_to_webmercator(lon: float, lat: float) -> tuple[float, float]:
     return x, y
 
 
+def webmercator_to_lonlat(x: float, y: float) -> tuple[float, float]:
+    radius = 6_378_137.0
+    lon = math.degrees(x / radius)
+    lat = math.degrees(2.0 * math.atan(math.exp(y / radius)) - math.pi / 2.0)
+    return lon, lat
+
+
+def wgs84_bbox_from_webmercator(extent: list[float]) -> list[float]:
+    min_lon, min_lat = webmercator_to_lonlat(extent[0], extent[1])
+    max_lon, max_lat = webmercator_to_lonlat(extent[2], extent[3])
+    return [min_lon, min_lat, max_lon, max_lat]
+
+
 def parse_float_pair(text: str | None) -> list[float]:
     if not text:
         raise RuntimeError("Expected a numeric coordinate pair.")
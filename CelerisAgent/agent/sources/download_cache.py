@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import math
+import shutil
+from pathlib import Path
+from typing import Any
+
+from agent.disk_cache import (
+    cache_key,
+    cache_max_bytes,
+    cache_stats,
+    commit_entry,
+    discard_staging,
+    iter_entries,
+    new_staging_dir,
+    record_cache_event,
+    touch_entry,
+)
+
+
+DEM_DOWNLOAD_CACHE = "dem_downloads"
+DEM_DOWNLOAD_CACHE_SCHEMA = 1
+DEFAULT_DEM_DOWNLOAD_CACHE_MAX_BYTES = 8 * 1024**3
+CACHED_RASTER_FILE = "raster.tif"
+BBOX_CONTAINMENT_TOLERANCE = 1e-6
+WINDOW_EDGE_TOLERANCE = 1e-6
+
+
+def fetch_cached_raster(layer: dict[str, Any], bbox: list[float], bbox_crs: str, dst: Path) -> dict[str, Any] | None:
+    """Write a cached download covering `bbox` to `dst`, cropping a larger cached request locally.
+
+    `layer` identifies the source, layer, and resolution; only entries with the same layer parts and
+    bbox CRS are considered, and the smallest cached request bbox that contains `bbox` wins.
+    """
+    layer_key = download_layer_key(layer)
+    match = None
+    for path, entry in iter_entries(DEM_DOWNLOAD_CACHE):
+        if entry.get("layer_key") != layer_key or entry.get("bbox_crs") != bbox_crs:
+            continue
+        cached_bbox = entry.get("bbox") or []
+        if len(cached_bbox) != 4 or not bbox_contains(cached_bbox, bbox):
+            continue
+        area = (cached_bbox[2] - cached_bbox[0]) * (cached_bbox[3] - cached_bbox[1])
+        if match is None or area < match[0]:
+            match = (area, path, entry)
+    if match is None:
+        record_cache_event(DEM_DOWNLOAD_CACHE, "misses")
+        return None
+
+    _area, path, entry = match
+    try:
+        crop = crop_cached_raster(path / CACHED_RASTER_FILE, bbox, bbox_crs, dst)
+    except Exception:
+        # Drop a damaged entry so the fresh download can be committed in its place.
+        shutil.rmtree(path, ignore_errors=True)
+        record_cache_event(DEM_DOWNLOAD_CACHE, "misses")
+        return None
+    touch_entry(path)
+    exact = bbox_equal(entry["bbox"], bbox)
+    record_cache_event(DEM_DOWNLOAD_CACHE, "hits")
+    if not exact:
+        record_cache_event(DEM_DOWNLOAD_CACHE, "superset_hits")
+    return {
+        "status": "hit" if exact else "superset_hit",
+        "namespace": DEM_DOWNLOAD_CACHE,
+        "entry_key": entry.get("key"),
+        "cached_bbox": entry["bbox"],
+        "bbox_crs": bbox_crs,
+        "cached_request_url": entry.get("request_url"),
+        **crop,
+        "stats": download_cache_stats(),
+    }
+
+
+def store_cached_raster(
+    layer: dict[str, Any],
+    bbox: list[float],
+    bbox_crs: str,
+    path: Path,
+    request_url: str | None = None,
+) -> dict[str, Any]:
+    """Publish a fresh download so later jobs can reuse it for the same or a smaller bbox."""
+    max_bytes = cache_max_bytes("CELERIS_DEM_CACHE_MAX_BYTES", DEFAULT_DEM_DOWNLOAD_CACHE_MAX_BYTES)
+    if max_bytes <= 0 or path.stat().st_size > max_bytes:
+        return {"status": "not_stored", "namespace": DEM_DOWNLOAD_CACHE, "stats": download_cache_stats()}
+    layer_key = download_layer_key(layer)
+    key = cache_key({"layer_key": layer_key, "bbox": [float(value) for value in bbox], "bbox_crs": bbox_crs})
+    staging = new_staging_dir(DEM_DOWNLOAD_CACHE)
+    try:
+        shutil.copyfile(path, staging / CACHED_RASTER_FILE)
+        commit_entry(
+            DEM_DOWNLOAD_CACHE,
+            key,
+            staging,
+            {
+                "layer_key": layer_key,
+                "layer": layer,
+                "bbox": [float(value) for value in bbox],
+                "bbox_crs": bbox_crs,
+                "request_url": request_url,
+                "size_bytes": path.stat().st_size,
+            },
+            max_bytes,
+        )
+    except OSError as exc:
+        discard_staging(staging)
+        return {"status": "store_failed", "namespace": DEM_DOWNLOAD_CACHE, "error": str(exc), "stats": download_cache_stats()}
+    return {"status": "stored", "namespace": DEM_DOWNLOAD_CACHE, "entry_key": key, "stats": download_cache_stats()}
+
+
+def download_cache_stats() -> dict[str, Any]:
+    return cache_stats(DEM_DOWNLOAD_CACHE)
+
+
+def download_layer_key(layer: dict[str, Any]) -> str:
+    return cache_key({"schema": DEM_DOWNLOAD_CACHE_SCHEMA, **layer})
+
+
+def bbox_contains(outer: list[float], inner: list[float]) -> bool:
+    tol = BBOX_CONTAINMENT_TOLERANCE * max(abs(outer[2] - outer[0]), abs(outer[3] - outer[1]), 1e-12)
+    return (
+        outer[0] <= inner[0] + tol
+        and outer[1] <= inner[1] + tol
+        and outer[2] >= inner[2] - tol
+        and outer[3] >= inner[3] - tol
+    )
+
+
+def bbox_equal(a: list[float], b: list[float]) -> bool:
+    return bbox_contains(a, b) and bbox_contains(b, a)
+
+
+def crop_cached_raster(src: Path, bbox: list[float], bbox_crs: str, dst: Path) -> dict[str, Any]:
+    """Copy `src` to `dst`, keeping only the pixels that cover `bbox`; returns the output size."""
+    import rasterio
+    from affine import Affine
+    from rasterio.crs import CRS
+    from rasterio.windows import Window
+
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    with rasterio.open(src) as ds:
+        read_bbox = list(bbox)
+        if ds.crs and CRS.from_user_input(bbox_crs) != ds.crs:
+            from rasterio.warp import transform_bounds
+
+            read_bbox = list(transform_bounds(bbox_crs, ds.crs, *bbox, densify_pts=21))
+        transform = ds.transform
+        col_off, row_off, width, height = bbox_pixel_window(transform, ds.width, ds.height, read_bbox)
+        if width <= 0 or height <= 0:
+            raise ValueError("Cached raster does not overlap the requested bbox.")
+        if (col_off, row_off, width, height) == (0, 0, ds.width, ds.height):
+            copy_over(src, dst)
+            return {"width": width, "height": height, "cropped": False}
+        data = ds.read(window=Window(col_off, row_off, width, height))
+        profile = ds.profile.copy()
+        profile.update(
+            width=width,
+            height=height,
+            transform=Affine(
+                transform.a,
+                transform.b,
+                transform.c + col_off * transform.a,
+                transform.d,
+                transform.e,
+                transform.f + row_off * transform.e,
+            ),
+        )
+    with rasterio.open(dst, "w", **profile) as out:
+        out.write(data)
+    return {"width": width, "height": height, "cropped": True, "window": {"col_off": col_off, "row_off": row_off}}
+
+
+def bbox_pixel_window(transform, width: int, height: int, bbox: list[float]) -> tuple[int, int, int, int]:
+    """Pixel window `(col_off, row_off, width, height)` of a north-up raster that covers `bbox`, clipped to the raster."""
+    if transform.b or transform.d:
+        raise ValueError("Rotated cached rasters cannot be cropped.")
+    cols = sorted(((bbox[0] - transform.c) / transform.a, (bbox[2] - transform.c) / transform.a))
+    rows = sorted(((bbox[1] - transform.f) / transform.e, (bbox[3] - transform.f) / transform.e))
+    col0 = max(0, math.floor(cols[0] + WINDOW_EDGE_TOLERANCE))
+    col1 = min(width, math.ceil(cols[1] - WINDOW_EDGE_TOLERANCE))
+    row0 = max(0, math.floor(rows[0] + WINDOW_EDGE_TOLERANCE))
+    row1 = min(height, math.ceil(rows[1] - WINDOW_EDGE_TOLERANCE))
+    return col0, row0, col1 - col0, row1 - row0
+
+
+def copy_over(src: Path, dst: Path) -> None:
+    if dst.exists():
+        dst.unlink()
+    shutil.copyfile(src, dst)
@@ -11,9 +11,11 @@ import requests
 
 from agent.dem.export import artifact
 from agent.dem.workflow import normalize_attachments
+from agent.http_client import http_get, http_head, http_post
 from agent.io_utils import write_json
 from agent.sources.aoi import aoi_resolution_steps, resolve_aoi
 from agent.sources.common import USER_AGENT, normalize_name
+from agent.sources.download_cache import fetch_cached_raster, store_cached_raster
 
 
 DATAVIEWER_API = "https://coast.noaa.gov/dataviewer/api/v1"
@@ -25,6 +27,9 @@ DEFAULT_DATASET_PREFERENCE = [
 ]
 DOWNLOADABLE_SUFFIXES = {".tif", ".tiff", ".zip", ".nc", ".cdf", ".asc", ".grd", ".txt", ".csv", ".xyz", ".mat", ".npy", ".npz"}
 DEFAULT_MAX_NATIVE_SOURCE_CELLS = 10_000_000
+SLR_SEARCH_LABEL = "noaa_slr_viewer_dem_candidates"
+USER_DATASET_SEARCH_LABEL = "noaa_dav_user_dataset_candidates"
+USER_DATASET_TYPES = ["DEM", "Lidar"]
 
 
 def retrieve_noaa_dem(
@@ -35,10 +40,14 @@ def retrieve_noaa_dem(
     dataset_preference: list[str] | None = None,
     strict_dataset: bool = False,
     search_label: str = "noaa_dav_candidates",
+    probe: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    """Search NOAA DAV and, when possible, export a GeoTIFF through ArcGIS ImageServer."""
+    """Search NOAA DAV and, when possible, export a GeoTIFF through ArcGIS ImageServer.
+
+    `probe` is a finished `search_noaa_dav` result wrapped as `{"source_search": ...}`; the search is skipped when given.
+    """
     options = dict(options or {})
-    source_search = search_noaa_dav(job_dir, dem_request, data_types=["DEM"], search_label=search_label)
+    source_search = probe["source_search"] if probe else search_noaa_dav(job_dir, dem_request, data_types=["DEM"], search_label=search_label)
     candidate, selection = choose_dem_candidate(source_search["candidates"], dem_request, dataset_preference, strict_dataset)
     source_search["selection"] = selection
     write_json(job_dir / "work" / f"{search_label}.json", source_search)
@@ -119,20 +128,26 @@ def retrieve_noaa_dem(
         "native_vertical_datum": native_vertical_datum,
         "width": exported["width"],
         "height": exported["height"],
+        "download_cache": exported["download_cache"],
     }
     return result
 
 
-def retrieve_noaa_slr_dem(job_dir: Path, dem_request: dict[str, Any], options: dict[str, Any] | None = None) -> dict[str, Any]:
-    request = dict(dem_request)
-    request["source_dataset_hint"] = SLR_DATASET_NAME
+def retrieve_noaa_slr_dem(
+    job_dir: Path,
+    dem_request: dict[str, Any],
+    options: dict[str, Any] | None = None,
+    *,
+    probe: dict[str, Any] | None = None,
+) -> dict[str, Any]:
     result = retrieve_noaa_dem(
         job_dir,
-        request,
+        slr_dem_request(dem_request),
         options,
         dataset_preference=[SLR_DATASET_NAME],
         strict_dataset=True,
-        search_label="noaa_slr_viewer_dem_candidates",
+        search_label=SLR_SEARCH_LABEL,
+        probe=probe,
     )
     result["selected_path"] = ["route_online_dem_source_tiers", "noaa_slr_viewer_dem_search", *result.get("selected_path", [])]
     if result.get("source_retrieval"):
@@ -141,13 +156,30 @@ def retrieve_noaa_slr_dem(job_dir: Path, dem_request: dict[str, Any], options: d
     return result
 
 
-def retrieve_user_specified_dav_dataset(job_dir: Path, dem_request: dict[str, Any], options: dict[str, Any] | None = None) -> dict[str, Any]:
+def probe_noaa_slr_dem(job_dir: Path, dem_request: dict[str, Any]) -> dict[str, Any]:
+    """Metadata phase of `retrieve_noaa_slr_dem`: the DAV mission search."""
+    return {"source_search": search_noaa_dav(job_dir, slr_dem_request(dem_request), data_types=["DEM"], search_label=SLR_SEARCH_LABEL)}
+
+
+def slr_dem_request(dem_request: dict[str, Any]) -> dict[str, Any]:
+    request = dict(dem_request)
+    request["source_dataset_hint"] = SLR_DATASET_NAME
+    return request
+
+
+def retrieve_user_specified_dav_dataset(
+    job_dir: Path,
+    dem_request: dict[str, Any],
+    options: dict[str, Any] | None = None,
+    *,
+    probe: dict[str, Any] | None = None,
+) -> dict[str, Any]:
     """Tier 1: find and retrieve a user-specified DAV dataset when possible."""
     options = dict(options or {})
-    source_search = search_noaa_dav(job_dir, dem_request, data_types=["DEM", "Lidar"], search_label="noaa_dav_user_dataset_candidates")
+    source_search = probe["source_search"] if probe else search_noaa_dav(job_dir, dem_request, data_types=USER_DATASET_TYPES, search_label=USER_DATASET_SEARCH_LABEL)
     candidate, selection = choose_user_specified_candidate(source_search["candidates"], dem_request)
     source_search["selection"] = selection
-    write_json(job_dir / "work" / "noaa_dav_user_dataset_candidates.json", source_search)
+    write_json(job_dir / "work" / f"{USER_DATASET_SEARCH_LABEL}.json", source_search)
     selected_path = [
         "parse_dem_request",
         "resolve_aoi_center",
@@ -224,6 +256,7 @@ def retrieve_user_specified_dav_dataset(job_dir: Path, dem_request: dict[str, An
         if candidate.get("native_vertical_datum"):
             options["vertical_datum"] = candidate["native_vertical_datum"]
         options["max_cells"] = 0
+        options["read_bbox_wgs84"] = source_search["aoi"]["bbox_wgs84"]
         options["source_georeferencing"] = {
             "source": "noaa_digital_coast",
             "source_bbox_wgs84": source_search["aoi"]["bbox_wgs84"],
@@ -252,6 +285,11 @@ def retrieve_user_specified_dav_dataset(job_dir: Path, dem_request: dict[str, An
     }
 
 
+def probe_user_specified_dav_dataset(job_dir: Path, dem_request: dict[str, Any]) -> dict[str, Any]:
+    """Metadata phase of `retrieve_user_specified_dav_dataset`: the DAV mission search."""
+    return {"source_search": search_noaa_dav(job_dir, dem_request, data_types=USER_DATASET_TYPES, search_label=USER_DATASET_SEARCH_LABEL)}
+
+
 def search_noaa_dav(
     job_dir: Path,
     dem_request: dict[str, Any],
@@ -267,11 +305,13 @@ def search_noaa_dav(
         "dataTypes": data_types,
         "dialect": "arcgis",
     }
-    response = requests.post(
+    response = http_post(
         f"{DATAVIEWER_API}/search/missions",
         headers={"User-Agent": USER_AGENT},
         json=payload,
         timeout=60,
+        # The mission search is a read-only query, so it is safe to retry despite being a POST.
+        retries=2,
     )
     response.raise_for_status()
     data = response.json()
@@ -502,27 +542,43 @@ def export_arcgis_image_service(
         "format": "tiff",
         "pixelType": "F32",
     }
-    response = requests.get(export_endpoint, headers={"User-Agent": USER_AGENT}, params=params, timeout=60)
-    response.raise_for_status()
-    export_data = response.json()
-    if "error" in export_data:
-        raise RuntimeError(f"ArcGIS export failed: {export_data['error']}")
-
     downloads = job_dir / "downloads"
     downloads.mkdir(parents=True, exist_ok=True)
     filename = safe_source_filename(candidate["name"], candidate["id"])
     dst = downloads / filename
     image_params = dict(params)
     image_params["f"] = "image"
-    with requests.get(export_endpoint, headers={"User-Agent": USER_AGENT}, params=image_params, stream=True, timeout=120) as raster_response:
-        raster_response.raise_for_status()
-        content_type = raster_response.headers.get("Content-Type", "")
-        if "tiff" not in content_type.lower():
-            raise RuntimeError(f"ArcGIS direct export returned {content_type or 'an unknown content type'} instead of image/tiff.")
-        with dst.open("wb") as out:
-            for chunk in raster_response.iter_content(1024 * 1024):
-                if chunk:
-                    out.write(chunk)
+    cache_layer = {
+        "source": "noaa_arcgis_image_service",
+        "image_service_url": candidate["image_service_url"],
+        "native_resolution_m": native_resolution,
+        "pixel_type": params["pixelType"],
+    }
+    cache = fetch_cached_raster(cache_layer, aoi["bbox_wgs84"], "EPSG:4326", dst)
+    if cache:
+        export_url = requests.Request("GET", export_endpoint, params=params).prepare().url
+        download_url = requests.Request("GET", export_endpoint, params=image_params).prepare().url
+        export_data = None
+        width = cache["width"]
+        height = cache["height"]
+    else:
+        response = http_get(export_endpoint, headers={"User-Agent": USER_AGENT}, params=params, timeout=60)
+        response.raise_for_status()
+        export_data = response.json()
+        if "error" in export_data:
+            raise RuntimeError(f"ArcGIS export failed: {export_data['error']}")
+        export_url = response.url
+        with http_get(export_endpoint, headers={"User-Agent": USER_AGENT}, params=image_params, stream=True, timeout=120) as raster_response:
+            raster_response.raise_for_status()
+            content_type = raster_response.headers.get("Content-Type", "")
+            if "tiff" not in content_type.lower():
+                raise RuntimeError(f"ArcGIS direct export returned {content_type or 'an unknown content type'} instead of image/tiff.")
+            with dst.open("wb") as out:
+                for chunk in raster_response.iter_content(1024 * 1024):
+                    if chunk:
+                        out.write(chunk)
+            download_url = raster_response.url
+        cache = store_cached_raster(cache_layer, aoi["bbox_wgs84"], "EPSG:4326", dst, download_url)
 
     source_georeferencing = {
         "source_crs": "EPSG:4326",
@@ -539,18 +595,20 @@ def export_arcgis_image_service(
             "candidate": candidate,
             "request_params": params,
             "export_response": export_data,
-            "download_url": raster_response.url,
+            "download_url": download_url,
             "downloaded_file": str(dst),
+            "download_cache": cache,
             "source_georeferencing": source_georeferencing,
         },
     )
     return {
         "path": dst,
-        "export_url": response.url,
-        "download_url": raster_response.url,
+        "export_url": export_url,
+        "download_url": download_url,
         "width": width,
         "height": height,
         "native_resolution_m": native_resolution,
+        "download_cache": cache,
         "source_georeferencing": source_georeferencing,
     }
 
@@ -605,6 +663,7 @@ def export_and_normalize_dav_dem(
         "native_vertical_datum": native_vertical_datum,
         "width": exported["width"],
         "height": exported["height"],
+        "download_cache": exported["download_cache"],
     }
     return result
 
@@ -642,7 +701,7 @@ def download_dav_link(job_dir: Path, url: str, candidate: dict[str, Any]) -> dic
     filename = filename_from_url(url) or f"dav_dataset_{candidate.get('id') or 'download'}"
     dst = job_dir / "downloads" / safe_download_filename(filename)
     dst.parent.mkdir(parents=True, exist_ok=True)
-    with requests.get(url, headers={"User-Agent": USER_AGENT}, stream=True, timeout=120) as response:
+    with http_get(url, headers={"User-Agent": USER_AGENT}, stream=True, timeout=120) as response:
         response.raise_for_status()
         content_type = response.headers.get("Content-Type", "")
         if "text/html" in content_type.lower() and not Path(dst.name).suffix:
@@ -661,7 +720,7 @@ def download_dav_link(job_dir: Path, url: str, candidate: dict[str, Any]) -> dic
 
 def estimate_download_size(url: str) -> int | None:
     try:
-        response = requests.head(url, headers={"User-Agent": USER_AGENT}, allow_redirects=True, timeout=20)
+        response = http_head(url, headers={"User-Agent": USER_AGENT}, allow_redirects=True, timeout=20)
         if response.ok and response.headers.get("Content-Length"):
             return int(response.headers["Content-Length"])
     except Exception:
@@ -6,14 +6,14 @@ from urllib.parse import urlencode
 from pathlib import Path
 from typing import Any
 
-import requests
-
 from agent.dem.export import artifact
 from agent.dem.workflow import normalize_attachments
 from agent.geo import lat_degrees_to_meters, lon_degrees_to_meters
+from agent.http_client import http_get
 from agent.io_utils import write_json
 from agent.sources.aoi import aoi_resolution_steps, resolve_aoi
 from agent.sources.common import USER_AGENT, normalize_name
+from agent.sources.download_cache import fetch_cached_raster, store_cached_raster
 
 
 GLOBAL_MOSAIC_IMAGE_SERVER = "https://gis.ngdc.noaa.gov/arcgis/rest/services/DEM_mosaics/DEM_global_mosaic/ImageServer"
@@ -55,10 +55,19 @@ GRID_EXTRACT_DATASETS = [
 ]
 
 
-def retrieve_public_gridded_dem(job_dir: Path, dem_request: dict[str, Any], options: dict[str, Any] | None = None) -> dict[str, Any]:
-    """Retrieve a DEM from public NOAA Grid Extract ImageServer datasets."""
+def retrieve_public_gridded_dem(
+    job_dir: Path,
+    dem_request: dict[str, Any],
+    options: dict[str, Any] | None = None,
+    *,
+    probe: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Retrieve a DEM from public NOAA Grid Extract ImageServer datasets.
+
+    `probe` is a finished `probe_public_gridded_dem` result; the candidate search is skipped when given.
+    """
     options = dict(options or {})
-    source_search = search_public_gridded_sources(job_dir, dem_request)
+    source_search = probe["source_search"] if probe else search_public_gridded_sources(job_dir, dem_request)
     selected_path = [
         "parse_dem_request",
         "resolve_aoi_center",
@@ -105,6 +114,11 @@ def retrieve_public_gridded_dem(job_dir: Path, dem_request: dict[str, Any], opti
     }
 
 
+def probe_public_gridded_dem(job_dir: Path, dem_request: dict[str, Any]) -> dict[str, Any]:
+    """Metadata phase of `retrieve_public_gridded_dem`: candidate datasets and their export grid sizes."""
+    return {"source_search": search_public_gridded_sources(job_dir, dem_request)}
+
+
 def search_public_gridded_sources(job_dir: Path, dem_request: dict[str, Any]) -> dict[str, Any]:
     aoi = resolve_aoi(dem_request)
     candidates = select_candidates(dem_request)
@@ -167,7 +181,7 @@ def query_global_mosaic_candidates(aoi: dict[str, Any]) -> list[dict[str, Any]]:
         "resultRecordCount": "100",
     }
     try:
-        response = requests.get(f"{GLOBAL_MOSAIC_IMAGE_SERVER}/query", headers={"User-Agent": USER_AGENT}, params=params, timeout=60)
+        response = http_get(f"{GLOBAL_MOSAIC_IMAGE_SERVER}/query", headers={"User-Agent": USER_AGENT}, params=params, timeout=60)
         response.raise_for_status()
         data = response.json()
     except Exception:
@@ -244,19 +258,26 @@ def export_grid_extract_dataset(job_dir: Path, aoi: dict[str, Any], candidate: d
     downloads = job_dir / "downloads"
     downloads.mkdir(parents=True, exist_ok=True)
     dst = downloads / safe_filename(f"public_noaa_{candidate['id']}.tif")
-
-    with requests.get(url, headers={"User-Agent": USER_AGENT}, stream=True, timeout=180) as response:
-        response.raise_for_status()
-        content_type = response.headers.get("Content-Type", "")
-        if "json" in content_type.lower() or "html" in content_type.lower() or "text" in content_type.lower():
-            raise RuntimeError(f"NOAA Grid Extract returned {content_type or 'text'} instead of GeoTIFF.")
-        with dst.open("wb") as out:
-            for chunk in response.iter_content(1024 * 1024):
-                if chunk:
-                    out.write(chunk)
-
-    if dst.stat().st_size == 0:
-        raise RuntimeError("NOAA Grid Extract returned an empty GeoTIFF.")
+    cache_layer = {
+        "source": "public_noaa_gridded",
+        "dataset_id": candidate["id"],
+        "resolution_degrees": candidate["resolution_degrees"],
+    }
+    cache = fetch_cached_raster(cache_layer, grid_size["bbox_wgs84"], "EPSG:4326", dst)
+    if not cache:
+        with http_get(url, headers={"User-Agent": USER_AGENT}, stream=True, timeout=180) as response:
+            response.raise_for_status()
+            content_type = response.headers.get("Content-Type", "")
+            if "json" in content_type.lower() or "html" in content_type.lower() or "text" in content_type.lower():
+                raise RuntimeError(f"NOAA Grid Extract returned {content_type or 'text'} instead of GeoTIFF.")
+            with dst.open("wb") as out:
+                for chunk in response.iter_content(1024 * 1024):
+                    if chunk:
+                        out.write(chunk)
+
+        if dst.stat().st_size == 0:
+            raise RuntimeError("NOAA Grid Extract returned an empty GeoTIFF.")
+        cache = store_cached_raster(cache_layer, grid_size["bbox_wgs84"], "EPSG:4326", dst, url)
 
     source_georeferencing = {
         "source": "public_noaa_gridded",
@@ -280,11 +301,12 @@ def export_grid_extract_dataset(job_dir: Path, aoi: dict[str, Any], candidate: d
         "candidate_name": candidate["name"],
         "export_url": url,
         "downloaded_file": str(dst),
-        "width": grid_size["width"],
-        "height": grid_size["height"],
+        "width": cache.get("width", grid_size["width"]),
+        "height": cache.get("height", grid_size["height"]),
         "native_resolution_degrees": candidate["resolution_degrees"],
         "native_resolution_m_approx": source_georeferencing["native_resolution_m_approx"],
         "native_vertical_datum": candidate["vertical_datum"],
+        "download_cache": cache,
         "source_georeferencing": source_georeferencing,
     }
     write_json(job_dir / "work" / f"public_noaa_gridded_{candidate['id']}.json", retrieval)
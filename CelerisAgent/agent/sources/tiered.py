@@ -1,19 +1,48 @@
 from __future__ import annotations
 
+import os
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
 from typing import Any
 
 from agent.io_utils import write_json
-from agent.sources.coned_wcs import retrieve_coned_wcs_dem
-from agent.sources.noaa_dav import retrieve_noaa_slr_dem, retrieve_user_specified_dav_dataset
-from agent.sources.public_gridded import retrieve_public_gridded_dem
+from agent.sources.aoi import resolve_aoi
+from agent.sources.coned_wcs import probe_coned_wcs, retrieve_coned_wcs_dem
+from agent.sources.download_cache import download_cache_stats
+from agent.sources.noaa_dav import (
+    probe_noaa_slr_dem,
+    probe_user_specified_dav_dataset,
+    retrieve_noaa_slr_dem,
+    retrieve_user_specified_dav_dataset,
+)
+from agent.sources.public_gridded import probe_public_gridded_dem, retrieve_public_gridded_dem
 
 
 SUCCESS_STATUSES = {"completed", "needs_review", "source_data_staged", "needs_user_confirmation"}
+# (label, tier number, metadata probe, retrieval) in priority order.
+SOURCE_TIERS = [
+    ("tier_1_user_specified_us_dataset", 1, probe_user_specified_dav_dataset, retrieve_user_specified_dav_dataset),
+    ("tier_2_usgs_coned_wcs", 2, probe_coned_wcs, retrieve_coned_wcs_dem),
+    ("tier_2_noaa_slr_viewer_dem", 2, probe_noaa_slr_dem, retrieve_noaa_slr_dem),
+    ("tier_3_public_noaa_gridded", 3, probe_public_gridded_dem, retrieve_public_gridded_dem),
+]
+TIER_PROBE_MODES = {"sequential", "concurrent"}
+DEFAULT_TIER_PROBE_DEADLINE_S = 60.0
+TIER_PROBE_DEADLINES_S = {
+    # The CoNED probe may rebuild the viewer catalog before DescribeCoverage.
+    "tier_2_usgs_coned_wcs": 120.0,
+}
 
 
 def retrieve_tiered_dem(job_dir: Path, dem_request: dict[str, Any], options: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Try the online DEM tiers in priority order and return the first usable result.
+
+    With `CELERIS_TIER_PROBE_MODE=concurrent` the metadata phase of every tier (catalog match, DescribeCoverage,
+    DAV and ImageServer searches) starts at once on a thread pool; tiers are still consumed in priority order and
+    only the first successful tier downloads, so the outcome matches sequential mode.
+    """
     attempts: list[dict[str, Any]] = []
     if explicitly_public_gridded(dem_request):
         result = retrieve_public_gridded_dem(job_dir, dem_request, options)
@@ -21,47 +50,110 @@ def retrieve_tiered_dem(job_dir: Path, dem_request: dict[str, Any], options: dic
         result["tier_attempts"] = attempts
         return result
 
-    if dem_request.get("source_dataset_hint"):
-        result = attempt("tier_1_user_specified_us_dataset", retrieve_user_specified_dav_dataset, job_dir, dem_request, options)
-        attempts.append(summarize_attempt(result))
-        if result.get("status") in SUCCESS_STATUSES:
-            result["source_tier"] = 1
-            result["tier_attempts"] = attempts
-            write_json(job_dir / "work" / "tiered_source_attempts.json", {"attempts": attempts})
-            return result
-
-    result = attempt("tier_2_usgs_coned_wcs", retrieve_coned_wcs_dem, job_dir, dem_request, options)
-    attempts.append(summarize_attempt(result))
-    if result.get("status") in SUCCESS_STATUSES:
-        result["source_tier"] = 2
-        result["tier_attempts"] = attempts
-        write_json(job_dir / "work" / "tiered_source_attempts.json", {"attempts": attempts})
-        return result
-
-    result = attempt("tier_2_noaa_slr_viewer_dem", retrieve_noaa_slr_dem, job_dir, dem_request, options)
-    attempts.append(summarize_attempt(result))
-    if result.get("status") in SUCCESS_STATUSES:
-        result["source_tier"] = 2
-        result["tier_attempts"] = attempts
-        write_json(job_dir / "work" / "tiered_source_attempts.json", {"attempts": attempts})
-        return result
-
-    result = attempt("tier_3_public_noaa_gridded", retrieve_public_gridded_dem, job_dir, dem_request, options)
-    attempts.append(summarize_attempt(result))
-    if result.get("status") in SUCCESS_STATUSES:
-        result["source_tier"] = 3
-        result["tier_attempts"] = attempts
-        write_json(job_dir / "work" / "tiered_source_attempts.json", {"attempts": attempts})
-        return result
+    tiers = [tier for tier in SOURCE_TIERS if tier[0] != "tier_1_user_specified_us_dataset" or dem_request.get("source_dataset_hint")]
+    probes = TierProbes(job_dir, dem_request, tiers) if tier_probe_mode() == "concurrent" else None
+    try:
+        for label, tier_number, probe_func, retrieve_func in tiers:
+            if probes is None:
+                result = attempt(label, retrieve_func, job_dir, dem_request, options)
+            else:
+                result = attempt(label, probes.retrieval(label, retrieve_func), job_dir, dem_request, options)
+                result["probe_seconds"] = probes.elapsed(label)
+            attempts.append(summarize_attempt(result))
+            if result.get("status") in SUCCESS_STATUSES:
+                result["source_tier"] = tier_number
+                result["tier_attempts"] = attempts
+                write_tier_attempts(job_dir, attempts, probes)
+                return result
+    finally:
+        if probes is not None:
+            probes.cancel()
 
     result = online_sources_exhausted(attempts)
     result["source_tier"] = 3
     result["tier_attempts"] = attempts
-    write_json(job_dir / "work" / "tiered_source_attempts.json", {"attempts": attempts})
+    write_tier_attempts(job_dir, attempts, probes)
     write_json(job_dir / "work" / "online_source_retrieval_failed.json", result)
     return result
 
 
+def tier_probe_mode() -> str:
+    mode = (os.environ.get("CELERIS_TIER_PROBE_MODE") or "sequential").strip().lower()
+    return mode if mode in TIER_PROBE_MODES else "sequential"
+
+
+def tier_probe_deadline(label: str) -> float:
+    raw = os.environ.get("CELERIS_TIER_PROBE_TIMEOUT_S")
+    if raw:
+        try:
+            value = float(raw)
+            if value > 0:
+                return value
+        except ValueError:
+            pass
+    return TIER_PROBE_DEADLINES_S.get(label, DEFAULT_TIER_PROBE_DEADLINE_S)
+
+
+class TierProbes:
+    """Runs every tier's metadata probe concurrently; retrievals wait for their own probe up to its deadline."""
+
+    def __init__(self, job_dir: Path, dem_request: dict[str, Any], tiers: list[tuple]) -> None:
+        # Resolve the AOI once up front so the probes share the memoized result instead of geocoding in parallel.
+        try:
+            resolve_aoi(dem_request)
+        except Exception:
+            pass  # each probe raises it again and the attempt records the failure
+        self.started = time.perf_counter()
+        self.finished: dict[str, float] = {}
+        self.deadlines = {label: tier_probe_deadline(label) for label, *_rest in tiers}
+        self.executor = ThreadPoolExecutor(max_workers=len(tiers), thread_name_prefix="tier-probe")
+        self.futures: dict[str, Future] = {}
+        for label, _tier_number, probe_func, _retrieve_func in tiers:
+            future = self.executor.submit(probe_func, job_dir, dem_request)
+            future.add_done_callback(lambda _future, label=label: self.finished.setdefault(label, time.perf_counter() - self.started))
+            self.futures[label] = future
+
+    def probe(self, label: str) -> dict[str, Any]:
+        remaining = self.deadlines[label] - (time.perf_counter() - self.started)
+        try:
+            return self.futures[label].result(timeout=max(0.0, remaining))
+        except FutureTimeoutError:
+            self.futures[label].cancel()
+            raise TimeoutError(f"{label} metadata probe exceeded its {self.deadlines[label]:g} s deadline.") from None
+
+    def retrieval(self, label: str, retrieve_func):
+        def run(job_dir: Path, dem_request: dict[str, Any], options: dict[str, Any] | None) -> dict[str, Any]:
+            return retrieve_func(job_dir, dem_request, options, probe=self.probe(label))
+
+        return run
+
+    def elapsed(self, label: str) -> float | None:
+        value = self.finished.get(label)
+        return round(value, 3) if value is not None else None
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "mode": "concurrent",
+            "deadlines_s": self.deadlines,
+            "probe_seconds": {label: self.elapsed(label) for label in self.futures},
+        }
+
+    def cancel(self) -> None:
+        # Probes that already started cannot be interrupted; they finish in the background and are discarded.
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def write_tier_attempts(job_dir: Path, attempts: list[dict[str, Any]], probes: TierProbes | None) -> None:
+    write_json(
+        job_dir / "work" / "tiered_source_attempts.json",
+        {
+            "attempts": attempts,
+            "probes": probes.summary() if probes is not None else {"mode": "sequential"},
+            "download_cache": download_cache_stats(),
+        },
+    )
+
+
 def attempt(label: str, func, job_dir: Path, dem_request: dict[str, Any], options: dict[str, Any] | None) -> dict[str, Any]:
     started = time.perf_counter()
     try:
@@ -102,9 +194,18 @@ def summarize_attempt(result: dict[str, Any]) -> dict[str, Any]:
         "retrieval_reason": retrieval.get("reason"),
         "candidate_name": retrieval.get("candidate_name"),
         "error": retrieval.get("error"),
+        "probe_seconds": result.get("probe_seconds"),
+        "download_cache": download_cache_summary(retrieval.get("download_cache")),
     }
 
 
+def download_cache_summary(cache: dict[str, Any] | None) -> dict[str, Any] | None:
+    if not cache:
+        return None
+    stats = cache.get("stats") or {}
+    return {"status": cache.get("status"), "hit_rate": stats.get("hit_rate"), "hits": stats.get("hits"), "misses": stats.get("misses")}
+
+
 def online_sources_exhausted(attempts: list[dict[str, Any]]) -> dict[str, Any]:
     return {
         "status": "online_sources_exhausted",
@@ -396,6 +396,9 @@ function compactProgressDetail(event) {
     const fill = data.nan_fill || {};
     return `${data.WIDTH || "?"} x ${data.HEIGHT || "?"} grid, ${fill.filled_cells || 0} NaNs filled`;
   }
+  if (event.stage === "celeris_write_bathy" && Number.isFinite(data.rows) && Number.isFinite(data.rows_written)) {
+    return `${data.rows_written} / ${data.rows} rows (${data.percent ?? 0}%)`;
+  }
   if (event.stage === "celeris_satellite_overlay_done") {
     const output = data.output || {};
     return `${data.status || "finished"}${output.tile_count ? `, ${output.tile_count} tiles` : ""}`;
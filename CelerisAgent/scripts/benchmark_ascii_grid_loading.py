@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+import sys
+from typing import Any
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from agent.dem.loaders import load_ascii_grid
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the streaming ESRI ASCII grid loader against whole-file np.loadtxt parsing.")
+    parser.add_argument("--path", type=Path, help="Existing .asc/.grd file. A synthetic grid is written when omitted.")
+    parser.add_argument("--rows", type=int, default=4000)
+    parser.add_argument("--columns", type=int, default=4000)
+    parser.add_argument("--output-json", type=Path)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.path or write_synthetic_grid(Path(tmp) / "synthetic.asc", args.rows, args.columns)
+        report: dict[str, Any] = {"path": str(path), "bytes": path.stat().st_size}
+        streaming = measure(lambda: load_ascii_grid(path).z)
+        whole_file = measure(lambda: whole_file_ascii_grid(path))
+        report["streaming"] = {key: value for key, value in streaming.items() if key != "z"}
+        report["whole_file"] = {key: value for key, value in whole_file.items() if key != "z"}
+        report["matches_whole_file"] = bool(np.array_equal(streaming["z"], whole_file["z"], equal_nan=True))
+
+    size_mb = report["bytes"] / 2**20
+    for name in ("streaming", "whole_file"):
+        result = report[name]
+        print(f"{name:>10}: {result['elapsed_s']:.2f} s, peak traced memory {result['peak_mb']:.0f} MB for a {size_mb:.0f} MB file")
+    print(f"matches_whole_file={report['matches_whole_file']}")
+    if args.output_json:
+        args.output_json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+def measure(run) -> dict[str, Any]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    z = run()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"elapsed_s": elapsed, "peak_mb": peak / 2**20, "shape": list(z.shape), "z": z}
+
+
+def write_synthetic_grid(path: Path, rows: int, columns: int) -> Path:
+    rng = np.random.default_rng(0)
+    z = np.round(rng.normal(size=(rows, columns)) * 50.0, 3)
+    z[: rows // 20, : columns // 20] = -9999.0
+    with path.open("w", encoding="ascii") as fh:
+        fh.write(f"ncols {columns}\nnrows {rows}\nxllcorner 0.0\nyllcorner 0.0\ncellsize 1.0\nNODATA_value -9999\n")
+        np.savetxt(fh, z, fmt="%.3f")
+    return path
+
+
+def whole_file_ascii_grid(path: Path) -> np.ndarray:
+    """The previous load_ascii_grid body parse: read all lines, then one np.loadtxt call."""
+    lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
+    header: dict[str, float] = {}
+    data_start = 0
+    for idx, line in enumerate(lines[:20]):
+        parts = line.strip().split()
+        if len(parts) >= 2 and parts[0].lower() in {"ncols", "nrows", "xllcorner", "yllcorner", "xllcenter", "yllcenter", "cellsize", "nodata_value"}:
+            header[parts[0].lower()] = float(parts[1])
+            data_start = idx + 1
+    z = np.loadtxt(lines[data_start:], dtype=np.float32)
+    nodata = header.get("nodata_value")
+    if nodata is not None:
+        z = np.where(z == nodata, np.nan, z)
+    return z
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+import sys
+from typing import Any
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from agent.celeris.workflow import NAN_FILL_METHODS, fill_bathy_nans
+
+
+GAP_PATTERNS = ("speckle", "swaths", "large_hole", "edge_bands")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark CELERIS bathy NaN fill methods on synthetic gap patterns.")
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--columns", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--pattern", action="append", choices=GAP_PATTERNS, help="Gap pattern to run; repeat for several. Defaults to all.")
+    parser.add_argument("--method", action="append", choices=NAN_FILL_METHODS, help="Fill method to run; repeat for several. Defaults to all.")
+    parser.add_argument("--output-json", type=Path)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    base = synthetic_bathy(args.rows, args.columns)
+    methods = args.method or list(NAN_FILL_METHODS)
+    results: list[dict[str, Any]] = []
+    for pattern in args.pattern or GAP_PATTERNS:
+        z = apply_gap_pattern(base, pattern, rng)
+        reference = None
+        for method in methods:
+            timings = []
+            for _ in range(max(1, args.repeat)):
+                started = time.perf_counter()
+                filled, summary = fill_bathy_nans(z, method=method)
+                timings.append(time.perf_counter() - started)
+            if method == "loop":
+                reference = filled
+            results.append(
+                {
+                    "pattern": pattern,
+                    "method": method,
+                    "best_s": min(timings),
+                    "median_s": float(np.median(timings)),
+                    "summary": summary,
+                    "_filled": filled,
+                }
+            )
+        for result in results:
+            filled = result.pop("_filled", None)
+            if result["pattern"] == pattern and reference is not None and filled is not None:
+                result["matches_loop"] = bool(np.array_equal(filled, reference))
+
+    report = {"rows": args.rows, "columns": args.columns, "repeat": args.repeat, "seed": args.seed, "results": results}
+    for result in results:
+        summary = result["summary"]
+        match = "" if "matches_loop" not in result else f"  matches_loop={result['matches_loop']}"
+        print(
+            f"{result['pattern']:>11} {result['method']:>9}  best {result['best_s']:8.3f} s  "
+            f"filled {summary['filled_cells']} (linear {summary['linear_cells']}, nearest {summary['nearest_cells']}){match}"
+        )
+    if args.output_json:
+        args.output_json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+def synthetic_bathy(rows: int, columns: int) -> np.ndarray:
+    y = np.linspace(0.0, 1.0, rows)[:, None]
+    x = np.linspace(0.0, 1.0, columns)[None, :]
+    return -40.0 * x + 8.0 * np.sin(6.0 * np.pi * y) * np.cos(4.0 * np.pi * x) + 5.0
+
+
+def apply_gap_pattern(base: np.ndarray, pattern: str, rng: np.random.Generator) -> np.ndarray:
+    z = base.copy()
+    rows, columns = z.shape
+    if pattern == "speckle":
+        z[rng.random(z.shape) < 0.2] = np.nan
+    elif pattern == "swaths":
+        # Lidar-style missing flight lines plus scattered dropouts.
+        for start in range(0, columns, max(columns // 12, 1)):
+            z[:, start : start + max(columns // 60, 1)] = np.nan
+        z[rng.random(z.shape) < 0.05] = np.nan
+    elif pattern == "large_hole":
+        z[rows // 4 : 3 * rows // 4, columns // 4 : 3 * columns // 4] = np.nan
+    elif pattern == "edge_bands":
+        z[:, : columns // 10] = np.nan
+        z[: rows // 10, :] = np.nan
+    else:
+        raise ValueError(f"Unknown gap pattern {pattern!r}.")
+    return z
+
+
+if __name__ == "__main__":
+    main()
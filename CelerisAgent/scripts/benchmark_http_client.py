@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import sys
+from typing import Any
+
+import requests
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from agent.http_client import http_get, http_stats, reset_http_stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Exercise agent.http_client against a local stub HTTP server: connection reuse, retry, and per-host limits.")
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--payload-bytes", type=int, default=16 * 1024)
+    parser.add_argument("--flaky-failures", type=int, default=2, help="503 responses the stub returns before succeeding.")
+    parser.add_argument("--parallel", type=int, default=16, help="Client threads for the per-host limit check.")
+    parser.add_argument("--max-per-host", type=int, default=4)
+    parser.add_argument("--output-json", type=Path)
+    args = parser.parse_args()
+
+    os.environ["CELERIS_HTTP_MAX_PER_HOST"] = str(args.max_per_host)
+    server = StubServer(args.payload_bytes, args.flaky_failures)
+    base = f"http://127.0.0.1:{server.port}"
+    report: dict[str, Any] = {"requests": args.requests, "payload_bytes": args.payload_bytes}
+    try:
+        report["bare_requests"] = server.measure(lambda: [requests.get(f"{base}/tile", timeout=10).content for _ in range(args.requests)])
+        report["pooled_client"] = server.measure(lambda: [http_get(f"{base}/tile", timeout=10).content for _ in range(args.requests)])
+
+        reset_http_stats()
+        started = time.perf_counter()
+        response = http_get(f"{base}/flaky", timeout=10)
+        report["retry"] = {
+            "final_status": response.status_code,
+            "elapsed_s": time.perf_counter() - started,
+            "stats": http_stats().get(f"127.0.0.1:{server.port}"),
+        }
+
+        server.reset()
+        with ThreadPoolExecutor(max_workers=args.parallel) as pool:
+            list(pool.map(lambda _index: http_get(f"{base}/slow", timeout=10).content, range(args.parallel * 2)))
+        report["per_host_limit"] = {"max_per_host": args.max_per_host, "max_in_flight_seen": server.max_in_flight}
+    finally:
+        server.close()
+
+    for name in ("bare_requests", "pooled_client"):
+        result = report[name]
+        print(f"{name:>13}: {result['elapsed_s']:.3f} s, {result['connections']} TCP connections for {args.requests} requests")
+    retry = report["retry"]
+    print(f"retry: status {retry['final_status']} after {retry['stats']['retries']} retried 503s in {retry['elapsed_s']:.2f} s")
+    limit = report["per_host_limit"]
+    print(f"per-host limit: {limit['max_in_flight_seen']} in flight with limit {limit['max_per_host']} and {args.parallel} client threads")
+    if args.output_json:
+        args.output_json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+class StubServer:
+    """Keep-alive HTTP/1.1 stub that counts accepted connections and concurrent requests."""
+
+    def __init__(self, payload_bytes: int, flaky_failures: int) -> None:
+        self.payload = b"x" * payload_bytes
+        self.flaky_failures = flaky_failures
+        self.lock = threading.Lock()
+        self.reset()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out as separate writes; without this, delayed ACKs stall every keep-alive reply.
+            disable_nagle_algorithm = True
+
+            def setup(self) -> None:
+                with stub.lock:
+                    stub.connections += 1
+                super().setup()
+
+            def do_GET(self) -> None:
+                if self.path.startswith("/flaky"):
+                    with stub.lock:
+                        stub.flaky_hits += 1
+                        failing = stub.flaky_hits <= stub.flaky_failures
+                    if failing:
+                        self.reply(503, b"busy", {"Retry-After": "0"})
+                        return
+                elif self.path.startswith("/slow"):
+                    with stub.lock:
+                        stub.in_flight += 1
+                        stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                    time.sleep(0.05)
+                    with stub.lock:
+                        stub.in_flight -= 1
+                self.reply(200, stub.payload)
+
+            def reply(self, status: int, body: bytes, headers: dict[str, str] | None = None) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/octet-stream")
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_args: Any) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def reset(self) -> None:
+        self.connections = 0
+        self.flaky_hits = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def measure(self, run) -> dict[str, Any]:
+        self.reset()
+        started = time.perf_counter()
+        run()
+        return {"elapsed_s": time.perf_counter() - started, "connections": self.connections}
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
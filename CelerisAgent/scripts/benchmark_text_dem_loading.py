@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+import sys
+from typing import Any
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from agent.dem.loaders import load_text
+
+
+DELIMITERS = {"space": " ", "comma": ",", "semicolon": ";", "tab": "\t"}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the sniffing CSV/XYZ DEM loader against the former genfromtxt delimiter loop.")
+    parser.add_argument("--path", type=Path, help="Existing CSV/XYZ file. Synthetic XYZ files are written when omitted.")
+    parser.add_argument("--rows", type=int, default=800)
+    parser.add_argument("--columns", type=int, default=1000)
+    parser.add_argument("--delimiter", action="append", choices=sorted(DELIMITERS), help="Synthetic delimiter to run; repeat for several. Defaults to all.")
+    parser.add_argument("--output-json", type=Path)
+    args = parser.parse_args()
+
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.path:
+            cases = [("file", args.path)]
+        else:
+            cases = [
+                (name, write_synthetic_xyz(Path(tmp) / f"synthetic_{name}.csv", args.rows, args.columns, DELIMITERS[name]))
+                for name in args.delimiter or DELIMITERS
+            ]
+        for name, path in cases:
+            started = time.perf_counter()
+            grid = load_text(path)
+            sniffed_s = time.perf_counter() - started
+            started = time.perf_counter()
+            reference = genfromtxt_loop(path)
+            loop_s = time.perf_counter() - started
+            results.append(
+                {
+                    "case": name,
+                    "bytes": path.stat().st_size,
+                    "sniffed_s": sniffed_s,
+                    "genfromtxt_loop_s": loop_s,
+                    "speedup": loop_s / sniffed_s if sniffed_s else None,
+                    "layout": grid.metadata.get("text_layout"),
+                    "values_match": bool(reference is not None and np.array_equal(np.sort(grid.z[np.isfinite(grid.z)]), np.sort(reference))),
+                }
+            )
+
+    for result in results:
+        print(
+            f"{result['case']:>9}: sniffed {result['sniffed_s']:.2f} s, genfromtxt loop {result['genfromtxt_loop_s']:.2f} s, "
+            f"speedup {result['speedup']:.1f}x  values_match={result['values_match']}"
+        )
+    if args.output_json:
+        args.output_json.write_text(json.dumps({"results": results}, indent=2), encoding="utf-8")
+
+
+def write_synthetic_xyz(path: Path, rows: int, columns: int, delimiter: str) -> Path:
+    x, y = np.meshgrid(np.arange(columns) * 2.0, np.arange(rows) * 2.0)
+    z = np.round(-20.0 + 0.01 * x + 5.0 * np.sin(y / 40.0), 3)
+    header = delimiter.join(("x", "y", "z"))
+    np.savetxt(path, np.column_stack([x.ravel(), y.ravel(), z.ravel()]), fmt="%.3f", delimiter=delimiter, header=header, comments="")
+    return path
+
+
+def genfromtxt_loop(path: Path) -> np.ndarray | None:
+    """The previous load_text parse: retry np.genfromtxt per delimiter; returns the finite z samples."""
+    for delimiter in (None, ",", ";", "\t"):
+        try:
+            candidate = np.genfromtxt(path, delimiter=delimiter, comments="#", dtype=np.float64)
+            if candidate.size and np.isfinite(candidate).any():
+                values = candidate[:, -1] if candidate.ndim == 2 else candidate
+                return np.sort(values[np.isfinite(values)].astype(np.float32))
+        except Exception:
+            pass
+    return None
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+import sys
+from typing import Any
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from agent.dem.gridding import points_to_grid
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Micro-benchmark XYZ point gridding: per-point dict loop versus agent.dem.gridding.points_to_grid.")
+    parser.add_argument("--rows", type=int, default=1500)
+    parser.add_argument("--columns", type=int, default=2000)
+    parser.add_argument("--jitter", type=float, default=0.0, help="Coordinate jitter as a fraction of the grid spacing, applied to the vectorized run only.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-loop", action="store_true", help="Skip the slow per-point loop reference.")
+    parser.add_argument("--output-json", type=Path)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    x, y = np.meshgrid(np.arange(args.columns) * 2.0, np.arange(args.rows) * 2.0)
+    points = np.column_stack([x.ravel(), y.ravel(), rng.normal(size=x.size)])
+    rng.shuffle(points)
+
+    report: dict[str, Any] = {"rows": args.rows, "columns": args.columns, "points": int(points.shape[0]), "jitter": args.jitter}
+    jittered = points.copy()
+    if args.jitter:
+        jittered[:, :2] += rng.uniform(-args.jitter, args.jitter, size=(points.shape[0], 2)) * 2.0
+    # Jittered coordinates need an explicit tolerance; the default merges only floating-point noise.
+    tolerance = 2.0 * 2.0 * args.jitter if args.jitter else None
+    vector_s, (x_axis, y_axis, grid) = best_time(lambda: points_to_grid(jittered[:, 0], jittered[:, 1], jittered[:, 2], tolerance), args.repeat)
+    report["vectorized_s"] = vector_s
+    report["vectorized_shape"] = list(grid.shape)
+    print(f"vectorized points_to_grid: {vector_s:.3f} s for {points.shape[0]} points -> {grid.shape[0]} x {grid.shape[1]}")
+
+    if not args.skip_loop:
+        loop_s, (loop_x, loop_y, loop_grid) = best_time(lambda: loop_points_to_grid(points), 1)
+        report["loop_s"] = loop_s
+        report["speedup"] = loop_s / vector_s if vector_s else None
+        report["matches_loop"] = bool(np.array_equal(loop_grid, grid, equal_nan=True)) if not args.jitter else None
+        print(f"per-point loop:            {loop_s:.3f} s  speedup {report['speedup']:.1f}x  matches_loop={report['matches_loop']}")
+    if args.output_json:
+        args.output_json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+def best_time(run, repeat: int) -> tuple[float, Any]:
+    best = None
+    result = None
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return float(best), result
+
+
+def loop_points_to_grid(points: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """The per-point dict lookup previously used by xyz_to_grid and load_surface_deformation_grid."""
+    x_axis = np.unique(points[:, 0])
+    y_axis = np.unique(points[:, 1])
+    grid = np.full((y_axis.size, x_axis.size), np.nan, dtype=np.float64)
+    x_index = {float(value): index for index, value in enumerate(x_axis)}
+    y_index = {float(value): index for index, value in enumerate(y_axis)}
+    for x, y, value in points:
+        grid[y_index[float(y)], x_index[float(x)]] = value
+    return x_axis, y_axis, grid
+
+
+if __name__ == "__main__":
+    main()
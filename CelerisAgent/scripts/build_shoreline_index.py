@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from agent.shoreline.anchor import NATURAL_EARTH_COASTLINE, OSM_COASTLINE
+from agent.shoreline.packed_index import build_packed_shoreline_index
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Convert shoreline shapefiles into memory-mapped packed R-tree indexes for shoreline anchoring.")
+    parser.add_argument("sources", nargs="*", type=Path, help="Shapefiles to index; defaults to the OSM and Natural Earth coastlines.")
+    args = parser.parse_args()
+
+    sources = args.sources or [OSM_COASTLINE, NATURAL_EARTH_COASTLINE]
+    for source in sources:
+        if not source.exists():
+            print(f"skip {source}: not found")
+            continue
+        started = time.perf_counter()
+        meta = build_packed_shoreline_index(source)
+        meta["build_seconds"] = time.perf_counter() - started
+        print(json.dumps(meta, indent=2))
+
+
+if __name__ == "__main__":
+    main()
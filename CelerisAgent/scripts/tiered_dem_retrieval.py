@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -26,7 +27,10 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--center-description")
     parser.add_argument("--dataset", help="User-specified dataset/source hint for Tier 1 DAV retrieval.")
     parser.add_argument("--resolution-m", type=float)
+    parser.add_argument("--concurrent-probes", action="store_true", help="Run every tier's metadata probe at once (CELERIS_TIER_PROBE_MODE=concurrent).")
     args = parser.parse_args(argv)
+    if args.concurrent_probes:
+        os.environ["CELERIS_TIER_PROBE_MODE"] = "concurrent"
 
     dem_request: dict = {
         "location": args.location,
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+import tempfile
+from typing import Any
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from agent.dem.mosaic import load_mosaic_or_first
+from agent.dem.validation import validate
+
+UTM_CRS = "EPSG:32610"
+UTM_ORIGIN = (580_000.0, 4_180_000.0)
+UTM_CELL_M = 10.0
+GEOGRAPHIC_CELL_DEG = 0.0001
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Check GeoTIFF mosaicking of tiles in mixed CRSs, and the reporting of tiles that fail to read, on synthetic tiles."
+    )
+    parser.add_argument("--tile-px", type=int, default=200)
+    parser.add_argument("--output-json", type=Path)
+    args = parser.parse_args()
+
+    report: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        utm_a = write_utm_tile(root / "a_utm.tif", 0, args.tile_px)
+        utm_b = write_utm_tile(root / "b_utm.tif", args.tile_px, args.tile_px)
+        geographic = write_geographic_tile(root / "c_geographic.tif", args.tile_px)
+        options = {"max_cells": 10**9}
+
+        # One UTM tile and one geographic tile: 0.0001 deg is ~11 m north-south here, so UTM stays the lattice.
+        pair, _path = load_mosaic_or_first([utm_a, geographic], options)
+        report["utm_plus_geographic"] = check(pair, [utm_a.name], args.tile_px)
+        # Two UTM tiles and one geographic tile: the shared CRS wins regardless of pixel units.
+        trio, _path = load_mosaic_or_first([utm_a, utm_b, geographic], options)
+        report["two_utm_plus_geographic"] = check(trio, [utm_a.name, utm_b.name], args.tile_px)
+        # Two UTM tiles on one lattice where the second has a corrupt data block: half the mosaic must be reported missing.
+        corrupt = corrupt_first_block(write_utm_tile(root / "b_corrupt_utm.tif", args.tile_px, args.tile_px))
+        broken, _path = load_mosaic_or_first([utm_a, corrupt], options)
+        report["utm_plus_corrupt_utm"] = check_reported_failure(broken, [utm_a.name], [corrupt.name], args.tile_px, 0.5)
+
+    for name, result in report.items():
+        if result["outcome"] == "merged":
+            print(
+                f"{name}: merged; crs {result['crs']}, reference {result['reference_tile']}, reprojected {result['reprojected']}, "
+                f"UTM cells unchanged: {result['utm_cells_unchanged']}, warped cells {result['warped_cells']} ok: {result['warped_values_ok']}"
+            )
+        else:
+            print(
+                f"{name}: {'reported' if result['ok'] else 'NOT reported'} failure of {result['failed_tiles']}; "
+                f"warning {result['warning_code']}, missing fraction {result['missing_fraction']}, UTM cells unchanged: {result['utm_cells_unchanged']}"
+            )
+            for reason in result["reasons"]:
+                print(f"  {reason}")
+    if args.output_json:
+        args.output_json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if not all(result["ok"] for result in report.values()):
+        raise SystemExit("Mosaic check failed: a tile was merged wrongly or dropped without a MOSAIC_TILES_MISSING warning.")
+
+
+def check(grid: Any, utm_tiles: list[str], tile_px: int) -> dict[str, Any]:
+    """A correct mixed-CRS merge, or, where the warp itself fails, a reported failure of the geographic tile."""
+    if grid.metadata["mosaic"]["failed_tiles"]:
+        return check_reported_failure(grid, utm_tiles, ["c_geographic.tif"], tile_px, None)
+    mosaic = grid.metadata["mosaic"]
+    # The UTM tiles sit on the output lattice, so their cells must come through without resampling.
+    x_index = np.rint((grid.x0 - UTM_ORIGIN[0]) / UTM_CELL_M).astype(int)
+    y_index = np.rint((UTM_ORIGIN[1] - grid.y0) / UTM_CELL_M).astype(int)
+    unchanged = True
+    outside_utm = np.ones(grid.z.shape, dtype=bool)
+    for name in utm_tiles:
+        col_offset = 0 if name.startswith("a_") else tile_px
+        rows = slice(-y_index, -y_index + tile_px)
+        cols = slice(col_offset - x_index, col_offset - x_index + tile_px)
+        unchanged &= bool(np.array_equal(grid.z[rows, cols], utm_values(col_offset, tile_px)))
+        outside_utm[rows, cols] = False
+    # Everything else comes from the constant geographic tile through the warp.
+    warped = grid.z[outside_utm & np.isfinite(grid.z)]
+    warped_ok = bool(warped.size) and bool(np.allclose(warped, 5.0))
+    ok = grid.crs == UTM_CRS and mosaic["reprojected"] == ["c_geographic.tif"] and unchanged and warped_ok
+    return {
+        "ok": ok,
+        "outcome": "merged",
+        "crs": grid.crs,
+        "reference_tile": mosaic["reference_tile"],
+        "reprojected": mosaic["reprojected"],
+        "utm_cells_unchanged": unchanged,
+        "warped_cells": int(warped.size),
+        "warped_values_ok": warped_ok,
+        "skipped": mosaic["skipped"],
+        "shape": list(grid.z.shape),
+    }
+
+
+def check_reported_failure(
+    grid: Any,
+    utm_tiles: list[str],
+    failed_tiles: list[str],
+    tile_px: int,
+    expected_fraction: float | None,
+) -> dict[str, Any]:
+    """The loader must name the failed tiles in a `MOSAIC_TILES_MISSING` warning and keep the other tiles intact."""
+    failed = grid.metadata["mosaic"]["failed_tiles"] or {}
+    warnings = [item for item in validate(grid)["checks"] if item["code"] == "MOSAIC_TILES_MISSING"]
+    fraction = failed.get("missing_fraction")
+    unchanged = utm_cells_unchanged(grid, utm_tiles, tile_px)
+    reasons = [item["reason"] for item in grid.metadata["mosaic"]["skipped"] if item.get("failed")]
+    fraction_ok = bool(fraction) if expected_fraction is None else fraction is not None and abs(fraction - expected_fraction) < 1e-9
+    ok = (
+        failed.get("files") == failed_tiles
+        and len(warnings) == 1
+        and warnings[0]["level"] == "warning"
+        and all(name in warnings[0]["message"] for name in failed_tiles)
+        and fraction_ok
+        and unchanged
+    )
+    return {
+        "ok": ok,
+        "outcome": "reported_failure",
+        "failed_tiles": failed.get("files"),
+        "reasons": reasons,
+        "warning_code": warnings[0]["code"] if warnings else None,
+        "missing_fraction": fraction,
+        "expected_missing_fraction": expected_fraction,
+        "utm_cells_unchanged": unchanged,
+        "shape": list(grid.z.shape),
+    }
+
+
+def utm_cells_unchanged(grid: Any, utm_tiles: list[str], tile_px: int) -> bool:
+    x_index = int(np.rint((grid.x0 - UTM_ORIGIN[0]) / UTM_CELL_M))
+    y_index = int(np.rint((UTM_ORIGIN[1] - grid.y0) / UTM_CELL_M))
+    unchanged = True
+    for name in utm_tiles:
+        col_offset = 0 if name.startswith("a_") else tile_px
+        rows = slice(-y_index, -y_index + tile_px)
+        cols = slice(col_offset - x_index, col_offset - x_index + tile_px)
+        unchanged &= bool(np.array_equal(grid.z[rows, cols], utm_values(col_offset, tile_px)))
+    return unchanged
+
+
+def utm_values(col_offset: int, tile_px: int) -> np.ndarray:
+    rows, cols = np.mgrid[0:tile_px, col_offset : col_offset + tile_px]
+    return (-20.0 + 0.05 * rows + 0.03 * cols).astype(np.float32)
+
+
+def write_utm_tile(path: Path, col_offset: int, tile_px: int) -> Path:
+    from affine import Affine
+
+    transform = Affine(UTM_CELL_M, 0.0, UTM_ORIGIN[0] + col_offset * UTM_CELL_M, 0.0, -UTM_CELL_M, UTM_ORIGIN[1])
+    write_tile(path, utm_values(col_offset, tile_px), UTM_CRS, transform)
+    return path
+
+
+def write_geographic_tile(path: Path, tile_px: int) -> Path:
+    from affine import Affine
+    from rasterio.warp import transform as transform_points
+
+    lons, lats = transform_points(UTM_CRS, "EPSG:4326", [UTM_ORIGIN[0]], [UTM_ORIGIN[1]])
+    transform = Affine(GEOGRAPHIC_CELL_DEG, 0.0, lons[0], 0.0, -GEOGRAPHIC_CELL_DEG, lats[0])
+    write_tile(path, np.full((tile_px, tile_px), 5.0, dtype=np.float32), "EPSG:4326", transform)
+    return path
+
+
+def write_tile(path: Path, values: np.ndarray, crs: str, transform: Any) -> None:
+    import rasterio
+
+    profile = {
+        "driver": "GTiff",
+        "width": values.shape[1],
+        "height": values.shape[0],
+        "count": 1,
+        "dtype": "float32",
+        "crs": crs,
+        "transform": transform,
+        "nodata": -9999.0,
+        "compress": "deflate",
+    }
+    with rasterio.open(path, "w", **profile) as out:
+        out.write(values, 1)
+
+
+def corrupt_first_block(path: Path) -> Path:
+    """Overwrite the first compressed data block so the header still opens but reading band 1 fails."""
+    import rasterio
+
+    with rasterio.open(path) as ds:
+        offset = int(ds.get_tag_item("BLOCK_OFFSET_0_0", "TIFF", bidx=1))
+        size = int(ds.get_tag_item("BLOCK_SIZE_0_0", "TIFF", bidx=1))
+    with path.open("r+b") as out:
+        out.seek(offset)
+        out.write(b"\xff" * size)
+    return path
+
+
+if __name__ == "__main__":
+    main()
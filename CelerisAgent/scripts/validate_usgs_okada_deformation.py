@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import time
 from io import StringIO
 from pathlib import Path
 import sys
@@ -28,10 +29,18 @@ def main() -> None:
     parser.add_argument("--ffm-url", default=DEFAULT_FFM_URL)
     parser.add_argument("--surface-url", default=DEFAULT_SURFACE_URL)
     parser.add_argument("--output-json", type=Path)
+    parser.add_argument(
+        "--skip-dc3dwrapper",
+        action="store_true",
+        help="Do not compare the vectorized NumPy engine against the okada-wrapper dc3dwrapper reference.",
+    )
     args = parser.parse_args()
 
-    if not okada_available():
-        raise SystemExit("okada-wrapper is not installed. Install with: python -m pip install okada-wrapper --no-deps")
+    if not args.skip_dc3dwrapper and not okada_available():
+        raise SystemExit(
+            "okada-wrapper is required for the dc3dwrapper reference comparison. Install with: "
+            "python -m pip install okada-wrapper --no-deps, or pass --skip-dc3dwrapper."
+        )
 
     ffm = requests.get(args.ffm_url, timeout=60)
     ffm.raise_for_status()
@@ -41,7 +50,9 @@ def main() -> None:
     surface.raise_for_status()
     lon, lat, vertical = load_surface_deformation(surface.text)
     lon_mesh, lat_mesh = np.meshgrid(lon, lat, indexing="xy")
+    started = time.perf_counter()
     computed, okada_summary = okada_finite_fault_surface(features, lon_mesh, lat_mesh)
+    okada_summary["elapsed_s"] = time.perf_counter() - started
     metrics = deformation_metrics(computed, vertical)
     result: dict[str, Any] = {
         "event_id": args.event_id,
@@ -62,6 +73,15 @@ def main() -> None:
         },
         "metrics": metrics,
     }
+    if not args.skip_dc3dwrapper:
+        started = time.perf_counter()
+        reference, reference_summary = okada_finite_fault_surface(features, lon_mesh, lat_mesh, engine="okada_wrapper")
+        reference_summary["elapsed_s"] = time.perf_counter() - started
+        result["dc3dwrapper_reference"] = {
+            "okada": reference_summary,
+            "max_abs_difference_m": float(np.nanmax(np.abs(computed - reference))),
+            "speedup": reference_summary["elapsed_s"] / max(okada_summary["elapsed_s"], 1e-12),
+        }
     text = json.dumps(result, indent=2)
     print(text)
     if args.output_json:
@@ -1,57 +1,83 @@
 // File_loader.js
 
+// Added by Codex: Convert a row-major float32 grid (bathy.f32 / etaInitCond.f32 from CelerisAgent) into the [x][y] layout used by the text loaders.
+function grid2DFromFloat32(values, calc_constants, label) {
+    if (values.length !== calc_constants.WIDTH * calc_constants.HEIGHT) {
+        console.error(`${label} float32 grid has ${values.length} values; expected ${calc_constants.WIDTH} x ${calc_constants.HEIGHT}.`);
+        return null;
+    }
+    const grid2D = Array.from({ length: calc_constants.WIDTH }, () => Array(calc_constants.HEIGHT));
+    for (let y = 0; y < calc_constants.HEIGHT; y++) {
+        const rowOffset = y * calc_constants.WIDTH;
+        for (let x = 0; x < calc_constants.WIDTH; x++) {
+            grid2D[x][y] = values[rowOffset + x];
+        }
+    }
+    return grid2D;
+}
+
 // load depth file
 export async function loadDepthSurface(bathymetryContent, calc_constants) {
     let response;
     let lines;
     let filePath;
-    // Try to parse the uploaded content, if fails, then load server side file
-    try {
-
-        lines = bathymetryContent.split('\n');
-
-        console.log("Bathy data loaded successfully from the uploaded file.");
-
-    } catch (error) {
-        console.log("Loading server side example bathytopo file");
-        filePath = calc_constants.exampleDirs[calc_constants.run_example] + 'bathy.txt';
-        try {
-            response = await fetch(filePath);
-        } catch (error) {
-            console.error("Could not find depth file at " + filePath);
+    // Added by Codex: Binary float32 bathymetry skips text parsing; edges are still flattened below.
+    let bathy2D = null;
+    if (bathymetryContent instanceof Float32Array) {
+        bathy2D = grid2DFromFloat32(bathymetryContent, calc_constants, "Bathytopo");
+        if (!bathy2D) {
             return null;
         }
+        console.log("Bathy data loaded successfully from the float32 grid.");
+    } else {
+        // Try to parse the uploaded content, if fails, then load server side file
+        try {
 
-        if (!response.ok) {
-            console.error("Error fetching depth file:", response.statusText);
-            return null;
-        }
+            lines = bathymetryContent.split('\n');
 
-        const fileContents = await response.text();
+            console.log("Bathy data loaded successfully from the uploaded file.");
 
-        lines = fileContents.split('\n');
-        console.log("Server side bathytopo data loaded successfully.");
-    }
+        } catch (error) {
+            console.log("Loading server side example bathytopo file");
+            filePath = calc_constants.exampleDirs[calc_constants.run_example] + 'bathy.txt';
+            try {
+                response = await fetch(filePath);
+            } catch (error) {
+                console.error("Could not find depth file at " + filePath);
+                return null;
+            }
 
-    const bathy2D = Array.from({ length: calc_constants.WIDTH }, () => Array(calc_constants.HEIGHT));
+            if (!response.ok) {
+                console.error("Error fetching depth file:", response.statusText);
+                return null;
+            }
 
-    // Parse the depth data.
-    for (let y = 0; y < calc_constants.HEIGHT; y++) {
-        // Split each line by spaces or tabs.
-        const depthValues = lines[y].split(/\s+/).filter(Boolean);
+            const fileContents = await response.text();
 
-        if (depthValues.length !== calc_constants.WIDTH) {
-            console.error("Bathytopo file at " + filePath + " is not in the correct format.");
-            return null;
+            lines = fileContents.split('\n');
+            console.log("Server side bathytopo data loaded successfully.");
         }
 
-        for (let x = 0; x < calc_constants.WIDTH; x++) {
-            const parsedValue = parseFloat(depthValues[x]);
-            if (isNaN(parsedValue)) {
-                console.error(`Could not parse bathytopo value at [${x}, ${y}] in bathytopo file at ${filePath}`);
+        bathy2D = Array.from({ length: calc_constants.WIDTH }, () => Array(calc_constants.HEIGHT));
+
+        // Parse the depth data.
+        for (let y = 0; y < calc_constants.HEIGHT; y++) {
+            // Split each line by spaces or tabs.
+            const depthValues = lines[y].split(/\s+/).filter(Boolean);
+
+            if (depthValues.length !== calc_constants.WIDTH) {
+                console.error("Bathytopo file at " + filePath + " is not in the correct format.");
                 return null;
             }
-            bathy2D[x][y] = parsedValue;
+
+            for (let x = 0; x < calc_constants.WIDTH; x++) {
+                const parsedValue = parseFloat(depthValues[x]);
+                if (isNaN(parsedValue)) {
+                    console.error(`Could not parse bathytopo value at [${x}, ${y}] in bathytopo file at ${filePath}`);
+                    return null;
+                }
+                bathy2D[x][y] = parsedValue;
+            }
         }
     }
 
@@ -87,6 +113,14 @@ export async function loadInitCondSurface(InitCondContent, calc_constants) {
     let response;
     let lines;
     let filePath;
+    // Added by Codex: Binary float32 initial free surface from CelerisAgent skips text parsing.
+    if (InitCondContent instanceof Float32Array) {
+        const InitCond2D = grid2DFromFloat32(InitCondContent, calc_constants, "Initial Condition");
+        if (InitCond2D) {
+            console.log("Initial Condition data loaded successfully from the float32 grid.");
+        }
+        return InitCond2D;
+    }
     // Try to parse the uploaded content, if fails, then load server side file
     try {
 
@@ -59,6 +59,8 @@ let txAnimation = null;
 let txOverlayMap = null;
 let txGoogleMap = null;
 let txSatMap = null;
+// Added by Codex: Full-resolution overlay.jpg still downloading behind a CelerisAgent overlay preview.
+let pendingFullOverlay = null;
 let txDraw = null;
 let context = null;
 let adapter = null;
@@ -143,6 +145,65 @@ async function fetchAgentCaseBlob(url, label) {
     return response.blob();
 }
 
+// Added by Codex: Fetch CelerisAgent raw little-endian float32 grids (bathy.f32, etaInitCond.f32).
+// When the .f32.json header is advertised, the byte length must match its rows x columns.
+async function fetchAgentCaseFloat32(url, label, headerUrl = null) {
+    const response = await fetch(url, { mode: "cors" });
+    if (!response.ok) {
+        throw new Error(`Failed to fetch ${label}: HTTP ${response.status}`);
+    }
+    const buffer = await response.arrayBuffer();
+    if (buffer.byteLength % 4 !== 0) {
+        throw new Error(`${label} is not a float32 grid (${buffer.byteLength} bytes).`);
+    }
+    if (headerUrl) {
+        const headerResponse = await fetch(headerUrl, { mode: "cors" });
+        if (!headerResponse.ok) {
+            throw new Error(`Failed to fetch ${label} header: HTTP ${headerResponse.status}`);
+        }
+        const header = await headerResponse.json();
+        const expectedBytes = Number(header.rows) * Number(header.columns) * 4;
+        if (buffer.byteLength !== expectedBytes) {
+            throw new Error(`${label} has ${buffer.byteLength} bytes; its header expects ${expectedBytes}.`);
+        }
+    }
+    return new Float32Array(buffer);
+}
+
+// Added by Codex: Swap the overlay preview texture for the full-resolution overlay once it has downloaded.
+// The frame loop rebinds txSatMap when OverlayUpdate is raised; the overlay scale/offset do not depend on resolution.
+async function swapInFullOverlay(fullOverlayPromise, overlayDevice) {
+    const fullOverlayBlob = await fullOverlayPromise;
+    if (!fullOverlayBlob || device !== overlayDevice) {
+        return;
+    }
+    try {
+        const satimData = await loadUserImage(fullOverlayBlob);
+        if (device !== overlayDevice) {
+            return;  // a new simulation was started while the overlay was downloading
+        }
+        txSatMap = create_2D_Texture(device, satimData.width, satimData.height, allTextures);
+        copyImageBitmapToTexture(device, satimData, txSatMap);
+        calc_constants.IsSatMapLoaded = 1;
+        calc_constants.OverlayUpdate = 1;
+        console.log('Full-resolution overlay image loaded, dimensions:', satimData.width, 'x', satimData.height);
+    } catch (error) {
+        console.warn('Unable to load the full-resolution overlay; keeping the preview.', error);
+    }
+}
+
+// Added by Codex: A missing, stale, or truncated float32 companion falls back to the text grid.
+async function fetchAgentCaseFloat32OrFallback(url, headerUrl, label, fallback) {
+    if (url) {
+        try {
+            return await fetchAgentCaseFloat32(url, label, headerUrl);
+        } catch (error) {
+            console.warn(`${label} could not be used; falling back to the text grid.`, error);
+        }
+    }
+    return fallback();
+}
+
 function resolveAgentCaseFileUrl(caseUrl, fileUrl) {
     if (!fileUrl || typeof fileUrl !== "string") {
         throw new Error("Agent case manifest is missing a required file URL.");
@@ -171,13 +232,39 @@ async function loadAgentCaseFromUrl() {
         const wavesUrl = resolveAgentCaseFileUrl(caseUrl, files.waves);
         const overlayUrl = files.overlay ? resolveAgentCaseFileUrl(caseUrl, files.overlay) : null;
         const initialEtaUrl = files.initial_eta ? resolveAgentCaseFileUrl(caseUrl, files.initial_eta) : null;
+        // Added by Codex: Prefer the compact float32 grids when the agent case provides them.
+        const bathyF32Url = files.bathy_f32 ? resolveAgentCaseFileUrl(caseUrl, files.bathy_f32) : null;
+        const initialEtaF32Url = files.initial_eta_f32 ? resolveAgentCaseFileUrl(caseUrl, files.initial_eta_f32) : null;
+        const bathyF32HeaderUrl = files.bathy_f32_header ? resolveAgentCaseFileUrl(caseUrl, files.bathy_f32_header) : null;
+        const initialEtaF32HeaderUrl = files.initial_eta_f32_header ? resolveAgentCaseFileUrl(caseUrl, files.initial_eta_f32_header) : null;
         const [configContent, bathymetryContent, waveContent] = await Promise.all([
             fetchAgentCaseText(configUrl, "config.json"),
-            fetchAgentCaseText(bathyUrl, "bathy.txt"),
+            fetchAgentCaseFloat32OrFallback(bathyF32Url, bathyF32HeaderUrl, "bathy.f32", () => fetchAgentCaseText(bathyUrl, "bathy.txt")),
             fetchAgentCaseText(wavesUrl, "waves.txt"),
         ]);
-        const overlayBlob = overlayUrl ? await fetchAgentCaseBlob(overlayUrl, "overlay.jpg") : undefined;
-        const initialEtaBlob = initialEtaUrl ? await fetchAgentCaseBlob(initialEtaUrl, "etaInitCond.txt") : undefined;
+        // Added by Codex: Show the small overlay preview first and let overlay.jpg download in the background.
+        const overlayPreviewUrl = files.overlay_preview ? resolveAgentCaseFileUrl(caseUrl, files.overlay_preview) : null;
+        let overlayBlob = undefined;
+        if (overlayUrl && overlayPreviewUrl) {
+            try {
+                overlayBlob = await fetchAgentCaseBlob(overlayPreviewUrl, "overlay_preview.jpg");
+                pendingFullOverlay = fetchAgentCaseBlob(overlayUrl, "overlay.jpg").catch(error => {
+                    console.warn('Unable to fetch the full-resolution overlay; keeping the preview.', error);
+                    return null;
+                });
+            } catch (error) {
+                console.warn('Unable to fetch the overlay preview; loading overlay.jpg instead.', error);
+            }
+        }
+        if (!overlayBlob && overlayUrl) {
+            overlayBlob = await fetchAgentCaseBlob(overlayUrl, "overlay.jpg");
+        }
+        const initialEtaBlob = await fetchAgentCaseFloat32OrFallback(
+            initialEtaF32Url,
+            initialEtaF32HeaderUrl,
+            "etaInitCond.f32",
+            () => (initialEtaUrl ? fetchAgentCaseBlob(initialEtaUrl, "etaInitCond.txt") : undefined),
+        );
 
         calc_constants.run_example = -1;
         postAgentCaseStatus("celeris:case-loaded", { caseUrl, manifest });
@@ -233,6 +320,9 @@ async function initializeWebGPUApp(configContent, bathymetryContent, waveContent
     adapter = null;
     context = null;
     calc_constants.GoogleMapOverlay = 0; // not all configs have this declared, so can create issue when switching back and forth
+    // Added by Codex: Claim the full-resolution overlay that goes with this run's preview, if any.
+    const fullOverlayPromise = pendingFullOverlay;
+    pendingFullOverlay = null;
     calc_constants.render_step = 1; // for new sim, force render step back to zero
 
     // Request an adapter. The adapter represents the GPU device, or a software fallback.
@@ -608,7 +698,8 @@ async function initializeWebGPUApp(configContent, bathymetryContent, waveContent
         calc_constants.loadetaIC = 1;
         var etaICContent = null;
         try { 
-            etaICContent = await etaInitialConditionFile.text()
+            // Added by Codex: Float32 grids from the agent case are passed to the loader as-is.
+            etaICContent = etaInitialConditionFile instanceof Float32Array ? etaInitialConditionFile : await etaInitialConditionFile.text()
         } 
         catch {
             etaICContent = null;
@@ -707,6 +798,9 @@ async function initializeWebGPUApp(configContent, bathymetryContent, waveContent
         txOverlayMap = txSatMap;
         calc_constants.IsSatMapLoaded = 1; 
         calc_constants.IsOverlayMapLoaded = 1;
+        if (fullOverlayPromise) {
+            swapInFullOverlay(fullOverlayPromise, device);
+        }
     }
 
     // load texture images into textures